@@ -18,6 +18,13 @@ OPENWEATHER_API_KEY = os.getenv("OPENWEATHER_API_KEY")
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
 GOOGLE_MAPS_API_KEY = os.getenv("GOOGLE_MAPS_API_KEY")
 
+# One pooled client per warm instance, reused across invocations so repeat
+# calls skip the TCP/TLS handshake
+http_client = httpx.AsyncClient(
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+)
+
 @app.get("/api/location/weather")
 async def get_weather(user_input: str):
     """Get current weather for a location"""
@@ -33,13 +40,12 @@ async def get_weather(user_input: str):
             # Treat as city name or zip code
             url = f"https://api.openweathermap.org/data/2.5/weather?q={user_input}&appid={OPENWEATHER_API_KEY}"
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            if response.status_code == 404:
-                raise HTTPException(status_code=400, detail=f"Location '{user_input}' not found")
-            response.raise_for_status()
-            return response.json()
-            
+        response = await http_client.get(url)
+        if response.status_code == 404:
+            raise HTTPException(status_code=400, detail=f"Location '{user_input}' not found")
+        response.raise_for_status()
+        return response.json()
+        
     except httpx.HTTPError:
         raise HTTPException(status_code=500, detail="Failed to fetch weather data")
 
@@ -52,39 +58,38 @@ async def get_forecast(city: str):
     try:
         url = f"https://api.openweathermap.org/data/2.5/forecast?q={city}&appid={OPENWEATHER_API_KEY}"
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            if response.status_code == 404:
-                raise HTTPException(status_code=400, detail=f"City '{city}' not found")
-            response.raise_for_status()
-            data = response.json()
-            
-            # Transform to match expected format
-            forecast_data = {
-                "location": {
-                    "city": data["city"]["name"],
-                    "country": data["city"]["country"],
-                    "latitude": data["city"]["coord"]["lat"],
-                    "longitude": data["city"]["coord"]["lon"]
-                },
-                "forecast": []
+        response = await http_client.get(url)
+        if response.status_code == 404:
+            raise HTTPException(status_code=400, detail=f"City '{city}' not found")
+        response.raise_for_status()
+        data = response.json()
+        
+        # Transform to match expected format
+        forecast_data = {
+            "location": {
+                "city": data["city"]["name"],
+                "country": data["city"]["country"],
+                "latitude": data["city"]["coord"]["lat"],
+                "longitude": data["city"]["coord"]["lon"]
+            },
+            "forecast": []
+        }
+        
+        for item in data["list"]:
+            forecast_item = {
+                "forecast_date": item["dt_txt"].split(" ")[0],
+                "forecast_hour": int(item["dt_txt"].split(" ")[1].split(":")[0]),
+                "temp_c": round(item["main"]["temp"] - 273.15, 1),
+                "temp_f": round((item["main"]["temp"] - 273.15) * 9/5 + 32, 1),
+                "condition": item["weather"][0]["main"],
+                "condition_desc": item["weather"][0]["description"],
+                "icon": item["weather"][0]["icon"],
+                "icon_url": f"https://openweathermap.org/img/w/{item['weather'][0]['icon']}.png"
             }
-            
-            for item in data["list"]:
-                forecast_item = {
-                    "forecast_date": item["dt_txt"].split(" ")[0],
-                    "forecast_hour": int(item["dt_txt"].split(" ")[1].split(":")[0]),
-                    "temp_c": round(item["main"]["temp"] - 273.15, 1),
-                    "temp_f": round((item["main"]["temp"] - 273.15) * 9/5 + 32, 1),
-                    "condition": item["weather"][0]["main"],
-                    "condition_desc": item["weather"][0]["description"],
-                    "icon": item["weather"][0]["icon"],
-                    "icon_url": f"https://openweathermap.org/img/w/{item['weather'][0]['icon']}.png"
-                }
-                forecast_data["forecast"].append(forecast_item)
-            
-            return forecast_data
-            
+            forecast_data["forecast"].append(forecast_item)
+        
+        return forecast_data
+        
     except httpx.HTTPError:
         raise HTTPException(status_code=500, detail="Failed to fetch forecast data")
 
@@ -97,31 +102,30 @@ async def get_hourly_weather(city: str):
     try:
         url = f"https://api.openweathermap.org/data/2.5/forecast?q={city}&appid={OPENWEATHER_API_KEY}"
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            if response.status_code == 404:
-                raise HTTPException(status_code=400, detail=f"City '{city}' not found")
-            response.raise_for_status()
-            data = response.json()
-            
-            hourly_data = {
-                "location": data["city"]["name"],
-                "hourly_forecast": []
+        response = await http_client.get(url)
+        if response.status_code == 404:
+            raise HTTPException(status_code=400, detail=f"City '{city}' not found")
+        response.raise_for_status()
+        data = response.json()
+        
+        hourly_data = {
+            "location": data["city"]["name"],
+            "hourly_forecast": []
+        }
+        
+        for item in data["list"][:24]:  # Next 24 hours
+            hourly_item = {
+                "hour": item["dt_txt"].split(" ")[1][:5],
+                "timestamp": item["dt"],
+                "temperature": round(item["main"]["temp"] - 273.15, 1),
+                "condition": item["weather"][0]["main"],
+                "description": item["weather"][0]["description"],
+                "icon": item["weather"][0]["icon"]
             }
-            
-            for item in data["list"][:24]:  # Next 24 hours
-                hourly_item = {
-                    "hour": item["dt_txt"].split(" ")[1][:5],
-                    "timestamp": item["dt"],
-                    "temperature": round(item["main"]["temp"] - 273.15, 1),
-                    "condition": item["weather"][0]["main"],
-                    "description": item["weather"][0]["description"],
-                    "icon": item["weather"][0]["icon"]
-                }
-                hourly_data["hourly_forecast"].append(hourly_item)
-            
-            return hourly_data
-            
+            hourly_data["hourly_forecast"].append(hourly_item)
+        
+        return hourly_data
+        
     except httpx.HTTPError:
         raise HTTPException(status_code=500, detail="Failed to fetch hourly data")
 
@@ -140,37 +144,36 @@ async def get_youtube_videos(city: str):
         
         all_videos = []
         
-        async with httpx.AsyncClient() as client:
-            for category, query in categories.items():
-                url = "https://www.googleapis.com/youtube/v3/search"
-                params = {
-                    "part": "snippet",
-                    "q": query,
-                    "type": "video",
-                    "maxResults": 1,
-                    "key": YOUTUBE_API_KEY,
-                    "order": "relevance"
-                }
+        for category, query in categories.items():
+            url = "https://www.googleapis.com/youtube/v3/search"
+            params = {
+                "part": "snippet",
+                "q": query,
+                "type": "video",
+                "maxResults": 1,
+                "key": YOUTUBE_API_KEY,
+                "order": "relevance"
+            }
+            
+            try:
+                response = await http_client.get(url, params=params)
+                response.raise_for_status()
+                data = response.json()
                 
-                try:
-                    response = await client.get(url, params=params)
-                    response.raise_for_status()
-                    data = response.json()
-                    
-                    for item in data.get("items", []):
-                        video_id = item["id"]["videoId"]
-                        video = {
-                            "videoId": video_id,
-                            "title": item["snippet"]["title"],
-                            "description": item["snippet"]["description"],
-                            "thumbnail": item["snippet"]["thumbnails"]["high"]["url"],
-                            "embed_url": f"https://www.youtube.com/embed/{video_id}",
-                            "watch_url": f"https://www.youtube.com/watch?v={video_id}",
-                            "category": category
-                        }
-                        all_videos.append(video)
-                except:
-                    continue  # Skip failed requests
+                for item in data.get("items", []):
+                    video_id = item["id"]["videoId"]
+                    video = {
+                        "videoId": video_id,
+                        "title": item["snippet"]["title"],
+                        "description": item["snippet"]["description"],
+                        "thumbnail": item["snippet"]["thumbnails"]["high"]["url"],
+                        "embed_url": f"https://www.youtube.com/embed/{video_id}",
+                        "watch_url": f"https://www.youtube.com/watch?v={video_id}",
+                        "category": category
+                    }
+                    all_videos.append(video)
+            except:
+                continue  # Skip failed requests
         
         return all_videos
         
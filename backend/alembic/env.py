@@ -9,11 +9,13 @@ from alembic import context
 # 프로젝트 루트 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.core.database import DATABASE_URL, Base
+from app.core.config import get_database_url
+from app.core.database import Base
 from app.models.models import (  # 모델 import
     SearchLocation,
     WeatherForecast,
     WeatherHistory,
+    WeatherHistoryRaw,
 )
 
 # Alembic Config 객체 가져오기
@@ -28,7 +30,7 @@ target_metadata = Base.metadata
 
 
 def get_url():
-    return DATABASE_URL
+    return get_database_url()
 
 
 def run_migrations_offline() -> None:
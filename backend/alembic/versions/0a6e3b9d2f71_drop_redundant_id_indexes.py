@@ -0,0 +1,31 @@
+"""drop ix_*_id indexes duplicating the primary keys
+
+Revision ID: 0a6e3b9d2f71
+Revises: f8c25e7a4d10
+Create Date: 2026-10-15 12:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0a6e3b9d2f71"
+down_revision: Union[str, None] = "f8c25e7a4d10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("search_locations", "weather_history", "weather_forecast")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.drop_index(op.f(f"ix_{table}_id"), table_name=table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.create_index(op.f(f"ix_{table}_id"), table, ["id"], unique=False)
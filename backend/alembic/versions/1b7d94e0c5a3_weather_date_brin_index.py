@@ -0,0 +1,38 @@
+"""BRIN index on weather_history.weather_date (Postgres only)
+
+Revision ID: 1b7d94e0c5a3
+Revises: 0a6e3b9d2f71
+Create Date: 2026-10-15 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "1b7d94e0c5a3"
+down_revision: Union[str, None] = "0a6e3b9d2f71"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.create_index(
+        "ix_weather_date_brin",
+        "weather_history",
+        ["weather_date"],
+        unique=False,
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("ix_weather_date_brin", table_name="weather_history")
@@ -0,0 +1,43 @@
+"""derive weather_history.temp_f from temp_c as a generated column
+
+Revision ID: 2c8f1a6e7b94
+Revises: 1b7d94e0c5a3
+Create Date: 2026-10-15 13:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2c8f1a6e7b94"
+down_revision: Union[str, None] = "1b7d94e0c5a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("weather_history") as batch_op:
+        batch_op.drop_column("temp_f")
+        batch_op.add_column(
+            sa.Column(
+                "temp_f",
+                sa.Float(),
+                sa.Computed("temp_c * 9.0 / 5.0 + 32.0", persisted=True),
+                nullable=False,
+            )
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("weather_history") as batch_op:
+        batch_op.drop_column("temp_f")
+        batch_op.add_column(sa.Column("temp_f", sa.Float(), nullable=True))
+    op.execute("UPDATE weather_history SET temp_f = temp_c * 9.0 / 5.0 + 32.0")
+    with op.batch_alter_table("weather_history") as batch_op:
+        batch_op.alter_column("temp_f", existing_type=sa.Float(), nullable=False)
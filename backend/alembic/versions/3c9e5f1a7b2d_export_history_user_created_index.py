@@ -0,0 +1,67 @@
+"""export_history user_id, server-side created_at and user/created_at index
+
+Revision ID: 3c9e5f1a7b2d
+Revises: a212aa68c627
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c9e5f1a7b2d"
+down_revision: Union[str, None] = "a212aa68c627"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _export_history_columns() -> Union[set, None]:
+    # export_history is created by the app (create_all), so it may not exist yet
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("export_history"):
+        return None
+    return {c["name"] for c in inspector.get_columns("export_history")}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    columns = _export_history_columns()
+    if columns is None:
+        return
+    if "user_id" not in columns:
+        op.add_column(
+            "export_history", sa.Column("user_id", sa.Integer(), nullable=True)
+        )
+    op.alter_column(
+        "export_history",
+        "created_at",
+        type_=sa.DateTime(timezone=True),
+        server_default=sa.text("now()"),
+        existing_nullable=False,
+    )
+    op.create_index(
+        "ix_export_user_created",
+        "export_history",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    columns = _export_history_columns()
+    if columns is None:
+        return
+    op.drop_index("ix_export_user_created", table_name="export_history")
+    op.alter_column(
+        "export_history",
+        "created_at",
+        type_=sa.DateTime(),
+        server_default=None,
+        existing_nullable=False,
+    )
+    op.drop_column("export_history", "user_id")
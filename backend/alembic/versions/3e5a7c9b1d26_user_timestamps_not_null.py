@@ -0,0 +1,74 @@
+"""make users/user_locations timestamps NOT NULL timestamptz
+
+Revision ID: 3e5a7c9b1d26
+Revises: 2c8f1a6e7b94
+Create Date: 2026-10-15 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3e5a7c9b1d26"
+down_revision: Union[str, None] = "2c8f1a6e7b94"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Both tables are created by the app (create_all), not by earlier revisions
+TIMESTAMP_COLUMNS = {
+    "users": ["created_at", "updated_at"],
+    "user_locations": ["created_at"],
+}
+
+
+def _columns(table: str) -> dict:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return {}
+    return {column["name"]: column for column in inspector.get_columns(table)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+    for table, names in TIMESTAMP_COLUMNS.items():
+        existing = _columns(table)
+        names = [name for name in names if name in existing]
+        if not names:
+            continue
+        for name in names:
+            op.execute(
+                f"UPDATE {table} SET {name} = CURRENT_TIMESTAMP WHERE {name} IS NULL"
+            )
+        with op.batch_alter_table(table) as batch_op:
+            for name in names:
+                batch_op.alter_column(
+                    name,
+                    type_=sa.DateTime(timezone=True),
+                    existing_type=existing[name]["type"],
+                    nullable=False,
+                    postgresql_using=(
+                        f"{name} AT TIME ZONE 'UTC'"
+                        if is_postgres
+                        and not getattr(existing[name]["type"], "timezone", False)
+                        else None
+                    ),
+                )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, names in TIMESTAMP_COLUMNS.items():
+        existing = _columns(table)
+        names = [name for name in names if name in existing]
+        if not names:
+            continue
+        with op.batch_alter_table(table) as batch_op:
+            for name in names:
+                batch_op.alter_column(
+                    name, existing_type=existing[name]["type"], nullable=True
+                )
@@ -0,0 +1,53 @@
+"""narrow bounded weather_history readings to smallint / numeric(3,1)
+
+Revision ID: 4f0b2d8e6a37
+Revises: 3e5a7c9b1d26
+Create Date: 2026-10-15 14:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4f0b2d8e6a37"
+down_revision: Union[str, None] = "3e5a7c9b1d26"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# column -> (old type, new type, Postgres cast)
+NARROWED = {
+    "humidity": (sa.Float(), sa.SmallInteger(), "round(humidity)::smallint"),
+    "wind_deg": (sa.Float(), sa.SmallInteger(), "round(wind_deg)::smallint"),
+    "pressure": (sa.Float(), sa.SmallInteger(), "round(pressure)::smallint"),
+    "uvi": (sa.Float(), sa.Numeric(3, 1), "round(uvi::numeric, 1)"),
+    "weather_code": (sa.Integer(), sa.SmallInteger(), "weather_code::smallint"),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("weather_history") as batch_op:
+        for name, (old_type, new_type, cast) in NARROWED.items():
+            batch_op.alter_column(
+                name,
+                type_=new_type,
+                existing_type=old_type,
+                existing_nullable=True,
+                postgresql_using=cast,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("weather_history") as batch_op:
+        for name, (old_type, new_type, _) in NARROWED.items():
+            batch_op.alter_column(
+                name,
+                type_=old_type,
+                existing_type=new_type,
+                existing_nullable=True,
+            )
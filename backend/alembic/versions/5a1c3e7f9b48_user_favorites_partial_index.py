@@ -0,0 +1,45 @@
+"""partial index on user_locations(user_id) WHERE is_favorite
+
+Revision ID: 5a1c3e7f9b48
+Revises: 4f0b2d8e6a37
+Create Date: 2026-10-15 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5a1c3e7f9b48"
+down_revision: Union[str, None] = "4f0b2d8e6a37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_user_locations() -> bool:
+    # user_locations is created by the app (create_all)
+    return sa.inspect(op.get_bind()).has_table("user_locations")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not _has_user_locations():
+        return
+    op.create_index(
+        "ix_user_favorites",
+        "user_locations",
+        ["user_id"],
+        unique=False,
+        postgresql_where=sa.text("is_favorite"),
+        sqlite_where=sa.text("is_favorite"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not _has_user_locations():
+        return
+    op.drop_index("ix_user_favorites", table_name="user_locations")
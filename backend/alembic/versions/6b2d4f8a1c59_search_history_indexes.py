@@ -0,0 +1,55 @@
+"""(user_id, searched_at) and searched_at indexes on search_history
+
+Revision ID: 6b2d4f8a1c59
+Revises: 5a1c3e7f9b48
+Create Date: 2026-10-15 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6b2d4f8a1c59"
+down_revision: Union[str, None] = "5a1c3e7f9b48"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_search_history() -> bool:
+    # search_history is created by the app (create_all)
+    return sa.inspect(op.get_bind()).has_table("search_history")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not _has_search_history():
+        return
+    # The composite index's user_id prefix serves plain user_id lookups
+    op.drop_index("ix_search_history_user_id", table_name="search_history")
+    op.create_index(
+        "ix_search_history_user_searched",
+        "search_history",
+        ["user_id", "searched_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_search_history_searched_at",
+        "search_history",
+        ["searched_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not _has_search_history():
+        return
+    op.drop_index("ix_search_history_searched_at", table_name="search_history")
+    op.drop_index("ix_search_history_user_searched", table_name="search_history")
+    op.create_index(
+        "ix_search_history_user_id", "search_history", ["user_id"], unique=False
+    )
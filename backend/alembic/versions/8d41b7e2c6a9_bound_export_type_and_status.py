@@ -0,0 +1,74 @@
+"""bound export_history.export_type/status to String(16) with CHECK constraints
+
+Revision ID: 8d41b7e2c6a9
+Revises: 3c9e5f1a7b2d
+Create Date: 2026-10-15 09:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d41b7e2c6a9"
+down_revision: Union[str, None] = "3c9e5f1a7b2d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_export_history() -> bool:
+    # export_history is created by the app (create_all), so it may not exist yet
+    return sa.inspect(op.get_bind()).has_table("export_history")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not _has_export_history():
+        return
+    op.alter_column(
+        "export_history",
+        "export_type",
+        type_=sa.String(16),
+        existing_type=sa.String(),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        "export_history",
+        "status",
+        type_=sa.String(16),
+        existing_type=sa.String(),
+        existing_nullable=False,
+    )
+    op.create_check_constraint(
+        "ck_export_type", "export_history", "export_type IN ('csv', 'json', 'pdf')"
+    )
+    op.create_check_constraint(
+        "ck_export_status",
+        "export_history",
+        "status IN ('pending', 'success', 'failed')",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not _has_export_history():
+        return
+    op.drop_constraint("ck_export_status", "export_history", type_="check")
+    op.drop_constraint("ck_export_type", "export_history", type_="check")
+    op.alter_column(
+        "export_history",
+        "status",
+        type_=sa.String(),
+        existing_type=sa.String(16),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        "export_history",
+        "export_type",
+        type_=sa.String(),
+        existing_type=sa.String(16),
+        existing_nullable=False,
+    )
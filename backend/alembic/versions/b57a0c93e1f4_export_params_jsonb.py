@@ -0,0 +1,64 @@
+"""store export_history.export_params as JSONB with a GIN index
+
+Revision ID: b57a0c93e1f4
+Revises: 8d41b7e2c6a9
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b57a0c93e1f4"
+down_revision: Union[str, None] = "8d41b7e2c6a9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _should_run() -> bool:
+    # JSONB is Postgres-only; export_history is created by the app (create_all)
+    bind = op.get_bind()
+    return bind.dialect.name == "postgresql" and sa.inspect(bind).has_table(
+        "export_history"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not _should_run():
+        return
+    op.alter_column(
+        "export_history",
+        "export_params",
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using="export_params::jsonb",
+    )
+    op.create_index(
+        "ix_export_params_gin",
+        "export_history",
+        ["export_params"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not _should_run():
+        return
+    op.drop_index("ix_export_params_gin", table_name="export_history")
+    op.alter_column(
+        "export_history",
+        "export_params",
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using="export_params::json",
+    )
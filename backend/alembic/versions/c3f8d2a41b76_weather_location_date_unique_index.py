@@ -0,0 +1,71 @@
+"""unique (location_id, weather_date) indexes on weather_history/weather_forecast
+
+Revision ID: c3f8d2a41b76
+Revises: b57a0c93e1f4
+Create Date: 2026-10-15 10:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3f8d2a41b76"
+down_revision: Union[str, None] = "b57a0c93e1f4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_weather_location_date",
+        "weather_history",
+        ["location_id", "weather_date"],
+        unique=True,
+    )
+    op.drop_index(op.f("ix_weather_history_weather_date"), table_name="weather_history")
+    op.drop_index(op.f("ix_weather_history_location_id"), table_name="weather_history")
+    op.create_index(
+        "ix_forecast_location_date",
+        "weather_forecast",
+        ["location_id", "weather_date"],
+        unique=True,
+    )
+    op.drop_index(
+        op.f("ix_weather_forecast_weather_date"), table_name="weather_forecast"
+    )
+    op.drop_index(
+        op.f("ix_weather_forecast_location_id"), table_name="weather_forecast"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        op.f("ix_weather_forecast_location_id"),
+        "weather_forecast",
+        ["location_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_weather_forecast_weather_date"),
+        "weather_forecast",
+        ["weather_date"],
+        unique=False,
+    )
+    op.drop_index("ix_forecast_location_date", table_name="weather_forecast")
+    op.create_index(
+        op.f("ix_weather_history_location_id"),
+        "weather_history",
+        ["location_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_weather_history_weather_date"),
+        "weather_history",
+        ["weather_date"],
+        unique=False,
+    )
+    op.drop_index("ix_weather_location_date", table_name="weather_history")
@@ -0,0 +1,63 @@
+"""move weather_history.raw_response into weather_history_raw
+
+Revision ID: d71a4c2e9f05
+Revises: c3f8d2a41b76
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d71a4c2e9f05"
+down_revision: Union[str, None] = "c3f8d2a41b76"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _payload_cast(column: str, type_name: str) -> str:
+    # Postgres needs an explicit json <-> jsonb cast; other dialects store text
+    if op.get_bind().dialect.name == "postgresql":
+        return f"{column}::{type_name}"
+    return column
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "weather_history_raw",
+        sa.Column("history_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "payload",
+            sa.JSON().with_variant(postgresql.JSONB(), "postgresql"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["history_id"], ["weather_history.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("history_id"),
+    )
+    op.execute(
+        "INSERT INTO weather_history_raw (history_id, payload) "
+        f"SELECT id, {_payload_cast('raw_response', 'jsonb')} "
+        "FROM weather_history WHERE raw_response IS NOT NULL"
+    )
+    with op.batch_alter_table("weather_history") as batch_op:
+        batch_op.drop_column("raw_response")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("weather_history") as batch_op:
+        batch_op.add_column(sa.Column("raw_response", sa.JSON(), nullable=True))
+    op.execute(
+        "UPDATE weather_history SET raw_response = ("
+        f"SELECT {_payload_cast('payload', 'json')} FROM weather_history_raw "
+        "WHERE weather_history_raw.history_id = weather_history.id)"
+    )
+    op.drop_table("weather_history_raw")
@@ -0,0 +1,41 @@
+"""cover temp_c/condition/icon in ix_weather_location_date on Postgres
+
+Revision ID: e4b9a6d13c82
+Revises: d71a4c2e9f05
+Create Date: 2026-10-15 11:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e4b9a6d13c82"
+down_revision: Union[str, None] = "d71a4c2e9f05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _recreate_index(**kw) -> None:
+    # INCLUDE columns are Postgres-only; other dialects keep the plain index
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("ix_weather_location_date", table_name="weather_history")
+    op.create_index(
+        "ix_weather_location_date",
+        "weather_history",
+        ["location_id", "weather_date"],
+        unique=True,
+        **kw,
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _recreate_index(postgresql_include=["temp_c", "condition", "icon"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _recreate_index()
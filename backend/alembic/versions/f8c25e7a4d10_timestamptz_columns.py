@@ -0,0 +1,67 @@
+"""store weather, location, search and user timestamps as timestamptz
+
+Revision ID: f8c25e7a4d10
+Revises: e4b9a6d13c82
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f8c25e7a4d10"
+down_revision: Union[str, None] = "e4b9a6d13c82"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Existing naive values were written as UTC
+TIMESTAMP_COLUMNS = {
+    "search_locations": ["created_at", "updated_at"],
+    "weather_history": [
+        "weather_date",
+        "sunrise",
+        "sunset",
+        "updated_at",
+        "created_at",
+    ],
+    "weather_forecast": ["weather_date", "created_at"],
+    "search_history": ["searched_at"],
+    "users": ["created_at", "updated_at"],
+}
+
+
+def _convert(timezone: bool) -> None:
+    # Only Postgres distinguishes timestamp from timestamptz
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    inspector = sa.inspect(bind)
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        # search_history and users are created by the app (create_all)
+        if not inspector.has_table(table):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table)}
+        for column in columns:
+            if column not in existing:
+                continue
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(timezone=timezone),
+                existing_type=sa.DateTime(timezone=not timezone),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _convert(timezone=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _convert(timezone=False)
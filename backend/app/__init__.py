@@ -6,6 +6,8 @@ import os
 
 from dotenv import load_dotenv
 
-load_dotenv(
-    dotenv_path=os.path.join(os.path.dirname(os.path.dirname(__file__)), ".env")
-)
+# Production deployments get their environment from the process, not .env
+if os.getenv("ENV") != "prod":
+    load_dotenv(
+        dotenv_path=os.path.join(os.path.dirname(os.path.dirname(__file__)), ".env")
+    )
@@ -51,11 +51,13 @@ Additional Enhancements:
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.crud import export as export_crud
 from app.models.export import ExportHistory
 from app.schemas.export import (  # ExportHistoryUpdate,
     ExportHistoryCreate,
@@ -88,75 +90,77 @@ def get_data() -> list:
     return mock_data
 
 
-def log_export(
-    db: Session, export_type: str, status: str = "success", error: Optional[str] = None
+async def log_export(
+    db: AsyncSession,
+    export_type: str,
+    status: str = "success",
+    error: Optional[str] = None,
 ):
     entry = ExportHistoryCreate(
         export_type=export_type, export_params={"source": "mock"}, user_id=None
     )
-    data = entry.dict()
-    data.pop("user_id", None)
-
-    export_record = ExportHistory(**data, status=status, error_message=error)
-    print("Logging export:", export_record)
-    db.add(export_record)
-    db.commit()
+    await export_crud.create_export_record(
+        db, entry, status=status, error_message=error
+    )
 
 
 @router.get("/csv")
-def export_csv(db: Session = Depends(get_db)):
+async def export_csv(db: AsyncSession = Depends(get_db)):
     try:
         data = get_data()
-        buffer = export_service.export_to_csv(data)
-        log_export(db, export_type="csv")
+        rows = export_service.iter_csv(data)
+        await log_export(db, export_type="csv")
         return StreamingResponse(
-            iter([buffer.getvalue()]),
+            rows,
             media_type="text/csv",
             headers={"Content-Disposition": "attachment; filename=weather_data.csv"},
         )
     except Exception as e:
-        log_export(db, export_type="csv", status="failed", error=str(e))
+        await log_export(db, export_type="csv", status="failed", error=str(e))
         raise HTTPException(status_code=500, detail=f"CSV export failed: {str(e)}")
 
 
 @router.get("/json")
-def export_json(pretty: Optional[bool] = Query(False), db: Session = Depends(get_db)):
+async def export_json(
+    pretty: Optional[bool] = Query(False), db: AsyncSession = Depends(get_db)
+):
     try:
         data = get_data()
         json_data = export_service.export_to_json(data, pretty=pretty or False)
-        log_export(db, export_type="json")
+        await log_export(db, export_type="json")
         return Response(
             content=json_data,
             media_type="application/json",
             headers={"Content-Disposition": "attachment; filename=weather_data.json"},
         )
     except Exception as e:
-        log_export(db, export_type="json", status="failed", error=str(e))
+        await log_export(db, export_type="json", status="failed", error=str(e))
         raise HTTPException(status_code=500, detail=f"JSON export failed: {str(e)}")
 
 
 @router.get("/pdf")
-def export_pdf(db: Session = Depends(get_db)):
+async def export_pdf(db: AsyncSession = Depends(get_db)):
     try:
         data = get_data()
-        buffer = export_service.export_to_pdf(data)
-        log_export(db, export_type="pdf")
+        # Layout and compression are CPU-bound; keep them off the event loop
+        buffer = await run_in_threadpool(export_service.export_to_pdf, data)
+        await log_export(db, export_type="pdf")
         return StreamingResponse(
             buffer,
             media_type="application/pdf",
             headers={"Content-Disposition": "attachment; filename=weather_report.pdf"},
         )
     except Exception as e:
-        log_export(db, export_type="pdf", status="failed", error=str(e))
+        await log_export(db, export_type="pdf", status="failed", error=str(e))
         raise HTTPException(status_code=500, detail=f"PDF export failed: {str(e)}")
 
 
 @router.get("/history", response_model=List[ExportHistoryRead])
-def get_export_history(
+async def get_export_history(
     export_type: Optional[str] = None,
     status: Optional[str] = None,
     user_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieve export history logs with optional filtering.
@@ -170,5 +174,5 @@ def get_export_history(
     if user_id:
         query = query.where(ExportHistory.user_id == user_id)
 
-    results = db.execute(query).scalars().all()
+    results = (await db.scalars(query)).all()
     return results
@@ -38,14 +38,13 @@ content, increasing user engagement and providing contextual information beyond
 raw weather data.
 """
 
-# import asyncio
 import os
 from typing import Optional
 
 import httpx
 from fastapi import APIRouter, HTTPException, Query
 
-# from app.services.weather_service import fetch_current_weather, fetch_forecast
+from app.core.http import get_http_client
 
 router = APIRouter()
 
@@ -86,27 +85,26 @@ async def fetch_youtube_videos_by_category(city: str, category: str, max_results
         "publishedAfter": "2023-01-01T00:00:00Z",  # Get relatively recent videos
     }
 
-    async with httpx.AsyncClient(timeout=10) as client:
-        resp = await client.get(url, params=params)
-        resp.raise_for_status()
-        data = resp.json()
-
-        videos = []
-        for item in data.get("items", []):
-            video_id = item["id"]["videoId"]
-            videos.append(
-                {
-                    "videoId": video_id,
-                    "title": item["snippet"]["title"],
-                    "description": item["snippet"]["description"],
-                    "thumbnail": item["snippet"]["thumbnails"]["high"]["url"],
-                    "embed_url": f"https://www.youtube.com/embed/{video_id}",
-                    "watch_url": f"https://www.youtube.com/watch?v={video_id}",
-                    "category": category,
-                }
-            )
-
-        return videos
+    resp = await get_http_client().get(url, params=params)
+    resp.raise_for_status()
+    data = resp.json()
+
+    videos = []
+    for item in data.get("items", []):
+        video_id = item["id"]["videoId"]
+        videos.append(
+            {
+                "videoId": video_id,
+                "title": item["snippet"]["title"],
+                "description": item["snippet"]["description"],
+                "thumbnail": item["snippet"]["thumbnails"]["high"]["url"],
+                "embed_url": f"https://www.youtube.com/embed/{video_id}",
+                "watch_url": f"https://www.youtube.com/watch?v={video_id}",
+                "category": category,
+            }
+        )
+
+    return videos
 
 
 async def fetch_youtube_videos(query, max_results=3):
@@ -119,28 +117,27 @@ async def fetch_youtube_videos(query, max_results=3):
         "key": os.environ.get("YOUTUBE_API_KEY"),
     }
 
-    async with httpx.AsyncClient(timeout=10) as client:
-        resp = await client.get(url, params=params)
-        resp.raise_for_status()
-        data = resp.json()
-
-        videos = []
-        for item in data.get("items", []):
-            video_id = item["id"]["videoId"]
-            videos.append(
-                {
-                    "videoId": video_id,
-                    "title": item["snippet"]["title"],
-                    "description": item["snippet"]["description"],
-                    "thumbnail": item["snippet"]["thumbnails"]["high"][
-                        "url"
-                    ],  # or 'default'
-                    "embed_url": f"https://www.youtube.com/embed/{video_id}",
-                    "watch_url": f"https://www.youtube.com/watch?v={video_id}",
-                }
-            )
-
-        return videos
+    resp = await get_http_client().get(url, params=params)
+    resp.raise_for_status()
+    data = resp.json()
+
+    videos = []
+    for item in data.get("items", []):
+        video_id = item["id"]["videoId"]
+        videos.append(
+            {
+                "videoId": video_id,
+                "title": item["snippet"]["title"],
+                "description": item["snippet"]["description"],
+                "thumbnail": item["snippet"]["thumbnails"]["high"][
+                    "url"
+                ],  # or 'default'
+                "embed_url": f"https://www.youtube.com/embed/{video_id}",
+                "watch_url": f"https://www.youtube.com/watch?v={video_id}",
+            }
+        )
+
+    return videos
 
 
 @router.get("/youtube")
@@ -194,15 +191,14 @@ async def geocode_location(location: str) -> tuple[float, float]:
     url = "https://maps.googleapis.com/maps/api/geocode/json"
     params = {"address": location, "key": api_key}
 
-    async with httpx.AsyncClient(timeout=10) as client:
-        resp = await client.get(url, params=params)
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await get_http_client().get(url, params=params)
+    resp.raise_for_status()
+    data = resp.json()
 
-        if not data["results"]:
-            raise ValueError("Location not found")
-        loc = data["results"][0]["geometry"]["location"]
-        return loc["lat"], loc["lng"]
+    if not data["results"]:
+        raise ValueError("Location not found")
+    loc = data["results"][0]["geometry"]["location"]
+    return loc["lat"], loc["lng"]
 
 
 async def fetch_map_embed(lat: float, lon: float, zoom: int = 12) -> dict:
@@ -29,29 +29,57 @@ This module enables fast, flexible search-based location lookups and real-time
 weather data integration within the Weather App backend.
 """
 
-import os
+import asyncio
+import hashlib
+import math
 import re
 from typing import List, Optional
 
-import requests
-from dotenv import load_dotenv
-from fastapi import APIRouter, Depends, HTTPException, Query
-from requests.exceptions import RequestException
+import httpx
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import func, or_, select, true
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import build_cache_key, cache_get, cache_set, invalidate_prefix
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.http import get_http_client
 from app.models.models import SearchLocation, WeatherHistory
 from app.models.search_history import SearchHistory
 from app.schemas.search_location import (
+    SearchHistoryListAdapter,
     SearchHistoryResponse,
     SearchLocationCreate,
+    SearchLocationListAdapter,
     SearchLocationResponse,
     SearchLocationUpdate,
 )
+from app.services.search_history_service import SEARCH_HISTORY_CACHE, record_search
+from app.utils.validators import US_ZIP_RE
 
 router = APIRouter()
-load_dotenv()
+
+# /search results are cached per normalized query for a day; any change to
+# the saved locations drops the whole namespace
+LOCATION_SEARCH_CACHE = "location:search"
+LOCATION_SEARCH_TTL = 86400
+
+# Location listings and recent search history are read far more often than
+# they change; cached briefly and dropped by the writers
+LOCATION_LIST_CACHE = "location:list"
+LOCATION_READ_TTL = 30
+
+# Lat/lon input pattern, compiled once rather than per request
+_LATLON_RE = re.compile(r"^-?\d+(\.\d+)?\s*,\s*-?\d+(\.\d+)?$")
+
+
+async def invalidate_location_caches() -> None:
+    """Drops cached searches and listings after the saved locations change"""
+    await asyncio.gather(
+        invalidate_prefix(LOCATION_SEARCH_CACHE),
+        invalidate_prefix(LOCATION_LIST_CACHE),
+    )
 
 
 def load_openweather_api_key() -> str:
@@ -64,13 +92,13 @@ def load_openweather_api_key() -> str:
     Raises:
         RuntimeError: If the API key is not found in the environment.
     """
-    api_key = os.getenv("OPENWEATHER_API_KEY")
+    api_key = settings.openweather_api_key
     if not api_key:
         raise RuntimeError("OPENWEATHER_API_KEY not set in environment variables.")
     return api_key
 
 
-def geocode_location(location: str, api_key: str) -> tuple:
+async def geocode_location(location: str, api_key: str) -> tuple:
     """
     Converts a city name, address, or zip code to latitude and longitude using
     the OpenWeather Geocoding API.
@@ -84,30 +112,41 @@ def geocode_location(location: str, api_key: str) -> tuple:
 
     Raises:
         ValueError: If the location is not found by the API.
-        RequestException: If the API request fails.
+        RuntimeError: If the API request fails.
     """
     try:
         url = (
             f"http://api.openweathermap.org/geo/1.0/direct"
             f"?q={location}&limit=1&appid={api_key}"
         )
-        response = requests.get(url, timeout=5)
+        response = await get_http_client().get(url, timeout=5)
         response.raise_for_status()
         data = response.json()
         if not data:
             raise ValueError(f"Location not found: {location}")
         return data[0]["lat"], data[0]["lon"]
-    except RequestException as e:
+    except httpx.HTTPError as e:
         raise RuntimeError(f"Geocoding API request failed: {str(e)}") from e
 
 
+def search_cache_key(query: str, limit: int) -> str:
+    """
+    Cache key for a location search: SHA1 of the case/whitespace-normalized
+    query, so equivalent spellings share an entry and keys stay short.
+    """
+    normalized = " ".join(query.lower().split())
+    digest = hashlib.sha1(normalized.encode()).hexdigest()
+    return build_cache_key(LOCATION_SEARCH_CACHE, q=digest, limit=limit)
+
+
 def detect_input_type(user_input: str) -> str:
     """
     Detect the type of the input: 'latlon', 'zip', or 'city'.
     """
-    if re.match(r"^-?\d+(\.\d+)?\s*,\s*-?\d+(\.\d+)?$", user_input.strip()):
+    user_input = user_input.strip()
+    if _LATLON_RE.match(user_input):
         return "latlon"
-    elif re.match(r"^\d{5}(-\d{4})?$", user_input.strip()):
+    elif US_ZIP_RE.match(user_input):
         return "zip"
     return "city"
 
@@ -123,7 +162,7 @@ def validate_zip_code(zip_code: str) -> bool:
         bool: True if valid, False otherwise
     """
     # US ZIP code: 5 digits or 5+4 format
-    return bool(re.match(r"^\d{5}(-\d{4})?$", zip_code.strip()))
+    return bool(US_ZIP_RE.match(zip_code.strip()))
 
 
 def parse_coordinates(input: str) -> tuple:
@@ -134,7 +173,7 @@ def parse_coordinates(input: str) -> tuple:
     return lat, lon
 
 
-def get_weather_by_coordinates(lat: float, lon: float, api_key: str) -> dict:
+async def get_weather_by_coordinates(lat: float, lon: float, api_key: str) -> dict:
     """
     Get weather data from OpenWeather using latitude and longitude.
 
@@ -154,14 +193,14 @@ def get_weather_by_coordinates(lat: float, lon: float, api_key: str) -> dict:
             f"http://api.openweathermap.org/data/2.5/weather"
             f"?lat={lat}&lon={lon}&appid={api_key}"
         )
-        response = requests.get(url, timeout=5)
+        response = await get_http_client().get(url, timeout=5)
         response.raise_for_status()
         return response.json()
-    except RequestException as e:
+    except httpx.HTTPError as e:
         raise RuntimeError(f"Weather API request failed (latlon): {str(e)}") from e
 
 
-def get_weather_by_zip(zip_code: str, api_key: str) -> tuple:
+async def get_weather_by_zip(zip_code: str, api_key: str) -> tuple:
     """
     Converts a zip code to latitude and longitude using OpenWeather APIs.
 
@@ -187,7 +226,7 @@ def get_weather_by_zip(zip_code: str, api_key: str) -> tuple:
         zip_url = (
             f"http://api.openweathermap.org/geo/1.0/zip?zip={zip_code}&appid={api_key}"
         )
-        response = requests.get(zip_url, timeout=5)
+        response = await get_http_client().get(zip_url, timeout=5)
 
         if response.status_code == 404:
             # Extract the original zip code without country code for error message
@@ -201,14 +240,14 @@ def get_weather_by_zip(zip_code: str, api_key: str) -> tuple:
     except ValueError:
         # Re-raise ValueError as is
         raise
-    except RequestException as e:
+    except httpx.HTTPError as e:
         if "404" in str(e):
             original_zip = zip_code.split(",")[0]
             raise ValueError(f"{original_zip} is not valid")
         raise RuntimeError(f"Geocoding API request failed: {str(e)}") from e
 
 
-def resolve_input_and_fetch_weather(user_input: str, api_key: str) -> dict:
+async def resolve_input_and_fetch_weather(user_input: str, api_key: str) -> dict:
     """
     Resolve user input to a standard form and fetch weather data.
 
@@ -226,17 +265,17 @@ def resolve_input_and_fetch_weather(user_input: str, api_key: str) -> dict:
     input_type = detect_input_type(user_input)
     if input_type == "latlon":
         lat, lon = parse_coordinates(user_input)
-        return get_weather_by_coordinates(lat, lon, api_key)
+        return await get_weather_by_coordinates(lat, lon, api_key)
     elif input_type == "zip":
-        lat, lon = get_weather_by_zip(user_input, api_key)
-        return get_weather_by_coordinates(lat, lon, api_key)
+        lat, lon = await get_weather_by_zip(user_input, api_key)
+        return await get_weather_by_coordinates(lat, lon, api_key)
     else:
-        lat, lon = geocode_location(user_input, api_key)
-        return get_weather_by_coordinates(lat, lon, api_key)
+        lat, lon = await geocode_location(user_input, api_key)
+        return await get_weather_by_coordinates(lat, lon, api_key)
 
 
 @router.get("/weather")
-def weather(user_input: str):
+async def weather(user_input: str):
     """
     Retrieves current weather data based on user input.
 
@@ -249,7 +288,7 @@ def weather(user_input: str):
     """
     try:
         api_key = load_openweather_api_key()
-        return resolve_input_and_fetch_weather(user_input, api_key)
+        return await resolve_input_and_fetch_weather(user_input, api_key)
     except ValueError as e:
         # Handle invalid input format (e.g., invalid zip code)
         raise HTTPException(status_code=400, detail=str(e))
@@ -262,7 +301,7 @@ def weather(user_input: str):
 async def search_location(
     query: str = Query(..., description="Partial or full location string to search."),
     limit: int = Query(5, ge=1, le=10, description="Max number of results to return."),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Search locations and save search history.
@@ -270,22 +309,30 @@ async def search_location(
     if not, call OpenWeather API to save the new location.
     """
     api_key = load_openweather_api_key()
+    cache_key = search_cache_key(query, limit)
+    hit = await cache_get(cache_key)
+    if hit is not None:
+        # Every search is recorded, whichever path answers it
+        await record_search(db, user_id=1, query=query)  # Temporary user ID
+        return Response(content=hit, media_type="application/json")
+
     try:
         # 1. Search Location First, Search Local DB
         local_results = (
-            db.query(SearchLocation)
-            .filter(
-                SearchLocation.city.ilike(f"%{query}%")
-                | SearchLocation.state.ilike(f"%{query}%")
-                | SearchLocation.postal_code.ilike(f"%{query}%")
+            await db.scalars(
+                select(SearchLocation)
+                .where(
+                    SearchLocation.city.ilike(f"%{query}%")
+                    | SearchLocation.state.ilike(f"%{query}%")
+                    | SearchLocation.postal_code.ilike(f"%{query}%")
+                )
+                .limit(limit)
             )
-            .limit(limit)
-            .all()
-        )
+        ).all()
 
         # If found in Local DB, return the result
         if local_results:
-            return {
+            body = {
                 "results": [
                     {
                         "id": loc.id,
@@ -299,13 +346,16 @@ async def search_location(
                     for loc in local_results
                 ]
             }
+            await record_search(db, user_id=1, query=query)  # Temporary user ID
+            await cache_set(cache_key, body, LOCATION_SEARCH_TTL)
+            return body
 
         # 2. If not found in Local DB, call OpenWeather API
         url = (
             f"http://api.openweathermap.org/geo/1.0/direct"
             f"?q={query}&limit={limit}&appid={api_key}"
         )
-        response = requests.get(url, timeout=5)
+        response = await get_http_client().get(url, timeout=5)
         response.raise_for_status()
         data = response.json()
 
@@ -314,16 +364,17 @@ async def search_location(
 
         # 3. Save the search result to DB
         saved_locations = []
+        added_location = False
         for location in data:
             # Check for duplicates by latitude/longitude
             existing_location = (
-                db.query(SearchLocation)
-                .filter(
-                    SearchLocation.latitude == location.get("lat"),
-                    SearchLocation.longitude == location.get("lon"),
+                await db.scalars(
+                    select(SearchLocation).where(
+                        SearchLocation.latitude == location.get("lat"),
+                        SearchLocation.longitude == location.get("lon"),
+                    )
                 )
-                .first()
-            )
+            ).first()
 
             if not existing_location:
                 new_location = SearchLocation(
@@ -335,18 +386,21 @@ async def search_location(
                     external_id=str(location.get("id")) if "id" in location else None,
                 )
                 db.add(new_location)
-                db.commit()
-                db.refresh(new_location)
+                await db.commit()
+                await db.refresh(new_location)
                 saved_locations.append(new_location)
+                added_location = True
             else:
                 saved_locations.append(existing_location)
 
         # 4. Save the search history
-        search_record = SearchHistory(user_id=1, query=query)  # Temporary user ID
-        db.add(search_record)
-        db.commit()
+        await record_search(db, user_id=1, query=query)  # Temporary user ID
+
+        # New rows can match other cached queries
+        if added_location:
+            await invalidate_location_caches()
 
-        return {
+        body = {
             "results": [
                 {
                     "id": loc.id,
@@ -360,31 +414,43 @@ async def search_location(
                 for loc in saved_locations
             ]
         }
-    except RequestException as e:
-        db.rollback()
+        await cache_set(cache_key, body, LOCATION_SEARCH_TTL)
+        return body
+    except httpx.HTTPError as e:
+        await db.rollback()
         raise HTTPException(status_code=502, detail=f"Geocoding API error: {str(e)}")
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500, detail=f"Error occurred while searching: {str(e)}"
         )
 
 
 @router.get("/history", response_model=List[SearchHistoryResponse])
-async def get_search_history(db: Session = Depends(get_db)):
+async def get_search_history(db: AsyncSession = Depends(get_db)):
     """
     Retrieve the latest search history.
     """
+    cache_key = build_cache_key(SEARCH_HISTORY_CACHE)
+    hit = await cache_get(cache_key)
+    if hit is not None:
+        return Response(content=hit, media_type="application/json")
+
     try:
         # Get the latest 10 search history
         history = (
-            db.query(SearchHistory)
-            .order_by(SearchHistory.searched_at.desc())
-            .limit(10)
-            .all()
-        )
+            await db.scalars(
+                select(SearchHistory)
+                .order_by(SearchHistory.searched_at.desc())
+                .limit(10)
+            )
+        ).all()
 
-        return history
+        body = SearchHistoryListAdapter.dump_python(
+            SearchHistoryListAdapter.validate_python(history), mode="json"
+        )
+        await cache_set(cache_key, body, LOCATION_READ_TTL)
+        return body
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -394,7 +460,7 @@ async def get_search_history(db: Session = Depends(get_db)):
 
 @router.post("/locations", response_model=SearchLocationResponse)
 async def create_location(
-    location_data: SearchLocationCreate, db: Session = Depends(get_db)
+    location_data: SearchLocationCreate, db: AsyncSession = Depends(get_db)
 ):
     """
     Create a new location record.
@@ -402,27 +468,28 @@ async def create_location(
     try:
         # Check for duplicates
         existing = (
-            db.query(SearchLocation)
-            .filter(
-                SearchLocation.city == location_data.city,
-                SearchLocation.country == location_data.country,
-                SearchLocation.state == location_data.state,
+            await db.scalars(
+                select(SearchLocation).where(
+                    SearchLocation.city == location_data.city,
+                    SearchLocation.country == location_data.country,
+                    SearchLocation.state == location_data.state,
+                )
             )
-            .first()
-        )
+        ).first()
 
         if existing:
             raise HTTPException(status_code=409, detail="Location already exists")
 
         # Create new location
-        new_location = SearchLocation(**location_data.dict())
+        new_location = SearchLocation(**location_data.model_dump())
         db.add(new_location)
-        db.commit()
-        db.refresh(new_location)
+        await db.commit()
+        await db.refresh(new_location)
+        await invalidate_location_caches()
 
         return new_location
     except SQLAlchemyError as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 
@@ -432,28 +499,114 @@ async def get_all_locations(
     limit: int = Query(100, ge=1, le=1000),
     city: Optional[str] = Query(None),
     country: Optional[str] = Query(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Get all location records with optional filtering.
     """
-    query = db.query(SearchLocation)
+    cache_key = build_cache_key(
+        LOCATION_LIST_CACHE, skip=skip, limit=limit, city=city, country=country
+    )
+    hit = await cache_get(cache_key)
+    if hit is not None:
+        return Response(content=hit, media_type="application/json")
+
+    query = select(SearchLocation)
 
     if city:
-        query = query.filter(SearchLocation.city.ilike(f"%{city}%"))
+        query = query.where(SearchLocation.city.ilike(f"%{city}%"))
     if country:
-        query = query.filter(SearchLocation.country.ilike(f"%{country}%"))
+        query = query.where(SearchLocation.country.ilike(f"%{country}%"))
+
+    locations = (await db.scalars(query.offset(skip).limit(limit))).all()
+    body = SearchLocationListAdapter.dump_python(
+        SearchLocationListAdapter.validate_python(locations), mode="json"
+    )
+    await cache_set(cache_key, body, LOCATION_READ_TTL)
+    return body
 
-    locations = query.offset(skip).limit(limit).all()
-    return locations
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Great-circle distance between two points in kilometres.
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lon2 - lon1)
+    a = (
+        math.sin(dphi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+# Most bounding-box candidates checked per nearby query
+NEARBY_CANDIDATE_LIMIT = 1000
+
+
+def _longitude_filter(lon: float, dlon: float):
+    """
+    Longitude range lon ± dlon as a SQL condition. A range crossing the
+    antimeridian is split in two so both sides of ±180° are matched.
+    """
+    low, high = lon - dlon, lon + dlon
+    column = SearchLocation.longitude
+    if high - low >= 360:
+        return true()
+    if low < -180:
+        return or_(column >= low + 360, column <= high)
+    if high > 180:
+        return or_(column >= low, column <= high - 360)
+    return column.between(low, high)
+
+
+@router.get("/locations/nearby", response_model=List[SearchLocationResponse])
+async def get_nearby_locations(
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    radius_km: float = Query(10.0, gt=0, le=500),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get saved locations within `radius_km` of a point, nearest first.
+    A bounding box on (latitude, longitude) narrows candidates through
+    ix_location_coords (at most NEARBY_CANDIDATE_LIMIT of them); exact
+    distances are then checked in Python.
+    """
+    dlat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    dlon = dlat / max(math.cos(math.radians(lat)), 1e-6)
+
+    candidates = (
+        await db.scalars(
+            select(SearchLocation)
+            .where(
+                SearchLocation.latitude.between(lat - dlat, lat + dlat),
+                _longitude_filter(lon, dlon),
+            )
+            .limit(NEARBY_CANDIDATE_LIMIT)
+        )
+    ).all()
+
+    nearby = sorted(
+        (
+            (haversine_km(lat, lon, loc.latitude, loc.longitude), loc)
+            for loc in candidates
+        ),
+        key=lambda item: item[0],
+    )
+    return [loc for distance, loc in nearby if distance <= radius_km][:limit]
 
 
 @router.get("/locations/{location_id}", response_model=SearchLocationResponse)
-async def get_location_by_id(location_id: int, db: Session = Depends(get_db)):
+async def get_location_by_id(location_id: int, db: AsyncSession = Depends(get_db)):
     """
     Get a specific location by ID.
     """
-    location = db.query(SearchLocation).filter(SearchLocation.id == location_id).first()
+    location = await db.get(SearchLocation, location_id)
     if not location:
         raise HTTPException(
             status_code=404, detail=f"Location with ID {location_id} not found"
@@ -463,51 +616,50 @@ async def get_location_by_id(location_id: int, db: Session = Depends(get_db)):
 
 @router.put("/locations/{location_id}", response_model=SearchLocationResponse)
 async def update_location(
-    location_id: int, location_data: SearchLocationUpdate, db: Session = Depends(get_db)
+    location_id: int,
+    location_data: SearchLocationUpdate,
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Update a specific location.
     """
     try:
-        location = (
-            db.query(SearchLocation).filter(SearchLocation.id == location_id).first()
-        )
+        location = await db.get(SearchLocation, location_id)
         if not location:
             raise HTTPException(
                 status_code=404, detail=f"Location with ID {location_id} not found"
             )
 
         # 업데이트 데이터 적용
-        for field, value in location_data.dict(exclude_unset=True).items():
+        for field, value in location_data.model_dump(exclude_unset=True).items():
             setattr(location, field, value)
 
-        db.commit()
-        db.refresh(location)
+        await db.commit()
+        await db.refresh(location)
+        await invalidate_location_caches()
         return location
     except SQLAlchemyError as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 
 @router.delete("/locations/{location_id}")
-async def delete_location(location_id: int, db: Session = Depends(get_db)):
+async def delete_location(location_id: int, db: AsyncSession = Depends(get_db)):
     """
     Delete a specific location.
     """
     try:
-        location = (
-            db.query(SearchLocation).filter(SearchLocation.id == location_id).first()
-        )
+        location = await db.get(SearchLocation, location_id)
         if not location:
             raise HTTPException(
                 status_code=404, detail=f"Location with ID {location_id} not found"
             )
 
         # Check if there are any weather records associated with this location
-        weather_count = (
-            db.query(WeatherHistory)
-            .filter(WeatherHistory.location_id == location_id)
-            .count()
+        weather_count = await db.scalar(
+            select(func.count())
+            .select_from(WeatherHistory)
+            .where(WeatherHistory.location_id == location_id)
         )
 
         if weather_count > 0:
@@ -519,9 +671,10 @@ async def delete_location(location_id: int, db: Session = Depends(get_db)):
                 ),
             )
 
-        db.delete(location)
-        db.commit()
+        await db.delete(location)
+        await db.commit()
+        await invalidate_location_caches()
         return {"message": f"Location with ID {location_id} deleted successfully"}
     except SQLAlchemyError as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
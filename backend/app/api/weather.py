@@ -48,9 +48,10 @@ query, store, and manage weather-related information effectively.
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cached
 from app.core.database import get_db
 from app.crud import weather as crud
 from app.schemas.weather import (
@@ -58,21 +59,33 @@ from app.schemas.weather import (
     HourlyWeatherResponse,
     WeatherCurrent,
     WeatherHistoryCreate,
+    WeatherHistoryListAdapter,
     WeatherHistoryResponse,
     WeatherHistoryUpdate,
 )
 from app.services.weather_service import (
+    CURRENT_TTL,
+    FORECAST_TTL,
+    HOURLY_TTL,
     fetch_current_weather,
     fetch_forecast,
     fetch_hourly_weather,
-    get_weather_tip,
+    get_weather_stats,
 )
+from app.utils.helpers import get_weather_tip_json
 
 router = APIRouter(tags=["Weather"])
 
 
 @router.get("/current", response_model=WeatherCurrent)
+@cached(
+    "weather:current",
+    expire=CURRENT_TTL,
+    response_model=WeatherCurrent,
+    cache_control=True,
+)
 async def get_current_weather(
+    response: Response,
     city: Optional[str] = Query(None),
     lat: Optional[float] = Query(None),
     lon: Optional[float] = Query(None),
@@ -100,14 +113,21 @@ async def get_current_weather(
 
 
 @router.get("/forecast", response_model=ForecastResponse)
+@cached(
+    "weather:forecast",
+    expire=FORECAST_TTL,
+    response_model=ForecastResponse,
+    cache_control=True,
+)
 async def get_forecast(
+    response: Response,
     city: Optional[str] = Query(None),
     lat: Optional[float] = Query(None),
     lon: Optional[float] = Query(None),
     zip_code: Optional[str] = Query(
         None, description="Zip code (postal code) of the location"
     ),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     try:
         # If zip code is provided, use it to get coordinates
@@ -129,7 +149,14 @@ async def get_forecast(
 
 
 @router.get("/hourly", response_model=HourlyWeatherResponse)
+@cached(
+    "weather:hourly",
+    expire=HOURLY_TTL,
+    response_model=HourlyWeatherResponse,
+    cache_control=True,
+)
 async def get_hourly_weather(
+    response: Response,
     city: Optional[str] = Query(None),
     lat: Optional[float] = Query(None),
     lon: Optional[float] = Query(None),
@@ -181,20 +208,26 @@ async def get_location_by_zip(zip_code: str) -> Optional[dict]:
 
 
 @router.post("", response_model=dict)
-def store_weather(data: WeatherHistoryCreate, db: Session = Depends(get_db)):
+async def store_weather(data: WeatherHistoryCreate, db: AsyncSession = Depends(get_db)):
     try:
-        record = crud.create_weather_record(db, data)
+        record = await crud.create_weather_record(db, data)
         return {"id": record.id, "message": "Weather data stored."}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/history", response_model=List[WeatherHistoryResponse])
-def get_weather_history(location_id: int, db: Session = Depends(get_db)):
+async def get_weather_history(location_id: int, db: AsyncSession = Depends(get_db)):
     """
     Search for weather history for a specific location.
     """
-    return crud.get_weather_by_location(db, location_id)
+    records = await crud.get_weather_by_location(db, location_id)
+    return Response(
+        content=WeatherHistoryListAdapter.dump_json(
+            WeatherHistoryListAdapter.validate_python(records)
+        ),
+        media_type="application/json",
+    )
 
 
 @router.get("/summary", response_model=dict)
@@ -202,8 +235,9 @@ async def weather_tip(city: Optional[str] = Query(None)):
     result = await fetch_current_weather(city=city)
     if result is None:
         raise HTTPException(status_code=404, detail="Weather data not found.")
-    tip = get_weather_tip(result.condition)
-    return {"tip": tip}
+    return Response(
+        content=get_weather_tip_json(result.condition), media_type="application/json"
+    )
 
 
 @router.get("/airquality", response_model=dict)
@@ -211,20 +245,28 @@ def dummy_air_quality():
     return {"message": "Air quality endpoint not implemented yet."}
 
 
+@router.get("/stats", response_model=dict)
+def weather_stats():
+    """
+    Weather cache hits/misses and OpenWeather call latency for this worker.
+    """
+    return get_weather_stats()
+
+
 @router.get("/{weather_id}", response_model=WeatherHistoryResponse)
-def get_weather_by_id(weather_id: int, db: Session = Depends(get_db)):
-    weather = crud.get_weather_by_id(db, weather_id)
+async def get_weather_by_id(weather_id: int, db: AsyncSession = Depends(get_db)):
+    weather = await crud.get_weather_by_id(db, weather_id)
     if not weather:
         raise HTTPException(status_code=404, detail="Weather record not found")
     return weather
 
 
 @router.put("/{weather_id}", response_model=WeatherHistoryResponse)
-def update_weather(
-    weather_id: int, data: WeatherHistoryUpdate, db: Session = Depends(get_db)
+async def update_weather(
+    weather_id: int, data: WeatherHistoryUpdate, db: AsyncSession = Depends(get_db)
 ):
     try:
-        record = crud.update_weather_record(db, weather_id, data)
+        record = await crud.update_weather_record(db, weather_id, data)
         if not record:
             raise HTTPException(status_code=404, detail="Weather record not found")
         return record
@@ -233,8 +275,8 @@ def update_weather(
 
 
 @router.delete("/{weather_id}", response_model=dict)
-def delete_weather(weather_id: int, db: Session = Depends(get_db)):
-    success = crud.delete_weather_record(db, weather_id)
+async def delete_weather(weather_id: int, db: AsyncSession = Depends(get_db)):
+    success = await crud.delete_weather_record(db, weather_id)
     if not success:
         raise HTTPException(status_code=404, detail="Deletion failed; record not found")
     return {"message": "Record deleted successfully."}
@@ -7,9 +7,10 @@ This module provides endpoints for managing weather history records.
 from datetime import datetime, timedelta
 from typing import List, Optional
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Query
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.crud import weather as weather_crud
@@ -17,24 +18,87 @@ from app.models.models import SearchLocation
 from app.schemas.weather import (
     WeatherBase,
     WeatherHistoryCreate,
+    WeatherHistoryListAdapter,
     WeatherHistoryResponse,
     WeatherHistoryUpdate,
+    WeatherLatestResponse,
     WeatherSearchResponse,
     WeatherSearchResult,
 )
-from app.services.weather_service import (
-    fetch_current_weather,
-    fetch_forecast,
-    fetch_hourly_weather,
-    get_weather_tip,
-)
+from app.services.weather_service import fetch_weather_bundle
+from app.utils.helpers import get_weather_tip
 
 router = APIRouter()
 
-
-async def validate_or_create_location(location_id: int, db: Session):
+# OpenAPI examples are built once at import and shared by the route signatures
+_CREATE_EXAMPLES = {
+    "Basic Example": {
+        "summary": "Basic Weather Record",
+        "description": "Basic weather record with only required fields",
+        "value": {
+            "location_id": 2,
+            "weather_date": "2024-03-20T00:00:00",
+            "temp_c": 20.5,
+            "condition": "Clear",
+        },
+    },
+    "Detailed Example": {
+        "summary": "Detailed Weather Record",
+        "description": "Detailed weather record with optional fields",
+        "value": {
+            "location_id": 2,
+            "weather_date": "2024-03-20T00:00:00",
+            "temp_c": 20.5,
+            "condition": "Clear",
+            "condition_desc": "Clear",
+            "humidity": 65,
+            "wind_speed": 5.2,
+            "wind_deg": 180,
+            "icon": "01d",
+        },
+    },
+}
+
+_START_DATE_EXAMPLES = {
+    "Basic Example": {
+        "summary": "Basic date format",
+        "description": "Specify the start date in ISO 8601 format",
+        "value": "2024-03-04T00:00:00",
+    },
+    "Date Only": {
+        "summary": "Date only",
+        "description": "Specify the date only (automatically set to 00:00:00)",
+        "value": "2024-03-04",
+    },
+    "Timezone Included": {
+        "summary": "Timezone included",
+        "description": "Date format with timezone",
+        "value": "2024-03-04T00:00:00Z",
+    },
+}
+
+_END_DATE_EXAMPLES = {
+    "Basic Example": {
+        "summary": "Basic date format",
+        "description": "Specify the end date in ISO 8601 format",
+        "value": "2024-03-05T23:59:59",
+    },
+    "Date Only": {
+        "summary": "Date only",
+        "description": "Specify the date only (automatically set to 23:59:59)",
+        "value": "2024-03-05",
+    },
+    "Timezone Included": {
+        "summary": "Timezone included",
+        "description": "Date format with timezone",
+        "value": "2024-03-05T23:59:59Z",
+    },
+}
+
+
+async def validate_or_create_location(location_id: int, db: AsyncSession):
     """Check if the location ID exists, and if not, create a new location."""
-    location = db.query(SearchLocation).filter(SearchLocation.id == location_id).first()
+    location = await db.get(SearchLocation, location_id)
     if not location:
         # Create a new location
         new_location = SearchLocation(
@@ -47,11 +111,11 @@ async def validate_or_create_location(location_id: int, db: Session):
         )
         try:
             db.add(new_location)
-            db.commit()
-            db.refresh(new_location)
+            await db.commit()
+            await db.refresh(new_location)
             return new_location
         except SQLAlchemyError:
-            db.rollback()
+            await db.rollback()
             raise HTTPException(
                 status_code=400,
                 detail=(
@@ -89,62 +153,21 @@ async def validate_date_range(
 async def create_weather_record(
     data: WeatherHistoryCreate = Body(
         ...,
-        example={
-            "location_id": 2,
-            "weather_date": "2024-03-20T00:00:00",
-            "temp_c": 20.5,
-            "temp_f": 68.9,
-            "humidity": 65,
-            "wind_speed": 5.2,
-            "condition": "Clear",
-            "condition_desc": "Clear",
-            "icon": "01d",
-        },
-        openapi_examples={
-            "Basic Example": {
-                "summary": "Basic Weather Record",
-                "description": "Basic weather record with only required fields",
-                "value": {
-                    "location_id": 2,
-                    "weather_date": "2024-03-20T00:00:00",
-                    "temp_c": 20.5,
-                    "temp_f": 68.9,
-                    "condition": "Clear",
-                },
-            },
-            "Detailed Example": {
-                "summary": "Detailed Weather Record",
-                "description": "Detailed weather record with optional fields",
-                "value": {
-                    "location_id": 2,
-                    "weather_date": "2024-03-20T00:00:00",
-                    "temp_c": 20.5,
-                    "temp_f": 68.9,
-                    "condition": "Clear",
-                    "condition_desc": "Clear",
-                    "humidity": 65,
-                    "wind_speed": 5.2,
-                    "wind_deg": 180,
-                    "icon": "01d",
-                },
-            },
-        },
+        openapi_examples=_CREATE_EXAMPLES,
     ),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Create a new weather record.
 
     ## Description
-    - If the specified location ID does not exist, a new location
-    will be automatically created.
-    - Location information can be updated later.
+    - The location ID must refer to an existing search location.
+    - Only one record may exist per location and date.
 
     ## Required Fields
     - **location_id**: Location ID (integer)
     - **weather_date**: Weather date (ISO 8601 format)
-    - **temp_c**: Celsius temperature (float)
-    - **temp_f**: Fahrenheit temperature (float)
+    - **temp_c**: Celsius temperature (float); `temp_f` is derived from it
     - **condition**: Weather condition (string)
 
     ## Optional Fields
@@ -158,6 +181,8 @@ async def create_weather_record(
     - Success: Created weather record (200 OK)
     - Failure:
         - 400: Bad request (missing required fields or invalid format)
+        - 404: Location not found
+        - 409: A record for this location and date already exists
         - 500: Server error
 
     ## Example Request
@@ -166,7 +191,6 @@ async def create_weather_record(
         "location_id": 2,
         "weather_date": "2024-03-20T00:00:00",
         "temp_c": 20.5,
-        "temp_f": 68.9,
         "condition": "Clear",
         "humidity": 65,
         "wind_speed": 5.2,
@@ -176,8 +200,12 @@ async def create_weather_record(
     ```
     """
     try:
-        # Check or create location ID
-        # location = await validate_or_create_location(data.location_id, db)
+        # The location must exist, so an IntegrityError below can only be a
+        # duplicate (location_id, weather_date)
+        if await db.get(SearchLocation, data.location_id) is None:
+            raise HTTPException(
+                status_code=404, detail=f"Location {data.location_id} not found."
+            )
 
         # If weather_date is a string, convert it to datetime
         if isinstance(data.weather_date, str):
@@ -220,9 +248,15 @@ async def create_weather_record(
                 status_code=400, detail="Wind speed must be 0 or greater."
             )
 
-        return weather_crud.create_weather_record(db=db, data=data)
+        return await weather_crud.create_weather_record(db=db, data=data)
     except HTTPException:
         raise
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail="A weather record for this location and date already exists.",
+        )
     except SQLAlchemyError as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
@@ -231,13 +265,49 @@ async def create_weather_record(
         )
 
 
-@router.get("/{weather_id}", response_model=WeatherHistoryResponse)
-async def get_weather_record(weather_id: int, db: Session = Depends(get_db)):
+@router.post("/records", response_model=dict)
+async def create_weather_records(
+    data: List[WeatherHistoryCreate] = Body(...),
+    overwrite: bool = Query(
+        False, description="Update records that already exist for the same date"
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Create many weather records in a single batch (e.g. a multi-day import).
+    Existing records are skipped unless `overwrite` is set, in which case
+    the fields sent are updated and the others keep their stored values.
+    """
+    try:
+        written = await weather_crud.bulk_create_weather_records(
+            db=db, records=data, overwrite=overwrite
+        )
+        return {"upserted" if overwrite else "inserted": written}
+    except SQLAlchemyError as e:
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
+
+@router.get("/latest", response_model=List[WeatherLatestResponse])
+async def get_latest_weather_all_locations(db: AsyncSession = Depends(get_db)):
+    """
+    Get the most recent temperature, condition and icon for every location
+    (dashboard overview).
+    """
+    try:
+        rows = await weather_crud.get_latest_weather_per_location(db=db)
+        return [WeatherLatestResponse(**row._mapping) for row in rows]
+    except SQLAlchemyError as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
+
+@router.get("/{weather_id:int}", response_model=WeatherHistoryResponse)
+async def get_weather_record(weather_id: int, db: AsyncSession = Depends(get_db)):
     """
     Get a weather record by ID.
     """
     try:
-        weather = weather_crud.get_weather_by_id(db=db, weather_id=weather_id)
+        weather = await weather_crud.get_weather_by_id(db=db, weather_id=weather_id)
         if not weather:
             raise HTTPException(
                 status_code=404, detail=f"Weather record ID {weather_id} not found."
@@ -253,48 +323,20 @@ async def get_location_weather(
     start_date: Optional[str] = Query(
         None,
         description="Start date (ISO 8601 format)",
-        example="2024-03-04T00:00:00",
-        openapi_examples={
-            "Basic Example": {
-                "summary": "Basic date format",
-                "description": "Specify the start date in ISO 8601 format",
-                "value": "2024-03-04T00:00:00",
-            },
-            "Date Only": {
-                "summary": "Date only",
-                "description": "Specify the date only (automatically set to 00:00:00)",
-                "value": "2024-03-04",
-            },
-            "Timezone Included": {
-                "summary": "Timezone included",
-                "description": "Date format with timezone",
-                "value": "2024-03-04T00:00:00Z",
-            },
-        },
+        openapi_examples=_START_DATE_EXAMPLES,
     ),
     end_date: Optional[str] = Query(
         None,
         description="End date (ISO 8601 format)",
-        example="2024-03-05T23:59:59",
-        openapi_examples={
-            "Basic Example": {
-                "summary": "Basic date format",
-                "description": "Specify the end date in ISO 8601 format",
-                "value": "2024-03-05T23:59:59",
-            },
-            "Date Only": {
-                "summary": "Date only",
-                "description": "Specify the date only (automatically set to 23:59:59)",
-                "value": "2024-03-05",
-            },
-            "Timezone Included": {
-                "summary": "Timezone included",
-                "description": "Date format with timezone",
-                "value": "2024-03-05T23:59:59Z",
-            },
-        },
+        openapi_examples=_END_DATE_EXAMPLES,
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from the previous page's X-Next-Cursor header"
     ),
-    db: Session = Depends(get_db),
+    limit: Optional[int] = Query(
+        None, ge=1, le=1000, description="Page size (omit to return all records)"
+    ),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Get weather records for a specific location.
@@ -303,11 +345,16 @@ async def get_location_weather(
     - Get weather records for a specific location.
     - Specify the start and end dates to view records for a specific period.
     - Dates are supported in ISO 8601 format.
+    - Pagination is keyset based: pass `limit`, then follow the
+      `X-Next-Cursor` response header with `cursor`. Page numbers
+      (`page=N`) and total counts are not supported.
 
     ## Parameters
     - **location_id**: Location ID (integer)
     - **start_date**: Start date (optional)
     - **end_date**: End date (optional)
+    - **cursor**: `weather_date` of the last record seen (optional)
+    - **limit**: Page size (optional)
 
     ## Response
     - Success: Return weather record list (200 OK)
@@ -372,16 +419,38 @@ async def get_location_weather(
                 status_code=400, detail="Start date must be before the end date."
             )
 
-        # Get weather records
-        records = weather_crud.get_weather_by_location(
+        cursor_datetime = None
+        if cursor:
+            try:
+                cursor_datetime = datetime.fromisoformat(cursor.replace("Z", "+00:00"))
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=400, detail=f"Invalid cursor format: {str(e)}"
+                )
+
+        # Get weather records (one extra row tells us whether a next page exists)
+        records = await weather_crud.get_weather_by_location(
             db=db,
             location_id=location_id,
             start_date=start_datetime,
             end_date=end_datetime,
+            before=cursor_datetime,
+            limit=limit + 1 if limit else None,
         )
 
-        # 응답 데이터 구성
-        return records  # ORM 모드를 사용하므로 직접 반환 가능
+        headers = {}
+        if limit and len(records) > limit:
+            records = records[:limit]
+            headers["X-Next-Cursor"] = records[-1].weather_date.isoformat()
+
+        # The whole page is validated and encoded in one pydantic-core call
+        return Response(
+            content=WeatherHistoryListAdapter.dump_json(
+                WeatherHistoryListAdapter.validate_python(records)
+            ),
+            media_type="application/json",
+            headers=headers,
+        )
     except HTTPException:
         raise
     except SQLAlchemyError as e:
@@ -392,16 +461,57 @@ async def get_location_weather(
         )
 
 
+@router.get("/location/{location_id}/stream")
+async def stream_location_weather(
+    location_id: int,
+    start_date: Optional[datetime] = Query(None, description="Start date"),
+    end_date: Optional[datetime] = Query(None, description="End date"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Stream every weather record for a location, newest first, as NDJSON
+    (one JSON object per line). Rows are read and sent in batches, so large
+    date ranges are never held in memory at once.
+    """
+
+    async def lines():
+        async for record in weather_crud.stream_weather_by_location(
+            db=db, location_id=location_id, start_date=start_date, end_date=end_date
+        ):
+            yield WeatherHistoryResponse.model_validate(record).model_dump_json() + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.get("/location/{location_id}/latest", response_model=WeatherLatestResponse)
+async def get_latest_location_weather(
+    location_id: int, db: AsyncSession = Depends(get_db)
+):
+    """
+    Get the most recent temperature, condition and icon for a location.
+    """
+    try:
+        latest = await weather_crud.get_latest_weather(db=db, location_id=location_id)
+        if latest is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No weather records found for location ID {location_id}.",
+            )
+        return WeatherLatestResponse(location_id=location_id, **latest._mapping)
+    except SQLAlchemyError as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
+
 @router.put("/{weather_id}", response_model=WeatherHistoryResponse)
 async def update_weather_record(
-    weather_id: int, data: WeatherHistoryUpdate, db: Session = Depends(get_db)
+    weather_id: int, data: WeatherHistoryUpdate, db: AsyncSession = Depends(get_db)
 ):
     """
     Update a specific weather record.
     """
     try:
         # Check if the record exists
-        existing_record = weather_crud.get_weather_by_id(db, weather_id)
+        existing_record = await weather_crud.get_weather_by_id(db, weather_id)
         if not existing_record:
             raise HTTPException(
                 status_code=404, detail=f"Weather record ID {weather_id} not found."
@@ -428,7 +538,7 @@ async def update_weather_record(
                 status_code=400, detail="Invalid temperature range. (-100°C ~ 100°C)"
             )
 
-        weather = weather_crud.update_weather_record(
+        weather = await weather_crud.update_weather_record(
             db=db, weather_id=weather_id, data=data
         )
         return weather
@@ -443,22 +553,15 @@ async def update_weather_record(
 
 
 @router.delete("/{weather_id}")
-async def delete_weather_record(weather_id: int, db: Session = Depends(get_db)):
+async def delete_weather_record(weather_id: int, db: AsyncSession = Depends(get_db)):
     """
     Delete a specific weather record.
     """
     try:
-        # Check if the record exists
-        existing_record = weather_crud.get_weather_by_id(db, weather_id)
-        if not existing_record:
-            raise HTTPException(
-                status_code=404, detail=f"Weather record ID {weather_id} not found."
-            )
-
-        success = weather_crud.delete_weather_record(db=db, weather_id=weather_id)
+        success = await weather_crud.delete_weather_record(db=db, weather_id=weather_id)
         if not success:
             raise HTTPException(
-                status_code=500, detail="Failed to delete weather record."
+                status_code=404, detail=f"Weather record ID {weather_id} not found."
             )
         return {"message": "Weather record deleted successfully."}
     except HTTPException:
@@ -480,7 +583,7 @@ async def get_weather_forecast(
     end_date: Optional[datetime] = Query(
         None, description="End date (YYYY-MM-DD HH:MM:SS)"
     ),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Get weather forecast for a specific location.
@@ -502,9 +605,15 @@ async def get_weather_forecast(
                 detail="Forecast is only available up to 7 days from now.",
             )
 
-        return weather_crud.get_forecast(
+        records = await weather_crud.get_forecast(
             db=db, location_id=location_id, start_date=start_date, end_date=end_date
         )
+        return Response(
+            content=WeatherHistoryListAdapter.dump_json(
+                WeatherHistoryListAdapter.validate_python(records)
+            ),
+            media_type="application/json",
+        )
     except HTTPException:
         raise
     except SQLAlchemyError as e:
@@ -515,14 +624,16 @@ async def get_weather_forecast(
         )
 
 
-@router.get("/search", response_model=WeatherSearchResponse)
+@router.get(
+    "/search", response_model=WeatherSearchResponse, response_model_exclude_none=True
+)
 async def search_weather(
     query: str = Query(
         ..., description="City name, postal code, or location coordinates"
     ),
     include_forecast: bool = Query(False, description="Include daily forecast"),
     include_hourly: bool = Query(False, description="Include hourly forecast"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Search for a location and get weather information.
@@ -533,8 +644,10 @@ async def search_weather(
     - Provide weather tips
     """
     try:
-        # Search for current weather
-        current = await fetch_current_weather(city=query)
+        # Current weather and the requested forecasts are fetched concurrently
+        current, forecast, hourly = await fetch_weather_bundle(
+            query, include_forecast=include_forecast, include_hourly=include_hourly
+        )
         if not current:
             return WeatherSearchResponse(
                 success=False, error="Weather information not found."
@@ -550,24 +663,14 @@ async def search_weather(
 
         # Create search result object
         result = WeatherSearchResult(
-            location=location, current_weather=current, last_updated=datetime.now()
+            location=location,
+            current_weather=current,
+            last_updated=datetime.now(),
+            daily_forecast=forecast.forecast if forecast else None,
+            hourly_forecast=hourly.hourly_forecast if hourly else None,
+            weather_tip=get_weather_tip(current.condition),
         )
 
-        # Get daily forecast (optional)
-        if include_forecast:
-            forecast = await fetch_forecast(city=query)
-            if forecast:
-                result.daily_forecast = forecast.forecast
-
-        # Get hourly forecast (optional)
-        if include_hourly:
-            hourly = await fetch_hourly_weather(city=query)
-            if hourly:
-                result.hourly_forecast = hourly.hourly_forecast
-
-        # Add weather tip
-        result.weather_tip = get_weather_tip(current.condition)
-
         return WeatherSearchResponse(
             success=True,
             message="Weather information retrieved successfully.",
@@ -0,0 +1,165 @@
+"""
+Module: core.cache
+------------------
+
+Redis response cache for hot read endpoints.
+
+Caching is enabled only when `REDIS_URL` is set; without it (or when Redis is
+unreachable) the decorated endpoints simply run uncached.
+"""
+
+import logging
+from functools import lru_cache, wraps
+from typing import Optional, Tuple
+
+import orjson
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Only plain query values take part in the cache key (skips db sessions etc.)
+_KEY_TYPES = (str, int, float, bool, type(None))
+
+
+@lru_cache(maxsize=1)
+def get_redis() -> Optional[aioredis.Redis]:
+    """Returns the shared Redis client, or None when caching is disabled"""
+    if not settings.redis_url:
+        return None
+    return aioredis.from_url(settings.redis_url)
+
+
+async def close_redis() -> None:
+    """Closes the shared Redis client, if one was created"""
+    if get_redis.cache_info().currsize:
+        client = get_redis()
+        if client is not None:
+            await client.aclose()
+        get_redis.cache_clear()
+
+
+def build_cache_key(prefix: str, **kwargs) -> str:
+    return f"{settings.cache_prefix}:{prefix}:" + ":".join(
+        f"{k}={v}" for k, v in sorted(kwargs.items())
+    )
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """Returns the cached JSON bytes for `key`, or None on a miss or error"""
+    redis = get_redis()
+    if redis is None:
+        return None
+    try:
+        return await redis.get(key)
+    except RedisError as e:
+        logger.warning("Redis GET failed for %s: %s", key, e)
+        return None
+
+
+async def cache_set(key: str, value, expire: int) -> None:
+    """Stores `value` as JSON under `key` for `expire` seconds"""
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        await redis.set(key, orjson.dumps(jsonable_encoder(value)), ex=expire)
+    except RedisError as e:
+        logger.warning("Redis SET failed for %s: %s", key, e)
+
+
+async def cache_delete(key: str) -> None:
+    """Drops the cached entry under `key`, if any"""
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        await redis.delete(key)
+    except RedisError as e:
+        logger.warning("Redis DELETE failed for %s: %s", key, e)
+
+
+async def invalidate_prefix(prefix: str) -> None:
+    """Drops every cached entry built with `build_cache_key(prefix, ...)`"""
+    redis = get_redis()
+    if redis is None:
+        return
+    pattern = f"{settings.cache_prefix}:{prefix}:*"
+    try:
+        keys = [key async for key in redis.scan_iter(match=pattern, count=500)]
+        if keys:
+            await redis.delete(*keys)
+    except RedisError as e:
+        logger.warning("Redis invalidation failed for %s: %s", pattern, e)
+
+
+async def cache_get_with_ttl(key: str) -> Tuple[Optional[bytes], int]:
+    """Like cache_get, also returning the entry's remaining TTL in seconds"""
+    redis = get_redis()
+    if redis is None:
+        return None, 0
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            value, ttl = await pipe.get(key).ttl(key).execute()
+    except RedisError as e:
+        logger.warning("Redis GET failed for %s: %s", key, e)
+        return None, 0
+    return value, max(ttl, 0)
+
+
+def cached(
+    prefix: str, expire: int = 300, response_model=None, cache_control: bool = False
+):
+    """
+    Cache an endpoint's JSON response in Redis for `expire` seconds.
+
+    Hits are returned as raw JSON bytes, skipping the endpoint entirely, so
+    pass the route's `response_model` to store the filtered response rather
+    than the endpoint's raw return value. With `cache_control`, responses
+    carry a public Cache-Control max-age of the entry's remaining lifetime:
+    `expire` when freshly computed, the Redis TTL on a hit. The endpoint
+    must then take a `response: Response` parameter.
+    """
+
+    fresh_cache_control = f"public, max-age={expire}"
+
+    def decorator(func):
+        async def call(args, kwargs):
+            result = await func(*args, **kwargs)
+            if cache_control:
+                kwargs["response"].headers["Cache-Control"] = fresh_cache_control
+            return result
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            if get_redis() is None:
+                return await call(args, kwargs)
+
+            key = build_cache_key(
+                prefix,
+                **{k: v for k, v in kwargs.items() if isinstance(v, _KEY_TYPES)},
+            )
+            if cache_control:
+                hit, ttl = await cache_get_with_ttl(key)
+                headers = {"Cache-Control": f"public, max-age={ttl}"}
+            else:
+                hit, headers = await cache_get(key), None
+            if hit is not None:
+                return Response(
+                    content=hit, media_type="application/json", headers=headers
+                )
+
+            result = await call(args, kwargs)
+            payload = result
+            if response_model is not None:
+                payload = response_model.model_validate(result).model_dump(mode="json")
+            await cache_set(key, payload, expire)
+            return result
+
+        return wrapper
+
+    return decorator
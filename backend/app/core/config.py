@@ -9,7 +9,7 @@ database connections, and other environment-specific variables.
 from functools import lru_cache
 from typing import Optional
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -24,6 +24,9 @@ class Settings(BaseSettings):
     openweather_api_url: str = "https://api.openweathermap.org/data/2.5"
     youtube_api_url: str = "https://www.googleapis.com/youtube/v3"
 
+    # Outbound OpenWeather calls per minute (free tier allows 60)
+    openweather_rate_limit: int = 50
+
     # Database settings
     postgres_user: str = "postgres"
     postgres_password: str = "postgres"
@@ -33,13 +36,41 @@ class Settings(BaseSettings):
 
     database_url: Optional[str] = None
 
-    class Config:
-        env_file = ".env"
+    # Connection pool settings (DB_POOL_SIZE, DB_MAX_OVERFLOW, ...)
+    # max_overflow of -1 leaves the connection ceiling to the database server
+    db_pool_size: int = 50
+    db_max_overflow: int = -1
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_pre_ping: bool = False
+    warmup_pool: bool = False
+
+    # Redis response cache (disabled when REDIS_URL is unset)
+    redis_url: Optional[str] = None
+    cache_prefix: str = "wx"
+
+    # Weather history older than this is purged by scripts/purge_weather_history.py
+    weather_retention_days: int = 365
+
+    # Optional routers (ENABLE_INTEGRATIONS=0 skips the 3rd-party endpoints)
+    enable_integrations: bool = True
+
+    # Search history is written in background batches; SEARCH_HISTORY_ASYNC=0
+    # inserts each search before the response instead
+    search_history_async: bool = True
+
+    # DEBUG=1 returns full validation error details (input, ctx, url)
+    debug: bool = False
+
+    # CORS
+    allowed_origins: str = "http://localhost,http://localhost:3000"
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 
 @lru_cache()
 def get_settings() -> Settings:
-    """Returns cached settings instance"""
+    """Returns cached settings instance (environment is parsed once)"""
     return Settings()
 
 
@@ -1,28 +1,171 @@
-from typing import Generator
+"""
+Module: core.database
+---------------------
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import Session, sessionmaker
+Async engine, session factory and declarative base.
+
+`pool_pre_ping` is off by default: it costs a `SELECT 1` round-trip on every
+connection checkout in exchange for transparently replacing connections the
+server has dropped. Set `DB_PRE_PING=1` where connections are unreliable;
+otherwise `pool_recycle` still retires idle connections before the server
+times them out.
+"""
+
+import asyncio
+from asyncio import current_task
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, Optional
+
+import asyncpg
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import get_database_url, settings
+
+__all__ = [
+    "Base",
+    "DBSessionMiddleware",
+    "ScopedSession",
+    "SessionLocal",
+    "close_asyncpg_pool",
+    "engine",
+    "get_asyncpg_pool",
+    "get_db",
+    "get_db_session",
+    "get_engine",
+    "warm_up_pool",
+]
+
+
+def to_async_url(url: str) -> str:
+    """Rewrite a sync database URL to use its asyncio driver."""
+    if url.startswith("postgresql://"):
+        return "postgresql+asyncpg://" + url[len("postgresql://") :]
+    if url.startswith("sqlite:///"):
+        return "sqlite+aiosqlite:///" + url[len("sqlite:///") :]
+    return url
 
-from app.core.config import get_database_url
 
 # Get database URL from config (respects DATABASE_URL env var)
-DATABASE_URL = get_database_url()
+DATABASE_URL = to_async_url(get_database_url())
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    """Returns the process-wide async engine (one connection pool per process)"""
+    # Pool waits yield to the event loop; DB_MAX_OVERFLOW=-1 removes the cap
+    async_engine = create_async_engine(
+        DATABASE_URL,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_pre_ping=settings.db_pre_ping,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+    )
+    if async_engine.dialect.name == "sqlite":
+        event.listen(async_engine.sync_engine, "connect", _enable_sqlite_foreign_keys)
+    return async_engine
+
+
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record) -> None:
+    # SQLite only enforces FKs (and ON DELETE CASCADE) when enabled per connection
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+engine = get_engine()
+
+
+async def warm_up_pool() -> None:
+    """Opens pool_size connections up front so first requests skip connect cost"""
+
+    async def _ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_ping() for _ in range(engine.pool.size())))
+
+
+# Native asyncpg pool for bulk COPY work, created on first use (Postgres only)
+_asyncpg_pool: Optional[asyncpg.Pool] = None
+# Created inside the running loop; serializes the first concurrent callers
+_asyncpg_pool_lock: Optional[asyncio.Lock] = None
+
+
+async def get_asyncpg_pool() -> asyncpg.Pool:
+    """Returns the process-wide asyncpg pool used for COPY fast paths"""
+    global _asyncpg_pool, _asyncpg_pool_lock
+    if _asyncpg_pool is None:
+        if _asyncpg_pool_lock is None:
+            _asyncpg_pool_lock = asyncio.Lock()
+        async with _asyncpg_pool_lock:
+            if _asyncpg_pool is None:
+                _asyncpg_pool = await asyncpg.create_pool(
+                    dsn=DATABASE_URL.replace("+asyncpg", "", 1),
+                    min_size=2,
+                    max_size=20,
+                )
+    return _asyncpg_pool
+
+
+async def close_asyncpg_pool() -> None:
+    """Closes the asyncpg pool, if one was created"""
+    global _asyncpg_pool
+    if _asyncpg_pool is not None:
+        await _asyncpg_pool.close()
+        _asyncpg_pool = None
 
-# Create SQLAlchemy engine
-engine = create_engine(DATABASE_URL, pool_pre_ping=True, pool_size=5, max_overflow=10)
 
 # Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = async_sessionmaker(
+    engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+)
+
 
 # Create Base class
-Base = declarative_base()
+class Base(DeclarativeBase):
+    pass
+
+
+# One session per request task; DBSessionMiddleware removes it afterwards
+ScopedSession = async_scoped_session(SessionLocal, scopefunc=current_task)
+
+
+async def get_db() -> AsyncSession:
+    """Function to get the database session bound to the current request"""
+    return ScopedSession()
+
+
+@asynccontextmanager
+async def get_db_session() -> AsyncIterator[AsyncSession]:
+    """Session for work outside a request; commits on success, rolls back on error"""
+    async with SessionLocal() as db:
+        async with db.begin():
+            yield db
+
+
+class DBSessionMiddleware:
+    """ASGI middleware that closes the request's scoped session when it ends"""
 
+    def __init__(self, app):
+        self.app = app
 
-def get_db() -> Generator[Session, None, None]:
-    """Function to create and manage database sessions"""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            await ScopedSession.remove()
@@ -0,0 +1,32 @@
+"""
+Module: core.http
+-----------------
+
+Shared outbound HTTP client for calls to OpenWeather and other third-party APIs.
+
+One pooled client per process keeps TCP/TLS connections alive between requests
+instead of handshaking on every call; it is closed from the app lifespan.
+"""
+
+from functools import lru_cache
+
+import httpx
+
+# Default per-request timeout (seconds); callers may override per call
+HTTP_TIMEOUT = 10.0
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.AsyncClient:
+    """Returns the shared outbound HTTP client"""
+    return httpx.AsyncClient(
+        timeout=HTTP_TIMEOUT,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    )
+
+
+async def close_http_client() -> None:
+    """Closes the shared HTTP client, if one was created"""
+    if get_http_client.cache_info().currsize:
+        await get_http_client().aclose()
+        get_http_client.cache_clear()
@@ -0,0 +1,23 @@
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.export import ExportHistory
+from app.schemas.export import ExportHistoryCreate
+
+
+async def create_export_record(
+    db: AsyncSession,
+    data: ExportHistoryCreate,
+    status: str = "success",
+    error_message: Optional[str] = None,
+) -> ExportHistory:
+    """
+    Create a single export history record.
+    """
+    db_export = ExportHistory(
+        **data.model_dump(), status=status, error_message=error_message
+    )
+    db.add(db_export)
+    await db.commit()
+    return db_export
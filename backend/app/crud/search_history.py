@@ -0,0 +1,24 @@
+from typing import List, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.search_history import SearchHistory
+
+
+async def add_search_history_entries(
+    db: AsyncSession, entries: List[Tuple[int, str]]
+) -> int:
+    """
+    Record (user_id, query) search entries in one transaction.
+    All rows go out in a single executemany INSERT instead of one
+    round trip (and commit) per query. Returns the number of rows added.
+    """
+    if not entries:
+        return 0
+    await db.execute(
+        insert(SearchHistory),
+        [{"user_id": user_id, "query": query} for user_id, query in entries],
+    )
+    await db.commit()
+    return len(entries)
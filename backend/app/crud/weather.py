@@ -1,96 +1,421 @@
+from collections import defaultdict
 from datetime import datetime
-from typing import List, Optional
+from decimal import Decimal
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
 
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    Row,
+    column,
+    delete,
+    func,
+    insert,
+    lambda_stmt,
+    select,
+    table,
+    true,
+    update,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.models import WeatherHistory
+from app.core.database import get_asyncpg_pool
+from app.models.models import SearchLocation, WeatherHistory
 from app.schemas.weather import WeatherHistoryCreate, WeatherHistoryUpdate
 
 
-def create_weather_record(db: Session, data: WeatherHistoryCreate) -> WeatherHistory:
+async def create_weather_record(
+    db: AsyncSession, data: WeatherHistoryCreate
+) -> WeatherHistory:
     """
     Create a new weather record.
+    Generated columns come back through RETURNING, so no refresh is needed.
     """
-    db_weather = WeatherHistory(**data.dict())
-    db.add(db_weather)
-    db.commit()
-    db.refresh(db_weather)
+    db_weather = await db.scalar(
+        insert(WeatherHistory).values(**data.model_dump()).returning(WeatherHistory)
+    )
+    await db.commit()
     return db_weather
 
 
-def get_weather_by_id(db: Session, weather_id: int) -> Optional[WeatherHistory]:
+# Rows per INSERT statement for bulk ingestion
+BULK_INSERT_CHUNK_SIZE = 500
+
+# Batches larger than this are loaded with COPY on Postgres
+COPY_THRESHOLD = 1000
+
+# Dialects whose INSERT supports ON CONFLICT DO NOTHING
+_CONFLICT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+# Temporary table each COPY group streams into before merging into weather_history
+_STAGING_TABLE = "weather_history_load"
+
+
+# Natural key of a weather record; never changed by an overwrite
+_KEY_FIELDS = ("location_id", "weather_date")
+
+
+def _on_conflict(stmt, overwrite: bool, columns: Sequence[str]):
+    """
+    Skip rows that already exist for (location_id, weather_date), or update
+    the given `columns` from the incoming values when `overwrite` is set.
+    """
+    if not overwrite:
+        return stmt.on_conflict_do_nothing(index_elements=list(_KEY_FIELDS))
+    return stmt.on_conflict_do_update(
+        index_elements=list(_KEY_FIELDS),
+        set_={
+            **{
+                name: stmt.excluded[name] for name in columns if name not in _KEY_FIELDS
+            },
+            "updated_at": func.now(),
+        },
+    )
+
+
+def _group_rows(
+    records: List[WeatherHistoryCreate], overwrite: bool
+) -> Dict[Tuple[str, ...], List[dict]]:
+    """
+    Dump records to rows holding only the fields the client set, so an
+    overwrite never nulls out stored values the client left out, and group
+    them by column set (one INSERT per group).
+    A (location_id, weather_date) seen twice is folded into one row: later
+    fields win when overwriting, otherwise the later row is dropped as the
+    insert would skip it. ON CONFLICT DO UPDATE cannot touch the same row
+    twice in one statement.
+    """
+    rows: Dict[tuple, dict] = {}
+    for record in records:
+        row = record.model_dump(exclude_unset=True)
+        key = tuple(row[name] for name in _KEY_FIELDS)
+        if key not in rows:
+            rows[key] = row
+        elif overwrite:
+            rows[key].update(row)
+
+    groups: Dict[Tuple[str, ...], List[dict]] = defaultdict(list)
+    for row in rows.values():
+        columns = tuple(
+            name for name in WeatherHistoryCreate.model_fields if name in row
+        )
+        groups[columns].append(row)
+    return groups
+
+
+async def bulk_create_weather_records(
+    db: AsyncSession, records: List[WeatherHistoryCreate], overwrite: bool = False
+) -> int:
+    """
+    Create many weather records in one transaction.
+    Rows are sent as plain dicts in multi-row INSERT statements of
+    BULK_INSERT_CHUNK_SIZE, skipping per-object unit-of-work bookkeeping;
+    loads above COPY_THRESHOLD on Postgres are streamed with COPY instead.
+    Rows that already exist for the same (location_id, weather_date) are
+    skipped, or have the fields the client set updated in place when
+    `overwrite` is set (a single INSERT ... ON CONFLICT DO UPDATE, no
+    existence check beforehand).
+    Returns the number of rows inserted or updated.
+    """
+    groups = _group_rows(records, overwrite)
+    dialect_name = db.bind.dialect.name
+    if len(records) > COPY_THRESHOLD and dialect_name == "postgresql":
+        return await _copy_weather_records(groups, overwrite)
+
+    dialect_insert = _CONFLICT_INSERTS.get(dialect_name)
+    written = 0
+    for columns, rows in groups.items():
+        if dialect_insert is None:
+            stmt = insert(WeatherHistory)
+        else:
+            stmt = _on_conflict(dialect_insert(WeatherHistory), overwrite, columns)
+        stmt = stmt.returning(WeatherHistory.id)
+        for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+            result = await db.execute(
+                stmt, rows[start : start + BULK_INSERT_CHUNK_SIZE]
+            )
+            written += len(result.all())
+    await db.commit()
+    return written
+
+
+async def _copy_weather_records(
+    groups: Dict[Tuple[str, ...], List[dict]], overwrite: bool
+) -> int:
+    """
+    COPY each group of rows into a temporary staging table over asyncpg,
+    then merge it into weather_history with one INSERT ... SELECT ... ON
+    CONFLICT, all in one transaction.
+    """
+    written = 0
+    pool = await get_asyncpg_pool()
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            for columns, rows in groups.items():
+                staging = table(_STAGING_TABLE, *(column(name) for name in columns))
+                merge = _on_conflict(
+                    pg_insert(WeatherHistory).from_select(columns, select(staging)),
+                    overwrite,
+                    columns,
+                )
+                records = []
+                for row in rows:
+                    # COPY encodes NUMERIC columns from Decimal
+                    if row.get("uvi") is not None:
+                        row["uvi"] = Decimal(str(row["uvi"]))
+                    records.append(tuple(row[name] for name in columns))
+
+                await conn.execute(
+                    f"CREATE TEMP TABLE {_STAGING_TABLE} AS "
+                    f"SELECT {', '.join(columns)} FROM weather_history WITH NO DATA"
+                )
+                await conn.copy_records_to_table(
+                    _STAGING_TABLE, records=records, columns=columns
+                )
+                status = await conn.execute(
+                    str(merge.compile(dialect=postgresql.dialect()))
+                )
+                await conn.execute(f"DROP TABLE {_STAGING_TABLE}")
+                # Command tag is "INSERT 0 <rows>"
+                written += int(status.rsplit(" ", 1)[1])
+    return written
+
+
+async def get_weather_by_id(
+    db: AsyncSession, weather_id: int
+) -> Optional[WeatherHistory]:
     """
     Get a weather record by ID.
+    A record already loaded in this session is returned without a query.
     """
-    return db.query(WeatherHistory).filter(WeatherHistory.id == weather_id).first()
+    return await db.get(WeatherHistory, weather_id)
+
+
+# Read-only list paths select the table itself: rows come back as plain
+# Core Rows (attribute access by column name) without ORM instances or
+# identity-map bookkeeping
+_weather_table = WeatherHistory.__table__
 
 
-def get_weather_by_location(
-    db: Session,
+async def get_weather_by_location(
+    db: AsyncSession,
     location_id: int,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-) -> List[WeatherHistory]:
+    before: Optional[datetime] = None,
+    limit: Optional[int] = None,
+) -> List[Row]:
     """
-    Get weather records by location ID.
+    Get weather records by location ID, newest first, as read-only rows.
     You can specify the date range.
+
+    For keyset pagination pass the `weather_date` of the last row seen as
+    `before` together with a `limit`; each page is an index range scan and
+    never needs a COUNT over the table.
     """
-    query = db.query(WeatherHistory).filter(WeatherHistory.location_id == location_id)
+    # lambda_stmt caches each variant's compiled SQL; the closure values
+    # (location_id, dates, limit) are extracted as bound parameters per call
+    stmt = lambda_stmt(
+        lambda: select(_weather_table).where(WeatherHistory.location_id == location_id)
+    )
+    if start_date:
+        stmt += lambda s: s.where(WeatherHistory.weather_date >= start_date)
+    if end_date:
+        stmt += lambda s: s.where(WeatherHistory.weather_date <= end_date)
+    if before:
+        stmt += lambda s: s.where(WeatherHistory.weather_date < before)
+
+    stmt += lambda s: s.order_by(WeatherHistory.weather_date.desc())
+    if limit is not None:
+        stmt += lambda s: s.limit(limit)
+    result = await db.execute(stmt)
+    return list(result.all())
+
+
+# Rows fetched per round trip when streaming records
+STREAM_BATCH_SIZE = 500
+
 
+async def stream_weather_by_location(
+    db: AsyncSession,
+    location_id: int,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+) -> AsyncIterator[Row]:
+    """
+    Yield weather records for a location, newest first, without loading the
+    whole range: rows come from a server-side cursor STREAM_BATCH_SIZE at a
+    time, so memory stays flat however long the date range is.
+    """
+    stmt = select(_weather_table).where(WeatherHistory.location_id == location_id)
     if start_date:
-        query = query.filter(WeatherHistory.weather_date >= start_date)
+        stmt = stmt.where(WeatherHistory.weather_date >= start_date)
     if end_date:
-        query = query.filter(WeatherHistory.weather_date <= end_date)
+        stmt = stmt.where(WeatherHistory.weather_date <= end_date)
+    stmt = stmt.order_by(WeatherHistory.weather_date.desc()).execution_options(
+        yield_per=STREAM_BATCH_SIZE
+    )
+
+    result = await db.stream(stmt)
+    async for record in result:
+        yield record
+
 
-    return query.order_by(WeatherHistory.weather_date.desc()).all()
+async def get_latest_weather(db: AsyncSession, location_id: int) -> Optional[Row]:
+    """
+    Get the newest weather_date, temp_c, condition and icon for a location.
+    Only columns held in ix_weather_location_date are selected, so on
+    Postgres this is answered from the index without touching the table.
+    """
+    result = await db.execute(
+        lambda_stmt(
+            lambda: select(
+                WeatherHistory.weather_date,
+                WeatherHistory.temp_c,
+                WeatherHistory.condition,
+                WeatherHistory.icon,
+            )
+            .where(WeatherHistory.location_id == location_id)
+            .order_by(WeatherHistory.weather_date.desc())
+            .limit(1)
+        )
+    )
+    return result.first()
 
 
-def update_weather_record(
-    db: Session, weather_id: int, data: WeatherHistoryUpdate
+async def get_latest_weather_per_location(db: AsyncSession) -> List[Row]:
+    """
+    Get the newest location_id, weather_date, temp_c, condition and icon for
+    every location that has weather records.
+    On Postgres each location is a LATERAL ... LIMIT 1 probe of the covering
+    ix_weather_location_date index, so the cost scales with the number of
+    locations rather than the size of weather_history.
+    """
+    if db.bind.dialect.name == "postgresql":
+        latest = (
+            select(
+                WeatherHistory.weather_date,
+                WeatherHistory.temp_c,
+                WeatherHistory.condition,
+                WeatherHistory.icon,
+            )
+            .where(WeatherHistory.location_id == SearchLocation.id)
+            .order_by(WeatherHistory.weather_date.desc())
+            .limit(1)
+            .lateral()
+        )
+        stmt = select(
+            SearchLocation.id.label("location_id"),
+            latest.c.weather_date,
+            latest.c.temp_c,
+            latest.c.condition,
+            latest.c.icon,
+        ).join(latest, true())
+    else:
+        newest = (
+            select(
+                WeatherHistory.location_id,
+                func.max(WeatherHistory.weather_date).label("weather_date"),
+            )
+            .group_by(WeatherHistory.location_id)
+            .subquery()
+        )
+        stmt = select(
+            WeatherHistory.location_id,
+            WeatherHistory.weather_date,
+            WeatherHistory.temp_c,
+            WeatherHistory.condition,
+            WeatherHistory.icon,
+        ).join(
+            newest,
+            (WeatherHistory.location_id == newest.c.location_id)
+            & (WeatherHistory.weather_date == newest.c.weather_date),
+        )
+    result = await db.execute(stmt.order_by("location_id"))
+    return list(result.all())
+
+
+async def update_weather_record(
+    db: AsyncSession, weather_id: int, data: WeatherHistoryUpdate
 ) -> Optional[WeatherHistory]:
     """
     Update a weather record.
+    A single UPDATE ... RETURNING both checks the record exists and returns
+    its new state; None when there is no record with that ID.
     """
-    db_weather = get_weather_by_id(db, weather_id)
-    if not db_weather:
-        return None
-
-    for key, value in data.dict(exclude_unset=True).items():
-        setattr(db_weather, key, value)
+    values = data.model_dump(exclude_unset=True)
+    if not values:
+        return await get_weather_by_id(db, weather_id)
 
-    db.commit()
-    db.refresh(db_weather)
+    db_weather = await db.scalar(
+        update(WeatherHistory)
+        .where(WeatherHistory.id == weather_id)
+        .values(**values)
+        .returning(WeatherHistory)
+        .execution_options(populate_existing=True)
+    )
+    await db.commit()
     return db_weather
 
 
-def delete_weather_record(db: Session, weather_id: int) -> bool:
+async def delete_weather_record(db: AsyncSession, weather_id: int) -> bool:
     """
     Delete a weather record.
+    Issues a single DELETE and reports whether a row was removed.
     """
-    db_weather = get_weather_by_id(db, weather_id)
-    if not db_weather:
-        return False
+    result = await db.execute(
+        delete(WeatherHistory).where(WeatherHistory.id == weather_id)
+    )
+    await db.commit()
+    return result.rowcount == 1
 
-    db.delete(db_weather)
-    db.commit()
-    return True
 
+# Rows per DELETE statement when purging old history
+PURGE_BATCH_SIZE = 5000
 
-def get_forecast(
-    db: Session,
+
+async def purge_weather_records_before(db: AsyncSession, cutoff: datetime) -> int:
+    """
+    Delete weather records dated before `cutoff`, PURGE_BATCH_SIZE rows per
+    committed batch so locks stay short. Returns the number of rows removed.
+    """
+    old_ids = (
+        select(WeatherHistory.id)
+        .where(WeatherHistory.weather_date < cutoff)
+        .limit(PURGE_BATCH_SIZE)
+        .scalar_subquery()
+    )
+    stmt = delete(WeatherHistory).where(WeatherHistory.id.in_(old_ids))
+
+    removed = 0
+    while True:
+        result = await db.execute(stmt)
+        await db.commit()
+        removed += result.rowcount
+        if result.rowcount < PURGE_BATCH_SIZE:
+            return removed
+
+
+async def get_forecast(
+    db: AsyncSession,
     location_id: int,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-) -> List[WeatherHistory]:
+) -> List[Row]:
     """
-    Get weather forecast by location ID.
+    Get weather forecast by location ID as read-only rows.
     You can specify the date range.
     """
-    query = db.query(WeatherHistory).filter(WeatherHistory.location_id == location_id)
-
+    # Same lambda_stmt caching as get_weather_by_location
+    stmt = lambda_stmt(
+        lambda: select(_weather_table).where(WeatherHistory.location_id == location_id)
+    )
     if start_date:
-        query = query.filter(WeatherHistory.weather_date >= start_date)
+        stmt += lambda s: s.where(WeatherHistory.weather_date >= start_date)
     if end_date:
-        query = query.filter(WeatherHistory.weather_date <= end_date)
+        stmt += lambda s: s.where(WeatherHistory.weather_date <= end_date)
 
-    return query.order_by(WeatherHistory.weather_date.asc()).all()
+    stmt += lambda s: s.order_by(WeatherHistory.weather_date.asc())
+    result = await db.execute(stmt)
+    return list(result.all())
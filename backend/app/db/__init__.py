@@ -1 +1,5 @@
-# from .database import Base, SessionLocal, engine, get_db
+# The database layer lives in app.core.database; re-export it so there is
+# a single engine and connection pool per process.
+from app.core.database import Base, SessionLocal, engine, get_db
+
+__all__ = ["Base", "SessionLocal", "engine", "get_db"]
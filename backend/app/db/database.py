@@ -0,0 +1,3 @@
+# backend/app/db/database.py
+# Compatibility path: the one database module is app.core.database.
+from app.core.database import *  # noqa: F401,F403
@@ -1,12 +1,15 @@
 # backend/app/db/init_db.py
+import asyncio
+
 from app.core.database import Base, engine
 
 # from app.models.export import ExportHistory  # Add other models too
 
 
-def init():
-    Base.metadata.create_all(bind=engine)
+async def init():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
 
 
 if __name__ == "__main__":
-    init()
+    asyncio.run(init())
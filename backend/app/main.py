@@ -1,35 +1,65 @@
+import importlib
 import logging
-import os
-from pathlib import Path as FilePath
+from contextlib import asynccontextmanager
 
-from dotenv import load_dotenv
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 # Import your internal modules here
-from app.api import export, integrations, search_location, weather, weather_history
-from app.core.database import Base, engine
+from app.core.cache import close_redis
+from app.core.config import settings
+from app.core.database import (
+    DBSessionMiddleware,
+    close_asyncpg_pool,
+    engine,
+    get_engine,
+    warm_up_pool,
+)
+from app.core.http import close_http_client
+from app.db import database as db_compat
+from app.db.init_db import init as init_db
+from app.services.search_history_service import (
+    start_search_history_writer,
+    stop_search_history_writer,
+)
 from app.utils.errors import register_exception_handlers
 
-# Load environment variables
-try:
-    env_path = FilePath(__file__).resolve().parent.parent / ".env"
-    load_dotenv(dotenv_path=env_path)
-except Exception as e:
-    logging.warning(f"Could not load .env file: {e}")
-
 # Logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Create DB tables
-Base.metadata.create_all(bind=engine)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Exactly one engine (and connection pool) per process
+    if get_engine.cache_info().currsize > 1 or db_compat.engine is not engine:
+        raise RuntimeError("More than one database engine was created")
+    # Create DB tables once at startup instead of on import
+    await init_db()
+    # Open the pool's connections before traffic arrives (WARMUP_POOL=1)
+    if settings.warmup_pool:
+        await warm_up_pool()
+    if settings.search_history_async:
+        start_search_history_writer()
+    yield
+    # Write out queued search history while the pool is still open
+    await stop_search_history_writer()
+    # Close pooled connections on shutdown
+    await engine.dispose()
+    await close_asyncpg_pool()
+    await close_redis()
+    await close_http_client()
+
 
 # ✅ FastAPI instance (this must be exposed at top-level)
 app = FastAPI(
     title="Weather App API",
     description="API for Weather App with API integration",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     openapi_tags=[
         {"name": "Weather", "description": "Endpoints for weather data and forecasts"},
         {"name": "Location", "description": "Location search and aliases"},
@@ -44,32 +74,55 @@ app = FastAPI(
 # Global exception handling
 register_exception_handlers(app)
 
-# CORS
-origins = os.getenv("ALLOWED_ORIGINS", "http://localhost,http://localhost:3000").split(
-    ","
+# CORS (blank/duplicate origins are dropped; no origins means no middleware)
+origins = tuple(
+    dict.fromkeys(o.strip() for o in settings.allowed_origins.split(",") if o.strip())
 )
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+if origins:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=origins,
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+        allow_headers=["Authorization", "Content-Type"],
+        expose_headers=["X-Next-Cursor"],
+    )
 
-# Include routers
-app.include_router(weather.router, prefix="/api/weather", tags=["Weather"])
-app.include_router(search_location.router, prefix="/api/location", tags=["Location"])
-app.include_router(export.router, prefix="/api/export", tags=["Export"])
-app.include_router(
-    integrations.router, prefix="/api/integrations", tags=["Integrations"]
-)
-app.include_router(
-    weather_history.router, prefix="/api/weather-history", tags=["Weather History"]
+# Close the request-scoped DB session once each request finishes
+app.add_middleware(DBSessionMiddleware)
+
+# Routers: (module, prefix, tag, enabled). Disabled modules are never imported.
+ROUTERS = (
+    ("app.api.weather", "/api/weather", "Weather", True),
+    ("app.api.search_location", "/api/location", "Location", True),
+    ("app.api.export", "/api/export", "Export", True),
+    (
+        "app.api.integrations",
+        "/api/integrations",
+        "Integrations",
+        settings.enable_integrations,
+    ),
+    ("app.api.weather_history", "/api/weather-history", "Weather History", True),
 )
 
+for module, prefix, tag, enabled in ROUTERS:
+    if enabled:
+        router = importlib.import_module(module).router
+        app.include_router(router, prefix=prefix, tags=[tag])
+
+
+# Static payloads are encoded once at import instead of on every request
+_ROOT_BYTES = orjson.dumps({"message": "Welcome to the Weather App API"})
+_HELLO_BYTES = orjson.dumps({"message": "Hello from Vercel FastAPI 🎉"})
+
+
+@app.get("/")
+async def root():
+    return Response(content=_ROOT_BYTES, media_type="application/json")
+
 
 # ✅ A simple default endpoint (test용)
 @app.get("/api/hello")
 async def hello():
-    return {"message": "Hello from Vercel FastAPI 🎉"}
+    return Response(content=_HELLO_BYTES, media_type="application/json")
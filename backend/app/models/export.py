@@ -35,9 +35,13 @@ Benefits:
 - Supports compliance with data governance policies.
 """
 
-import datetime
+from datetime import datetime
+from typing import Any, Dict, Optional
 
-from sqlalchemy import JSON, Column, DateTime, Integer, String  # ForeignKey
+from sqlalchemy import JSON, CheckConstraint, DateTime, Index, String  # ForeignKey
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
 
 from app.core.database import Base
 
@@ -49,18 +53,33 @@ from app.core.database import Base
 
 class ExportHistory(Base):
     __tablename__ = "export_history"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # Serves "recent exports for a user" without a scan + sort
+        Index("ix_export_user_created", "user_id", "created_at"),
+        # Containment lookups (export_params @> '{...}') on Postgres
+        Index("ix_export_params_gin", "export_params", postgresql_using="gin"),
+        CheckConstraint("export_type IN ('csv', 'json', 'pdf')", name="ck_export_type"),
+        CheckConstraint(
+            "status IN ('pending', 'success', 'failed')", name="ck_export_status"
+        ),
+    )
+    # Load server-generated columns (created_at) back on INSERT
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
     # user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
-    export_type = Column(String, nullable=False)  # e.g., "csv"
-    export_params = Column(
-        JSON, nullable=True
-    )  # JSON storing filters, date ranges, etc.
-    status = Column(
-        String, nullable=False, default="pending"
+    user_id: Mapped[Optional[int]]
+    export_type: Mapped[str] = mapped_column(String(16))  # e.g., "csv"
+    # JSON storing filters, date ranges, etc. (binary JSONB on Postgres)
+    export_params: Mapped[Optional[Dict[str, Any]]] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql")
+    )
+    status: Mapped[str] = mapped_column(
+        String(16), default="pending"
     )  # pending, success, failed
-    error_message = Column(String, nullable=True)
-    created_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+    error_message: Mapped[Optional[str]] = mapped_column(String)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
 
     # user = relationship("User", back_populates="exports")
@@ -5,14 +5,18 @@
 from sqlalchemy import (
     JSON,
     Column,
+    Computed,
     DateTime,
     Float,
     ForeignKey,
     Index,
     Integer,
+    Numeric,
+    SmallInteger,
     String,
     func,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -21,7 +25,7 @@ from app.core.database import Base
 class SearchLocation(Base):
     __tablename__ = "search_locations"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     label = Column(String, nullable=True)  # Custom label
     city = Column(String, nullable=False)
     state = Column(String, nullable=True)
@@ -29,7 +33,9 @@ class SearchLocation(Base):
     postal_code = Column(String, nullable=True)
     latitude = Column(Float, nullable=False)
     longitude = Column(Float, nullable=False)
-    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
 
     # Unique constraint for location coordinates
     __table_args__ = (
@@ -38,11 +44,25 @@ class SearchLocation(Base):
     )
 
     # Define relationships
+    # Never lazy-loaded: queries that need the records opt in with
+    # selectinload() so a list of N locations costs 2 queries, not 1 + N.
+    # Deleting a location is a single DELETE: the FK's ON DELETE CASCADE
+    # removes children without SQLAlchemy loading them first.
     weather_records = relationship(
-        "WeatherHistory", back_populates="location", lazy="dynamic"
+        "WeatherHistory",
+        back_populates="location",
+        lazy="raise",
+        order_by="desc(WeatherHistory.weather_date)",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     forecast_records = relationship(
-        "WeatherForecast", back_populates="location", lazy="dynamic"
+        "WeatherForecast",
+        back_populates="location",
+        lazy="raise",
+        order_by="WeatherForecast.weather_date",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __repr__(self):
@@ -54,71 +74,125 @@ class SearchLocation(Base):
 
 class WeatherHistory(Base):
     __tablename__ = "weather_history"
+    # One row per location and timestamp; also serves location/date range scans.
+    # On Postgres the display columns ride along in the index so the
+    # "latest weather for a location" lookup is an index-only scan.
+    __table_args__ = (
+        Index(
+            "ix_weather_location_date",
+            "location_id",
+            "weather_date",
+            unique=True,
+            postgresql_include=["temp_c", "condition", "icon"],
+        ),
+        # Few-KB summary index for cross-location date range scans (Postgres)
+        Index(
+            "ix_weather_date_brin",
+            "weather_date",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ).ddl_if(dialect="postgresql"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     location_id = Column(
         Integer,
         ForeignKey("search_locations.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
-    weather_date = Column(DateTime, nullable=False, index=True)
+    weather_date = Column(DateTime(timezone=True), nullable=False)
 
     temp_c = Column(Float, nullable=False)
-    temp_f = Column(Float, nullable=False)
-    humidity = Column(Float, nullable=True)
+    # Derived by the database; never part of an INSERT/UPDATE
+    temp_f = Column(
+        Float, Computed("temp_c * 9.0 / 5.0 + 32.0", persisted=True), nullable=False
+    )
+    humidity = Column(SmallInteger, nullable=True)  # %
 
     wind_speed = Column(Float, nullable=True)
-    wind_deg = Column(Float, nullable=True)
+    wind_deg = Column(SmallInteger, nullable=True)  # 0-360
     wind_gust = Column(Float, nullable=True)
 
     condition = Column(String, nullable=False)
     condition_desc = Column(String, nullable=True)
     icon = Column(String, nullable=True)
 
-    sunrise = Column(DateTime, nullable=True)
-    sunset = Column(DateTime, nullable=True)
+    sunrise = Column(DateTime(timezone=True), nullable=True)
+    sunset = Column(DateTime(timezone=True), nullable=True)
 
-    pressure = Column(Float, nullable=True)
+    pressure = Column(SmallInteger, nullable=True)  # hPa
     visibility = Column(Float, nullable=True)
 
     precipitation = Column(Float, nullable=True)
     precipitation_type = Column(String, nullable=True)
 
-    uvi = Column(Float, nullable=True)
-    weather_code = Column(Integer, nullable=True)
+    uvi = Column(Numeric(3, 1, asdecimal=False), nullable=True)
+    weather_code = Column(SmallInteger, nullable=True)
 
     updated_at = Column(
-        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
-    created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     api_source = Column(String, nullable=True)
-    raw_response = Column(JSON, nullable=True)
     tip = Column(String, nullable=True)
 
     # Define relationship
     location = relationship("SearchLocation", back_populates="weather_records")
+    # Raw API payload lives in a side table, loaded only via selectinload()
+    raw = relationship(
+        "WeatherHistoryRaw",
+        back_populates="history",
+        uselist=False,
+        lazy="raise",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+
+class WeatherHistoryRaw(Base):
+    """Raw provider payload for a weather_history row, kept off the hot table"""
+
+    __tablename__ = "weather_history_raw"
+
+    history_id = Column(
+        Integer,
+        ForeignKey("weather_history.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    payload = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
+
+    history = relationship("WeatherHistory", back_populates="raw")
 
 
 class WeatherForecast(Base):
     __tablename__ = "weather_forecast"
+    # One row per location and timestamp; also serves location/date range scans
+    __table_args__ = (
+        Index("ix_forecast_location_date", "location_id", "weather_date", unique=True),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     location_id = Column(
         Integer,
         ForeignKey("search_locations.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
-    weather_date = Column(DateTime, nullable=False, index=True)
+    weather_date = Column(DateTime(timezone=True), nullable=False)
 
     temp_min_c = Column(Float, nullable=True)
     temp_max_c = Column(Float, nullable=True)
     condition = Column(String, nullable=True)
     icon = Column(String, nullable=True)
 
-    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
 
     # Define relationship
     location = relationship("SearchLocation", back_populates="forecast_records")
@@ -1,14 +1,21 @@
 # models/search_history.py
-from sqlalchemy import Column, DateTime, Integer, String, func
+from sqlalchemy import Column, DateTime, Index, Integer, String, func
 
 from app.core.database import Base
 
 
 class SearchHistory(Base):
     __tablename__ = "search_history"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # "Latest searches for a user" is one index range scan, no sort
+        Index("ix_search_history_user_searched", "user_id", "searched_at"),
+        # Latest searches overall (GET /api/location/history)
+        Index("ix_search_history_searched_at", "searched_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, nullable=False, index=True)
+    user_id = Column(Integer, nullable=False)
     query = Column(String, nullable=False)
-    searched_at = Column(DateTime, server_default=func.now(), nullable=False)
+    searched_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
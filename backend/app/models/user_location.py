@@ -1,4 +1,14 @@
-from sqlalchemy import TIMESTAMP, Boolean, Column, Float, ForeignKey, Integer, String
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    text,
+)
 
 # from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
@@ -9,7 +19,15 @@ from app.core.database import Base
 
 class UserLocation(Base):
     __tablename__ = "user_locations"
-    __table_args__ = {"extend_existing": True}
+    # Favorites are a small subset; index only those rows, keyed by owner
+    __table_args__ = (
+        Index(
+            "ix_user_favorites",
+            "user_id",
+            postgresql_where=text("is_favorite"),
+            sqlite_where=text("is_favorite"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
@@ -21,7 +39,9 @@ class UserLocation(Base):
     latitude = Column(Float, nullable=False)
     longitude = Column(Float, nullable=False)
     _is_favorite = Column("is_favorite", Boolean, default=False)
-    created_at = Column(TIMESTAMP, server_default=func.now())
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
 
     user = relationship("User", back_populates="locations")
 
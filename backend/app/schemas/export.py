@@ -20,7 +20,7 @@ Usage:
 from datetime import datetime
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ExportHistoryBase(BaseModel):
@@ -48,5 +48,4 @@ class ExportHistoryRead(ExportHistoryBase):
     error_message: Optional[str] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -1,14 +1,13 @@
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SearchHistoryItem(BaseModel):
     query: str = Field(..., description="The user's search input")
     searched_at: datetime = Field(..., description="Timestamp of the search")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AddSearchHistoryRequest(BaseModel):
@@ -18,9 +18,9 @@ Includes:
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class SearchLocationBase(BaseModel):
@@ -45,8 +45,7 @@ class SearchLocationResponse(SearchLocationBase):
     id: int
     created_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class FavoriteToggleRequest(BaseModel):
@@ -76,5 +75,9 @@ class SearchHistoryResponse(BaseModel):
     query: str
     searched_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Built once; validate and dump whole result lists per call
+SearchLocationListAdapter = TypeAdapter(List[SearchLocationResponse])
+SearchHistoryListAdapter = TypeAdapter(List[SearchHistoryResponse])
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BaseLocation(BaseModel):
@@ -53,12 +53,11 @@ class UpdateLocationRequest(BaseModel):
 
 class LocationResponse(BaseLocation):
     id: int
-    user_id: Optional[int]
+    user_id: Optional[int] = None
     is_favorite: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class FavoriteToggleRequest(BaseModel):
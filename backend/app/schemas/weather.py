@@ -1,7 +1,18 @@
+from dataclasses import dataclass
 from datetime import date, datetime
 from typing import List, Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter, field_validator
+
+# --------------------------
+# Shared Field Types
+# --------------------------
+
+# Celsius reading
+TempC = float
+# OpenWeather icon code, e.g. "04d"
+IconCode = str
+PrecipType = Optional[Literal["rain", "snow"]]
 
 # --------------------------
 # Location Metadata
@@ -18,11 +29,16 @@ class WeatherBase(BaseModel):
 # --------------------------
 # Weather Condition Detail
 # --------------------------
-class WeatherCondition(BaseModel):
+# Output-only value objects in this module are plain slotted dataclasses: they
+# are built from trusted data in loops and never validated from request input.
+@dataclass(frozen=True)
+class WeatherCondition:
+    __slots__ = ("id", "main", "description", "icon")
+
     id: int  # weather code
     main: str  # e.g., "Clouds"
     description: str  # e.g., "broken clouds"
-    icon: str  # e.g., "04d"
+    icon: IconCode  # e.g., "04d"
 
 
 # --------------------------
@@ -33,9 +49,13 @@ class WeatherRequest(BaseModel):
     start_date: Optional[date] = None
     end_date: Optional[date] = None
 
+    # defer_build: models no route uses build their schema on first use
+    # rather than at import (also set on the other unused models below)
+    model_config = ConfigDict(defer_build=True)
+
 
 class WeatherCurrent(BaseModel):
-    temp_c: float
+    temp_c: TempC
     temp_f: float
     humidity: float
     wind_speed: float
@@ -43,14 +63,14 @@ class WeatherCurrent(BaseModel):
     wind_gust: Optional[float] = None
     condition: str
     condition_desc: str
-    icon: str
+    icon: IconCode
     icon_url: Optional[str] = None
     sunrise: Optional[datetime] = None
     sunset: Optional[datetime] = None
     pressure: Optional[float] = None
     visibility: Optional[float] = None
     precipitation: Optional[float] = None
-    precipitation_type: Optional[Literal["rain", "snow"]] = None
+    precipitation_type: PrecipType = None
     uvi: Optional[float] = None
     weather_code: Optional[int] = None
     updated_at: datetime
@@ -60,6 +80,8 @@ class WeatherResponse(BaseModel):
     location: WeatherBase
     weather: WeatherCurrent
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class WeatherDetailResponse(BaseModel):
     location: WeatherBase
@@ -68,6 +90,8 @@ class WeatherDetailResponse(BaseModel):
     api_source: Optional[str] = None
     raw_response: Optional[dict] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 # --------------------------
 # Forecast Response
@@ -77,14 +101,14 @@ class WeatherDetailResponse(BaseModel):
 class ForecastItem(BaseModel):
     forecast_date: date
     forecast_hour: Optional[int] = None
-    temp_c: float
+    temp_c: TempC
     temp_f: float
     condition: str
     condition_desc: str
-    icon: str
+    icon: IconCode
     icon_url: Optional[str] = None
     precipitation: Optional[float] = None
-    precipitation_type: Optional[Literal["rain", "snow"]] = None
+    precipitation_type: PrecipType = None
     uvi: Optional[float] = None
     pressure: Optional[float] = None
     wind_speed: Optional[float] = None
@@ -96,6 +120,10 @@ class ForecastItem(BaseModel):
     updated_at: datetime
 
 
+# Built once; validates a whole forecast list per call
+ForecastItemListAdapter = TypeAdapter(List[ForecastItem])
+
+
 class ForecastResponse(BaseModel):
     location: WeatherBase
     forecast: List[ForecastItem]
@@ -114,19 +142,18 @@ class WeatherHistoryBase(BaseModel):
     - location_id: Location ID (integer)
     - weather_date: Weather date (datetime)
     - temp_c: Temperature in Celsius (float)
-    - temp_f: Temperature in Fahrenheit (float)
     - condition: Weather condition (string)
 
     Optional fields:
-    - humidity: Humidity (float, 0-100)
+    - humidity: Humidity (integer, 0-100)
     - wind_speed: Wind speed (float, m/s)
-    - wind_deg: Wind direction (float, 0-360)
+    - wind_deg: Wind direction (integer, 0-360)
     - wind_gust: Wind gust speed (float, m/s)
     - condition_desc: Weather condition description
     - icon: Weather icon code
     - sunrise: Sunrise time
     - sunset: Sunset time
-    - pressure: Pressure (hPa)
+    - pressure: Pressure (integer, hPa)
     - visibility: Visibility (km)
     - weather_code: Weather code
     - api_source: Data source
@@ -135,18 +162,17 @@ class WeatherHistoryBase(BaseModel):
 
     location_id: int
     weather_date: datetime
-    temp_c: float
-    temp_f: float
+    temp_c: TempC
     condition: str
-    humidity: Optional[float] = None
+    humidity: Optional[int] = None
     wind_speed: Optional[float] = None
-    wind_deg: Optional[float] = None
+    wind_deg: Optional[int] = None
     wind_gust: Optional[float] = None
     condition_desc: Optional[str] = None
-    icon: Optional[str] = None
+    icon: Optional[IconCode] = None
     sunrise: Optional[datetime] = None
     sunset: Optional[datetime] = None
-    pressure: Optional[float] = None
+    pressure: Optional[int] = None
     visibility: Optional[float] = None
     precipitation: Optional[float] = None
     precipitation_type: Optional[str] = None
@@ -155,19 +181,27 @@ class WeatherHistoryBase(BaseModel):
     api_source: Optional[str] = None
     tip: Optional[str] = None
 
+    @field_validator("humidity", "wind_deg", "pressure", mode="before")
+    @classmethod
+    def round_whole_readings(cls, value):
+        # Stored as SMALLINT; accept fractional readings and round them
+        if isinstance(value, float):
+            return round(value)
+        return value
+
 
 class WeatherHistoryCreate(WeatherHistoryBase):
     """
     This is the schema for creating a new weather record.
     Inherits all fields from WeatherHistoryBase,
-    location_id, weather_date, temp_c, temp_f, and condition are required fields.
+    location_id, weather_date, temp_c, and condition are required fields.
+    temp_f is computed by the database from temp_c.
 
     Example:
     {
         "location_id": 1,
         "weather_date": "2024-03-21T12:00:00",
         "temp_c": 20.5,
-        "temp_f": 68.9,
         "condition": "Clear",
         "humidity": 65,
         "wind_speed": 3.5
@@ -189,7 +223,7 @@ class WeatherHistoryResponse(BaseModel):
     id: int
     location_id: int
     weather_date: datetime
-    temp_c: float
+    temp_c: TempC
     temp_f: float
     condition: str
     humidity: float
@@ -197,8 +231,23 @@ class WeatherHistoryResponse(BaseModel):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Built once; validates and serializes a whole list of records per call
+WeatherHistoryListAdapter = TypeAdapter(List[WeatherHistoryResponse])
+
+
+class WeatherLatestResponse(BaseModel):
+    """
+    Latest weather snapshot for a location (dashboard display)
+    """
+
+    location_id: int
+    weather_date: datetime
+    temp_c: TempC
+    condition: str
+    icon: Optional[IconCode] = None
 
 
 # --------------------------
@@ -209,7 +258,7 @@ class WeatherHistoryResponse(BaseModel):
 class WeatherCreate(BaseModel):
     location_id: int
     weather_date: date
-    temp_c: float
+    temp_c: TempC
     temp_f: float
     humidity: float
     wind_speed: float
@@ -217,20 +266,22 @@ class WeatherCreate(BaseModel):
     wind_gust: Optional[float] = None
     condition: str
     condition_desc: str
-    icon: str
+    icon: IconCode
     sunrise: Optional[datetime] = None
     sunset: Optional[datetime] = None
     pressure: Optional[float] = None
     visibility: Optional[float] = None
     precipitation: Optional[float] = None
-    precipitation_type: Optional[Literal["rain", "snow"]] = None
+    precipitation_type: PrecipType = None
     uvi: Optional[float] = None
     weather_code: Optional[int] = None
     updated_at: datetime
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class WeatherUpdate(BaseModel):
-    temp_c: Optional[float] = None
+    temp_c: Optional[TempC] = None
     temp_f: Optional[float] = None
     humidity: Optional[float] = None
     wind_speed: Optional[float] = None
@@ -238,19 +289,18 @@ class WeatherUpdate(BaseModel):
     wind_gust: Optional[float] = None
     condition: Optional[str] = None
     condition_desc: Optional[str] = None
-    icon: Optional[str] = None
+    icon: Optional[IconCode] = None
     sunrise: Optional[datetime] = None
     sunset: Optional[datetime] = None
     pressure: Optional[float] = None
     visibility: Optional[float] = None
     precipitation: Optional[float] = None
-    precipitation_type: Optional[Literal["rain", "snow"]] = None
+    precipitation_type: PrecipType = None
     uvi: Optional[float] = None
     weather_code: Optional[int] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 # --------------------------
@@ -261,17 +311,34 @@ class WeatherUpdate(BaseModel):
 class WeatherSummaryResponse(BaseModel):
     tip: str
     condition: str
-    icon: Optional[str] = None
+    icon: Optional[IconCode] = None
     location: WeatherBase
     date: date
 
+    model_config = ConfigDict(defer_build=True)
+
+
+@dataclass(frozen=True)
+class WeatherSearchHistoryItem:
+    __slots__ = ("query", "searched_at")
 
-class WeatherSearchHistoryItem(BaseModel):
     query: str
     searched_at: datetime
 
 
-class SavedLocation(BaseModel):
+@dataclass(frozen=True)
+class SavedLocation:
+    __slots__ = (
+        "id",
+        "label",
+        "city",
+        "country",
+        "latitude",
+        "longitude",
+        "is_favorite",
+        "created_at",
+    )
+
     id: int
     label: str
     city: str
@@ -282,13 +349,16 @@ class SavedLocation(BaseModel):
     created_at: datetime
 
 
-class HourlyWeather(BaseModel):
+@dataclass(frozen=True)
+class HourlyWeather:
+    __slots__ = ("hour", "timestamp", "temperature", "condition", "description", "icon")
+
     hour: str
     timestamp: int
     temperature: float
     condition: str
     description: str
-    icon: str
+    icon: IconCode
 
 
 class HourlyWeatherResponse(BaseModel):
@@ -301,17 +371,20 @@ class HourlyWeatherResponse(BaseModel):
 # --------------------------
 
 
-class WeatherSearchResult(BaseModel):
+@dataclass(frozen=True)
+class WeatherSearchResult:
     """
-    Response schema for weather search results
+    Response schema for weather search results.
+    A plain dataclass: it is assembled from already-validated parts, so the
+    response envelope does not nest another model around them.
     """
 
     location: WeatherBase
     current_weather: WeatherCurrent
+    last_updated: datetime
     daily_forecast: Optional[List[ForecastItem]] = None
     hourly_forecast: Optional[List[HourlyWeather]] = None
     weather_tip: Optional[str] = None
-    last_updated: datetime
 
 
 class WeatherSearchResponse(BaseModel):
@@ -44,56 +44,88 @@ reliable, and performant generation of exportable content across supported forma
 
 import csv
 import io
-import json
-from typing import Dict, List
+import itertools
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+import orjson
+
+# Rows written per chunk yielded by iter_csv
+CSV_CHUNK_ROWS = 500
+
+
+def iter_csv(data: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """
+    Generate CSV content from dictionaries, CSV_CHUNK_ROWS rows at a time.
+    Only the current chunk is held in memory, so `data` can be a lazily
+    fetched query result. The columns are fixed from the first row's keys
+    and every row is read positionally in that order.
+    """
+    rows = iter(data)
+    first = next(rows, None)
+    # Checked eagerly so callers can still turn it into an error response
+    if first is None:
+        raise ValueError("No data available for CSV export.")
 
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
+    fields = list(first.keys())
+    if len(fields) == 1:
+        (field,) = fields
 
+        def getter(row: Dict[str, Any]) -> Tuple[Any, ...]:
+            return (row[field],)
 
-def export_to_csv(data: List[Dict]) -> io.StringIO:
-    """Generate CSV content from list of dictionaries."""
-    if not data:
-        raise ValueError("No data available for CSV export.")
+    else:
+        getter = itemgetter(*fields)
 
-    output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=data[0].keys())
-    writer.writeheader()
-    writer.writerows(data)
-    output.seek(0)
-    return output
+    def generate() -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(fields)
+        values = map(getter, itertools.chain([first], rows))
+        while chunk := list(itertools.islice(values, CSV_CHUNK_ROWS)):
+            writer.writerows(chunk)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
 
+    return generate()
 
-def export_to_json(data: List[Dict], pretty: bool = False) -> str:
-    """Generate JSON string from list of dictionaries."""
+
+def export_to_json(data: List[Dict[str, Any]], pretty: bool = False) -> bytes:
+    """Generate JSON bytes from list of dictionaries (dates are ISO 8601)."""
     if not data:
         raise ValueError("No data available for JSON export.")
 
-    return json.dumps(data, indent=4 if pretty else None)
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
 
 
-def export_to_pdf(data: List[Dict]) -> io.BytesIO:
+def export_to_pdf(data: List[Dict[str, Any]]) -> io.BytesIO:
     """Generate a basic PDF summary from list of dictionaries."""
     if not data:
         raise ValueError("No data available for PDF export.")
 
+    # reportlab is heavy to import; only PDF exports pay for it (once)
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
     buffer = io.BytesIO()
     p = canvas.Canvas(buffer, pagesize=letter)
     width, height = letter
 
-    y = height - 40
     p.setFont("Helvetica-Bold", 14)
-    p.drawString(50, y, "Weather Data Export")
-    p.setFont("Helvetica", 10)
-    y -= 30
+    p.drawString(50, height - 40, "Weather Data Export")
 
+    # Rows go through one text object per page rather than a drawString each
+    text = p.beginText(50, height - 70)
+    text.setFont("Helvetica", 10, leading=15)
     for row in data:
-        line = ", ".join(f"{key}: {value}" for key, value in row.items())
-        p.drawString(50, y, line)
-        y -= 15
-        if y < 50:
+        text.textLine(", ".join([f"{key}: {value}" for key, value in row.items()]))
+        if text.getY() < 50:
+            p.drawText(text)
             p.showPage()
-            y = height - 40
+            text = p.beginText(50, height - 40)
+            text.setFont("Helvetica", 10, leading=15)
+    p.drawText(text)
 
     p.save()
     buffer.seek(0)
@@ -6,11 +6,54 @@ This module provides location search functionality, including geocoding services
 for converting addresses, city names, and zip codes to coordinates.
 """
 
-from typing import List, Optional
+import logging
+from collections import Counter
+from typing import Awaitable, Callable, List, Optional
 
 import httpx
+import orjson
 
+from app.core.cache import build_cache_key, cache_get, cache_set, get_redis
 from app.core.config import get_settings
+from app.core.http import get_http_client
+from app.utils.validators import US_ZIP_RE
+
+logger = logging.getLogger(__name__)
+
+# Geocoding answers rarely change, so they are kept in Redis for an hour
+GEOCODE_CACHE = "geocode"
+GEOCODE_TTL = 3600
+
+# Geocoding should answer quickly; give up sooner than the client default
+GEOCODE_TIMEOUT = 5.0
+
+# Reverse lookups are keyed on coordinates rounded to ~100 m
+COORD_PRECISION = 3
+
+# Process-wide geocoding cache hits and misses
+cache_stats: Counter = Counter()
+
+
+async def _cached_lookup(key: str, fetch: Callable[[], Awaitable]):
+    """
+    Returns the cached result for `key`, or calls `fetch` and caches what it
+    returns. Empty results (not found, or a failed request) are not cached.
+    """
+    if get_redis() is None:
+        return await fetch()
+
+    hit = await cache_get(key)
+    cache_stats["hit" if hit is not None else "miss"] += 1
+    if logger.isEnabledFor(logging.DEBUG):
+        total = sum(cache_stats.values())
+        logger.debug("Geocode cache hit ratio: %.2f", cache_stats["hit"] / total)
+    if hit is not None:
+        return orjson.loads(hit)
+
+    result = await fetch()
+    if result:
+        await cache_set(key, result, GEOCODE_TTL)
+    return result
 
 
 async def search_location(query: str) -> List[dict]:
@@ -18,44 +61,49 @@ async def search_location(query: str) -> List[dict]:
     Search for locations using OpenWeatherMap Geocoding API.
     Returns a list of locations matching the query.
     """
+    key = build_cache_key(f"{GEOCODE_CACHE}:search", q=query.strip().lower())
+    return await _cached_lookup(key, lambda: _fetch_locations(query))
+
+
+async def _fetch_locations(query: str) -> List[dict]:
     settings = get_settings()
     base_url = "http://api.openweathermap.org/geo/1.0/direct"
 
-    # Check if query is a zip code (simple check for now)
-    if query.replace("-", "").isdigit():
+    # Same zip classification as the /api/location endpoints
+    if US_ZIP_RE.match(query):
         base_url = "http://api.openweathermap.org/geo/1.0/zip"
         params = {"zip": query, "appid": settings.openweather_api_key}
     else:
         params = {"q": query, "limit": 5, "appid": settings.openweather_api_key}
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(base_url, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            if isinstance(data, dict):  # Single location response (zip code)
-                return [
-                    {
-                        "name": data.get("name", ""),
-                        "lat": data.get("lat"),
-                        "lon": data.get("lon"),
-                        "country": data.get("country", ""),
-                    }
-                ]
-            else:  # List of locations (city search)
-                return [
-                    {
-                        "name": loc.get("name", ""),
-                        "lat": loc.get("lat"),
-                        "lon": loc.get("lon"),
-                        "country": loc.get("country", ""),
-                        "state": loc.get("state"),
-                    }
-                    for loc in data
-                ]
-    except Exception as e:
-        print(f"Error searching location: {str(e)}")
+        client = get_http_client()
+        response = await client.get(base_url, params=params, timeout=GEOCODE_TIMEOUT)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+
+        if isinstance(data, dict):  # Single location response (zip code)
+            return [
+                {
+                    "name": data.get("name", ""),
+                    "lat": data.get("lat"),
+                    "lon": data.get("lon"),
+                    "country": data.get("country", ""),
+                }
+            ]
+        else:  # List of locations (city search)
+            return [
+                {
+                    "name": loc.get("name", ""),
+                    "lat": loc.get("lat"),
+                    "lon": loc.get("lon"),
+                    "country": loc.get("country", ""),
+                    "state": loc.get("state"),
+                }
+                for loc in data
+            ]
+    except (httpx.HTTPError, ValueError):
+        logger.warning("Location search failed for %r", query, exc_info=True)
         return []
 
 
@@ -63,31 +111,42 @@ async def get_location_by_coordinates(lat: float, lon: float) -> Optional[dict]:
     """
     Reverse geocoding: Get location information from coordinates
     """
+    key = build_cache_key(
+        f"{GEOCODE_CACHE}:reverse",
+        lat=round(lat, COORD_PRECISION),
+        lon=round(lon, COORD_PRECISION),
+    )
+    return await _cached_lookup(key, lambda: _fetch_location_at(lat, lon))
+
+
+async def _fetch_location_at(lat: float, lon: float) -> Optional[dict]:
     try:
         settings = get_settings()
-        async with httpx.AsyncClient() as client:
-            params = {
-                "lat": lat,
-                "lon": lon,
-                "limit": 1,
-                "appid": settings.openweather_api_key,
+        client = get_http_client()
+        params = {
+            "lat": lat,
+            "lon": lon,
+            "limit": 1,
+            "appid": settings.openweather_api_key,
+        }
+        response = await client.get(
+            "http://api.openweathermap.org/geo/1.0/reverse",
+            params=params,
+            timeout=GEOCODE_TIMEOUT,
+        )
+        response.raise_for_status()
+
+        locations = orjson.loads(response.content)
+        if locations:
+            loc = locations[0]
+            return {
+                "name": loc.get("name"),
+                "country": loc.get("country"),
+                "state": loc.get("state"),
+                "lat": loc.get("lat"),
+                "lon": loc.get("lon"),
             }
-            response = await client.get(
-                "http://api.openweathermap.org/geo/1.0/reverse", params=params
-            )
-            response.raise_for_status()
-
-            locations = response.json()
-            if locations:
-                loc = locations[0]
-                return {
-                    "name": loc.get("name"),
-                    "country": loc.get("country"),
-                    "state": loc.get("state"),
-                    "lat": loc.get("lat"),
-                    "lon": loc.get("lon"),
-                }
-            return None
-    except Exception as e:
-        print(f"Error getting location by coordinates: {e}")
+        return None
+    except (httpx.HTTPError, ValueError):
+        logger.warning("Reverse geocoding failed for (%s, %s)", lat, lon, exc_info=True)
         return None
@@ -0,0 +1,99 @@
+"""
+Module: services.search_history_service
+---------------------------------------
+
+Background writer for search history.
+
+Searches are queued in memory and inserted in batches by a task started from
+the app lifespan, so recording a search never adds a database write to the
+request. When the writer is not running (scripts, SEARCH_HISTORY_ASYNC=0)
+entries are inserted immediately instead.
+"""
+
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import build_cache_key, cache_delete
+from app.core.database import SessionLocal
+from app.crud.search_history import add_search_history_entries
+
+logger = logging.getLogger(__name__)
+
+# Cached GET /api/location/history response, dropped after each write
+SEARCH_HISTORY_CACHE = "location:history"
+
+# A batch is written once it reaches this size or has waited this long
+FLUSH_BATCH_SIZE = 100
+FLUSH_INTERVAL = 0.25
+
+_queue: "Optional[asyncio.Queue[Tuple[int, str]]]" = None
+_writer: "Optional[asyncio.Task[None]]" = None
+
+
+async def _next_batch(queue: "asyncio.Queue[Tuple[int, str]]") -> List[Tuple[int, str]]:
+    loop = asyncio.get_running_loop()
+    batch = [await queue.get()]
+    deadline = loop.time() + FLUSH_INTERVAL
+    while len(batch) < FLUSH_BATCH_SIZE:
+        timeout = deadline - loop.time()
+        if timeout <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(queue.get(), timeout))
+        except asyncio.TimeoutError:
+            break
+    return batch
+
+
+async def _write(entries: List[Tuple[int, str]], db: AsyncSession) -> None:
+    await add_search_history_entries(db, entries)
+    await cache_delete(build_cache_key(SEARCH_HISTORY_CACHE))
+
+
+async def _run_writer(queue: "asyncio.Queue[Tuple[int, str]]") -> None:
+    while True:
+        batch = await _next_batch(queue)
+        try:
+            async with SessionLocal() as db:
+                await _write(batch, db)
+        except Exception:
+            logger.exception("Dropped %d search history entries", len(batch))
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
+def start_search_history_writer() -> None:
+    """Starts the background writer (call from inside the running event loop)"""
+    global _queue, _writer
+    if _writer is None:
+        _queue = asyncio.Queue()
+        _writer = asyncio.ensure_future(_run_writer(_queue))
+
+
+async def stop_search_history_writer() -> None:
+    """Writes out everything still queued, then stops the writer"""
+    global _queue, _writer
+    if _writer is None:
+        return
+    await _queue.join()
+    _writer.cancel()
+    try:
+        await _writer
+    except asyncio.CancelledError:
+        pass
+    _queue = _writer = None
+
+
+async def record_search(db: AsyncSession, user_id: int, query: str) -> None:
+    """
+    Records a search. Queued for the background writer when it is running,
+    otherwise inserted right away with `db`.
+    """
+    if _queue is not None:
+        _queue.put_nowait((user_id, query))
+    else:
+        await _write([(user_id, query)], db)
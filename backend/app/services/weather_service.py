@@ -44,66 +44,249 @@ performance of weather-related features within the application.
 """
 
 import asyncio
+import hashlib
+import logging
 import os
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional
+import time
+from collections import Counter, OrderedDict, deque
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 import httpx
+import orjson
 from fastapi import HTTPException
-from rapidfuzz import process
+from rapidfuzz import fuzz, process
 
+from app.core.cache import cache_get, cache_set
+from app.core.config import settings
+from app.core.http import get_http_client
 from app.schemas.weather import (
-    ForecastItem,
+    ForecastItemListAdapter,
     ForecastResponse,
     HourlyWeather,
     HourlyWeatherResponse,
     WeatherBase,
     WeatherCurrent,
 )
+from app.utils.helpers import icon_url
+
+logger = logging.getLogger(__name__)
 
 OPENWEATHER_API_KEY = os.getenv("OPENWEATHER_API_KEY")
 BASE_WEATHER_URL = "https://api.openweathermap.org/data/2.5/weather"
 BASE_FORECAST_URL = "https://api.openweathermap.org/data/2.5/forecast"
 
+_UTC = timezone.utc
+
 KNOWN_CITIES = ["Seoul", "Busan", "New York", "Tokyo"]
+_KNOWN_CITIES_LOWER = {city.lower(): city for city in KNOWN_CITIES}
 
 
+# Pure and called with heavily repeated strings, so each query is scored once
+@lru_cache(maxsize=2048)
 def normalize_city_name(query: str) -> str:
-    match, score, _ = process.extractOne(query, KNOWN_CITIES)
-    return match if score > 80 else query
+    # Exact (case-insensitive) names skip fuzzy scoring entirely
+    hit = _KNOWN_CITIES_LOWER.get(query.strip().lower())
+    if hit:
+        return hit
+    match = process.extractOne(query, KNOWN_CITIES, scorer=fuzz.WRatio, score_cutoff=80)
+    return match[0] if match else query
+
+
+def c_to_f(c: Optional[float]) -> Optional[float]:
+    if c is None:
+        return None
+    return c * 9 / 5 + 32
+
 
+class _TTLCache:
+    """
+    Bounded in-process cache: entries expire `ttl` seconds after being set and
+    the least recently used entry is evicted once `maxsize` is exceeded.
+    """
 
-def get_weather_tip(condition: str) -> str:
-    tip_map = {
-        "Rain": "Bring an umbrella ☔️",
-        "Snow": "Wear warm clothes ❄️",
-        "Clear": "Perfect day for a walk 🌞",
-        "Clouds": "Might be gloomy, stay productive ☁️",
-        "Thunderstorm": "Stay indoors and safe ⛈️",
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+# Seconds each kind of result stays fresh
+CURRENT_TTL = 600
+FORECAST_TTL = 1800
+HOURLY_TTL = 600
+
+# Per-worker caches in front of the shared Redis cache (same keys and TTLs)
+_current_cache = _TTLCache(maxsize=10_000, ttl=CURRENT_TTL)
+_forecast_cache = _TTLCache(maxsize=10_000, ttl=FORECAST_TTL)
+_hourly_cache = _TTLCache(maxsize=10_000, ttl=HOURLY_TTL)
+
+
+# Process-wide weather cache hits (per tier) and misses
+cache_stats: Counter = Counter()
+
+# Process-wide OpenWeather call count and total latency in milliseconds
+api_stats: Counter = Counter()
+
+
+def get_weather_stats() -> Dict[str, Any]:
+    """Snapshot of this worker's weather cache and OpenWeather call counters"""
+    hits = cache_stats["hit.local"] + cache_stats["hit.redis"]
+    lookups = hits + cache_stats["miss"]
+    calls = api_stats["calls"]
+    return {
+        "cache": {
+            "hit.local": cache_stats["hit.local"],
+            "hit.redis": cache_stats["hit.redis"],
+            "miss": cache_stats["miss"],
+            "hit_ratio": hits / lookups if lookups else None,
+        },
+        "api": {
+            "calls": calls,
+            "avg_latency_ms": api_stats["latency_ms"] / calls if calls else None,
+        },
     }
-    return tip_map.get(condition, "Stay prepared and check the forecast!")
 
 
-def icon_url(icon_code: str) -> str:
-    return f"/static/icons/{icon_code}.svg"
+def _weather_cache_key(kind: str, params: dict) -> str:
+    # The API key is left out so rotating it does not empty the cache
+    return _build_cache_key(
+        f"{settings.cache_prefix}:weather:{kind}",
+        **{k: v for k, v in params.items() if k != "appid"},
+    )
 
 
-def c_to_f(c: Optional[float]) -> Optional[float]:
-    if c is None:
+async def _cache_lookup(local: _TTLCache, key: str, model):
+    """
+    Returns the cached `model` for `key` from this worker's cache or, failing
+    that, from Redis (refilling the local cache); None on a miss.
+    """
+    result = local.get(key)
+    if result is not None:
+        cache_stats["hit.local"] += 1
+        return result
+    raw = await cache_get(key)
+    if raw is None:
+        cache_stats["miss"] += 1
         return None
-    return c * 9 / 5 + 32
+    cache_stats["hit.redis"] += 1
+    result = model.model_validate_json(raw)
+    local[key] = result
+    return result
+
+
+async def _cache_store(local: _TTLCache, key: str, result) -> None:
+    local[key] = result
+    await cache_set(key, result, int(local.ttl))
+
+
+class _Throttler:
+    """
+    Async context manager admitting at most `rate_limit` entries per
+    `period` seconds (sliding window); callers over the limit wait.
+    """
+
+    def __init__(self, rate_limit: int, period: float = 60.0):
+        self.rate_limit = rate_limit
+        self.period = period
+        self._calls: "deque[float]" = deque()
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> None:
+        async with self._lock:
+            while len(self._calls) >= self.rate_limit:
+                wait = self._calls[0] + self.period - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                else:
+                    self._calls.popleft()
+            self._calls.append(time.monotonic())
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+@lru_cache(maxsize=1)
+def get_throttler() -> _Throttler:
+    """Returns the process-wide OpenWeather throttle (built inside the event loop)"""
+    return _Throttler(settings.openweather_rate_limit)
+
+
+# Attempts per call when OpenWeather answers 429, backing off 1s, 2s, ...
+RATE_LIMIT_ATTEMPTS = 3
+RATE_LIMIT_BACKOFF = 1.0
 
 
-_cache: Dict[str, Dict[str, Any]] = {}
+# Upstream bodies above this are rejected (a 40-item forecast is ~15 KB)
+MAX_RESPONSE_BYTES = 1024 * 1024
 
 
 async def fetch_url(url: str, params: dict) -> Optional[dict]:
-    async with httpx.AsyncClient(timeout=10) as client:
+    start = time.perf_counter()
+    try:
+        return await _fetch_url(url, params)
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        api_stats["calls"] += 1
+        api_stats["latency_ms"] += elapsed_ms
+        logger.debug("OpenWeather call to %s took %.1f ms", url, elapsed_ms)
+
+
+@lru_cache(maxsize=1024)
+def _city_url(base_url: str, city: str) -> httpx.URL:
+    """Encoded request URL for a city lookup (`q`, `appid` and `units` params)"""
+    return httpx.URL(
+        base_url, params={"q": city, "appid": OPENWEATHER_API_KEY, "units": "metric"}
+    )
+
+
+async def _fetch_url(url: str, params: dict) -> Optional[dict]:
+    # City lookups reuse a prebuilt URL; coordinates vary too much to cache
+    city = params.get("q")
+    if city:
+        url, params = _city_url(url, city), None
+    for attempt in range(RATE_LIMIT_ATTEMPTS):
         try:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+            async with get_throttler():
+                client = get_http_client()
+                async with client.stream("GET", url, params=params) as response:
+                    # Status and declared size are checked before the body is
+                    # read; the running total also caps chunked/unsized bodies
+                    response.raise_for_status()
+                    declared = int(response.headers.get("content-length") or 0)
+                    body = bytearray()
+                    if declared <= MAX_RESPONSE_BYTES:
+                        async for chunk in response.aiter_bytes():
+                            body += chunk
+                            if len(body) > MAX_RESPONSE_BYTES:
+                                break
+                    if max(declared, len(body)) > MAX_RESPONSE_BYTES:
+                        raise HTTPException(
+                            status_code=502, detail="External API response too large"
+                        )
+            return orjson.loads(body)
         except httpx.HTTPStatusError as e:
+            if e.response.status_code == 429 and attempt + 1 < RATE_LIMIT_ATTEMPTS:
+                await asyncio.sleep(RATE_LIMIT_BACKOFF * 2**attempt)
+                continue
             raise HTTPException(
                 status_code=e.response.status_code, detail="API call failed"
             )
@@ -112,7 +295,30 @@ async def fetch_url(url: str, params: dict) -> Optional[dict]:
 
 
 def _build_cache_key(prefix: str, **kwargs) -> str:
-    return prefix + ":" + ":".join(f"{k}={v}" for k, v in sorted(kwargs.items()))
+    # Fixed-length digest of the canonical (key-sorted) params keeps keys short
+    digest = hashlib.blake2b(
+        orjson.dumps(kwargs, option=orjson.OPT_SORT_KEYS), digest_size=16
+    ).hexdigest()
+    return f"{prefix}:{digest}"
+
+
+# Upstream requests in flight, keyed by URL and params
+_inflight: Dict[str, "asyncio.Task[Optional[dict]]"] = {}
+
+
+async def fetch_url_once(url: str, params: dict) -> Optional[dict]:
+    """
+    fetch_url, but concurrent callers asking for the same URL and params
+    share a single upstream request instead of each sending their own.
+    """
+    key = _build_cache_key(url, **params)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch_url(url, params))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # shield: one caller being cancelled must not cancel the others' request
+    return await asyncio.shield(task)
 
 
 async def fetch_current_weather(
@@ -128,12 +334,12 @@ async def fetch_current_weather(
         params["lat"] = lat
         params["lon"] = lon
 
-    cache_key = _build_cache_key("current", **params)
-    cached = _cache.get(cache_key)
-    if cached and datetime.utcnow() - cached["timestamp"] < timedelta(minutes=10):
-        return cached["data"]
+    cache_key = _weather_cache_key("current", params)
+    cached = await _cache_lookup(_current_cache, cache_key, WeatherCurrent)
+    if cached is not None:
+        return cached
 
-    data = await fetch_url(BASE_WEATHER_URL, params)
+    data = await fetch_url_once(BASE_WEATHER_URL, params)
     if not data:
         return None
 
@@ -145,7 +351,11 @@ async def fetch_current_weather(
     sunrise = sys.get("sunrise")
     sunset = sys.get("sunset")
 
-    result = WeatherCurrent(
+    # Trust boundary: OpenWeather's JSON has already passed raise_for_status
+    # and its field types are fixed, so the model is built without
+    # validation. Input from clients or other sources goes through
+    # WeatherCurrent(...) / model_validate as usual.
+    result = WeatherCurrent.model_construct(
         temp_c=main.get("temp", 0.0),
         temp_f=c_to_f(main.get("temp")) or 0.0,
         humidity=main.get("humidity", 0.0),
@@ -168,13 +378,10 @@ async def fetch_current_weather(
         ),
         pressure=main.get("pressure"),
         visibility=data.get("visibility"),
-        precipitation=None,
-        precipitation_type=None,
-        uvi=None,
         weather_code=weather.get("id"),
         updated_at=datetime.fromtimestamp(data.get("dt", 0), tz=timezone.utc),
     )
-    _cache[cache_key] = {"timestamp": datetime.utcnow(), "data": result}
+    await _cache_store(_current_cache, cache_key, result)
     return result
 
 
@@ -191,46 +398,53 @@ async def fetch_forecast(
         params["lat"] = lat
         params["lon"] = lon
 
-    cache_key = _build_cache_key("forecast", **params)
-    cached = _cache.get(cache_key)
-    if cached and datetime.utcnow() - cached["timestamp"] < timedelta(minutes=30):
-        return cached["data"]
+    cache_key = _weather_cache_key("forecast", params)
+    cached = await _cache_lookup(_forecast_cache, cache_key, ForecastResponse)
+    if cached is not None:
+        return cached
 
-    data = await fetch_url(BASE_FORECAST_URL, params)
+    data = await fetch_url_once(BASE_FORECAST_URL, params)
     if not data:
         return None
 
     city_info = data.get("city", {})
     coord = city_info.get("coord", {})
 
-    forecast_list = []
+    # Items are collected as plain dicts and validated as one list
+    raw_items = []
     for item in data.get("list", []):
-        dt = datetime.fromtimestamp(item.get("dt"), tz=timezone.utc)
+        dt = datetime.fromtimestamp(item.get("dt"), _UTC)
         main = item.get("main", {})
         weather = (item.get("weather") or [{}])[0]
-
-        forecast_item = ForecastItem(
-            forecast_date=dt.date(),
-            forecast_hour=dt.hour,
-            temp_c=main.get("temp", 0.0),
-            temp_f=c_to_f(main.get("temp")) or 0.0,
-            condition=weather.get("main", "Unknown"),
-            condition_desc=weather.get("description", ""),
-            icon=weather.get("icon", ""),
-            icon_url=icon_url(weather.get("icon", "")),
-            precipitation=item.get("rain", {}).get("3h", 0) if "rain" in item else 0,
-            precipitation_type="rain" if "rain" in item else None,
-            updated_at=dt,
-            uvi=None,
-            pressure=main.get("pressure"),
-            wind_speed=item.get("wind", {}).get("speed"),
-            wind_deg=item.get("wind", {}).get("deg"),
-            wind_gust=item.get("wind", {}).get("gust"),
-            humidity=main.get("humidity"),
-            visibility=item.get("visibility"),
-            weather_code=weather.get("id"),
+        wind = item.get("wind", {})
+        rain = item.get("rain")
+        temp = main.get("temp")
+        icon = weather.get("icon", "")
+
+        raw_items.append(
+            dict(
+                forecast_date=dt.date(),
+                forecast_hour=dt.hour,
+                temp_c=temp if temp is not None else 0.0,
+                temp_f=c_to_f(temp) or 0.0,
+                condition=weather.get("main", "Unknown"),
+                condition_desc=weather.get("description", ""),
+                icon=icon,
+                icon_url=icon_url(icon),
+                precipitation=rain.get("3h", 0) if rain is not None else 0,
+                precipitation_type="rain" if rain is not None else None,
+                updated_at=dt,
+                uvi=None,
+                pressure=main.get("pressure"),
+                wind_speed=wind.get("speed"),
+                wind_deg=wind.get("deg"),
+                wind_gust=wind.get("gust"),
+                humidity=main.get("humidity"),
+                visibility=item.get("visibility"),
+                weather_code=weather.get("id"),
+            )
         )
-        forecast_list.append(forecast_item)
+    forecast_list = ForecastItemListAdapter.validate_python(raw_items)
 
     result = ForecastResponse(
         location=WeatherBase(
@@ -242,7 +456,7 @@ async def fetch_forecast(
         forecast=forecast_list,
     )
 
-    _cache[cache_key] = {"timestamp": datetime.utcnow(), "data": result}
+    await _cache_store(_forecast_cache, cache_key, result)
     return result
 
 
@@ -265,13 +479,13 @@ async def fetch_hourly_weather(
         params["lat"] = lat
         params["lon"] = lon
 
-    cache_key = _build_cache_key("hourly", **params)
-    cached = _cache.get(cache_key)
-    if cached and datetime.utcnow() - cached["timestamp"] < timedelta(minutes=10):
-        return cached["data"]
+    cache_key = _weather_cache_key("hourly", params)
+    cached = await _cache_lookup(_hourly_cache, cache_key, HourlyWeatherResponse)
+    if cached is not None:
+        return cached
 
     try:
-        data = await fetch_url(BASE_FORECAST_URL, params)
+        data = await fetch_url_once(BASE_FORECAST_URL, params)
         if not data:
             return None
 
@@ -306,7 +520,7 @@ async def fetch_hourly_weather(
             location=location, hourly_forecast=hourly_forecast
         )
 
-        _cache[cache_key] = {"timestamp": datetime.utcnow(), "data": result}
+        await _cache_store(_hourly_cache, cache_key, result)
         return result
 
     except Exception as e:
@@ -316,12 +530,36 @@ async def fetch_hourly_weather(
         )
 
 
+async def _skipped() -> None:
+    return None
+
+
+async def fetch_weather_bundle(
+    city: str, include_forecast: bool = True, include_hourly: bool = False
+) -> Tuple[
+    Optional[WeatherCurrent],
+    Optional[ForecastResponse],
+    Optional[HourlyWeatherResponse],
+]:
+    """
+    Fetch current weather and, optionally, the daily and hourly forecasts for
+    a city concurrently. Parts that were not requested come back as None.
+    Each part keeps its own cache and TTL, so only the expired ones are
+    fetched upstream; fresh parts are served from cache.
+    """
+    current, forecast, hourly = await asyncio.gather(
+        fetch_current_weather(city=city),
+        fetch_forecast(city=city) if include_forecast else _skipped(),
+        fetch_hourly_weather(city=city) if include_hourly else _skipped(),
+    )
+    return current, forecast, hourly
+
+
 if __name__ == "__main__":
 
     async def main():
-        current = await fetch_current_weather(city="Seoul")
+        current, forecast, _ = await fetch_weather_bundle("Seoul")
         print(current)
-        forecast = await fetch_forecast(city="Seoul")
         print(forecast)
 
     asyncio.run(main())
@@ -48,10 +48,9 @@ error communication.
 
 import logging
 
-# from fastapi import HTTPException,
 from fastapi import Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import ValidationError as PydanticValidationError
 from starlette.status import (
     HTTP_400_BAD_REQUEST,
@@ -62,6 +61,8 @@ from starlette.status import (
     HTTP_500_INTERNAL_SERVER_ERROR,
 )
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
 # --- Custom Exception Classes ---
@@ -114,114 +115,55 @@ class TimeoutError(Exception):
 
 # --- Global Exception Handlers ---
 async def validation_error_handler(request: Request, exc: PydanticValidationError):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=HTTP_400_BAD_REQUEST,
         content={"detail": "Validation error", "errors": exc.errors()},
     )
 
 
-async def validation_exception_handler(request: Request, exc: CustomValidationError):
-    logger.error(f"Validation error: {exc.detail}")
-    return JSONResponse(status_code=HTTP_400_BAD_REQUEST, content={"error": exc.detail})
-
-
-async def not_found_exception_handler(request: Request, exc: NotFoundError):
-    logger.error(f"Not found error: {exc.detail}")
-    return JSONResponse(status_code=HTTP_404_NOT_FOUND, content={"error": exc.detail})
-
-
-async def duplicate_entry_exception_handler(request: Request, exc: DuplicateEntryError):
-    logger.error(f"Duplicate entry error: {exc.detail}")
-    return JSONResponse(status_code=HTTP_409_CONFLICT, content={"error": exc.detail})
-
-
-async def external_api_exception_handler(request: Request, exc: ExternalAPIError):
-    logger.error(f"External API error: {exc.detail}")
-    return JSONResponse(
-        status_code=HTTP_500_INTERNAL_SERVER_ERROR, content={"error": exc.detail}
-    )
-
-
-async def database_exception_handler(request: Request, exc: DatabaseError):
-    logger.error(f"Database error: {exc.detail}")
-    return JSONResponse(
-        status_code=HTTP_500_INTERNAL_SERVER_ERROR, content={"error": exc.detail}
-    )
-
-
-async def authorization_exception_handler(request: Request, exc: AuthorizationError):
-    logger.error(f"Authorization error: {exc.detail}")
-    return JSONResponse(
-        status_code=HTTP_401_UNAUTHORIZED, content={"error": exc.detail}
-    )
-
-
-async def conflict_exception_handler(request: Request, exc: ConflictError):
-    logger.error(f"Conflict error: {exc.detail}")
-    return JSONResponse(status_code=HTTP_409_CONFLICT, content={"error": exc.detail})
-
-
-async def serialization_exception_handler(request: Request, exc: SerializationError):
-    logger.error(f"Serialization error: {exc.detail}")
-    return JSONResponse(
-        status_code=HTTP_500_INTERNAL_SERVER_ERROR, content={"error": exc.detail}
-    )
-
-
-async def timeout_exception_handler(request: Request, exc: TimeoutError):
-    logger.error(f"Timeout error: {exc.detail}")
-    return JSONResponse(
-        status_code=HTTP_408_REQUEST_TIMEOUT, content={"error": exc.detail}
+# Status code and log label for each custom exception; one handler serves all
+_ERROR_TABLE = {
+    CustomValidationError: (HTTP_400_BAD_REQUEST, "Validation error"),
+    NotFoundError: (HTTP_404_NOT_FOUND, "Not found error"),
+    DuplicateEntryError: (HTTP_409_CONFLICT, "Duplicate entry error"),
+    ExternalAPIError: (HTTP_500_INTERNAL_SERVER_ERROR, "External API error"),
+    DatabaseError: (HTTP_500_INTERNAL_SERVER_ERROR, "Database error"),
+    AuthorizationError: (HTTP_401_UNAUTHORIZED, "Authorization error"),
+    ConflictError: (HTTP_409_CONFLICT, "Conflict error"),
+    SerializationError: (HTTP_500_INTERNAL_SERVER_ERROR, "Serialization error"),
+    TimeoutError: (HTTP_408_REQUEST_TIMEOUT, "Timeout error"),
+}
+
+
+async def custom_exception_handler(request: Request, exc: Exception):
+    # Subclasses of a registered exception are routed here too (Starlette
+    # matches handlers by MRO), so resolve the nearest registered base
+    status_code, label = next(
+        _ERROR_TABLE[cls] for cls in type(exc).__mro__ if cls in _ERROR_TABLE
     )
+    logger.error("%s: %s", label, exc.detail)
+    return ORJSONResponse(status_code=status_code, content={"error": exc.detail})
 
 
 # Optional: handle FastAPI/Pydantic validation errors uniformly
 async def request_validation_exception_handler(
     request: Request, exc: RequestValidationError
 ):
-    logger.error(f"Request validation error: {exc.errors()}")
-    return JSONResponse(
+    errors = exc.errors()
+    logger.error("Request validation error: %r", errors)
+    if not settings.debug:
+        # Location and message are all a client needs to fix the request
+        errors = [{"loc": e["loc"], "msg": e["msg"]} for e in errors]
+    return ORJSONResponse(
         status_code=HTTP_400_BAD_REQUEST,
-        content={"error": "Invalid request", "details": exc.errors()},
+        content={"error": "Invalid request", "details": errors},
     )
 
 
 def register_exception_handlers(app):
     app.add_exception_handler(PydanticValidationError, validation_error_handler)
-    app.add_exception_handler(CustomValidationError, validation_exception_handler)
-    app.add_exception_handler(NotFoundError, not_found_exception_handler)
-    app.add_exception_handler(DuplicateEntryError, duplicate_entry_exception_handler)
-    app.add_exception_handler(ExternalAPIError, external_api_exception_handler)
-    app.add_exception_handler(DatabaseError, database_exception_handler)
-    app.add_exception_handler(AuthorizationError, authorization_exception_handler)
-    app.add_exception_handler(ConflictError, conflict_exception_handler)
-    app.add_exception_handler(SerializationError, serialization_exception_handler)
-    app.add_exception_handler(TimeoutError, timeout_exception_handler)
+    for exc_class in _ERROR_TABLE:
+        app.add_exception_handler(exc_class, custom_exception_handler)
     app.add_exception_handler(
         RequestValidationError, request_validation_exception_handler
     )
-
-
-# --- Registration 예시 (main.py에서) ---
-#
-# from fastapi import FastAPI
-# from utils.errors import (
-#     validation_exception_handler,
-#     not_found_exception_handler,
-#     ...
-#     request_validation_exception_handler,
-# )
-#
-# app = FastAPI()
-#
-# app.add_exception_handler(CustomValidationError, validation_exception_handler)
-# app.add_exception_handler(NotFoundError, not_found_exception_handler)
-# app.add_exception_handler(DuplicateEntryError, duplicate_entry_exception_handler)
-# app.add_exception_handler(ExternalAPIError, external_api_exception_handler)
-# app.add_exception_handler(DatabaseError, database_exception_handler)
-# app.add_exception_handler(AuthorizationError, authorization_exception_handler)
-# app.add_exception_handler(ConflictError, conflict_exception_handler)
-# app.add_exception_handler(SerializationError, serialization_exception_handler)
-# app.add_exception_handler(TimeoutError, timeout_exception_handler)
-# app.add_exception_handler(RequestValidationError,
-# request_validation_exception_handler)
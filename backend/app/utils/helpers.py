@@ -45,17 +45,37 @@ Benefits:
 - Facilitates consistent data formatting and processing standards across modules.
 """
 
+from functools import lru_cache
+
+import orjson
+
+_TIP_MAP = {
+    "Rain": "Bring an umbrella ☔️",
+    "Snow": "Wear warm clothes ❄️",
+    "Clear": "Perfect day for a walk 🌞",
+    "Clouds": "Might be gloomy, stay productive ☁️",
+    "Thunderstorm": "Stay indoors and safe ⛈️",
+}
+_DEFAULT_TIP = "Stay prepared and check the forecast!"
+
+# `{"tip": ...}` JSON bodies, encoded once per condition
+_TIP_BYTES = {
+    condition: orjson.dumps({"tip": tip}) for condition, tip in _TIP_MAP.items()
+}
+_DEFAULT_TIP_BYTES = orjson.dumps({"tip": _DEFAULT_TIP})
+
+_ICON_PREFIX = "/static/icons/"
+
 
 def get_weather_tip(condition: str) -> str:
-    tip_map = {
-        "Rain": "Bring an umbrella ☔️",
-        "Snow": "Wear warm clothes ❄️",
-        "Clear": "Perfect day for a walk 🌞",
-        "Clouds": "Might be gloomy, stay productive ☁️",
-        "Thunderstorm": "Stay indoors and safe ⛈️",
-    }
-    return tip_map.get(condition, "Stay prepared and check the forecast!")
+    return _TIP_MAP.get(condition, _DEFAULT_TIP)
+
+
+def get_weather_tip_json(condition: str) -> bytes:
+    """Returns the pre-encoded `{"tip": ...}` JSON body for `condition`"""
+    return _TIP_BYTES.get(condition, _DEFAULT_TIP_BYTES)
 
 
+@lru_cache(maxsize=256)
 def icon_url(icon_code: str) -> str:
-    return f"/static/icons/{icon_code}.svg"
+    return _ICON_PREFIX + icon_code + ".svg"
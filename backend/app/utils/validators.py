@@ -49,3 +49,8 @@ Benefits:
 - Enhances API robustness and user experience by providing immediate feedback
   on bad inputs.
 """
+
+import re
+
+# US ZIP code: 5 digits or ZIP+4 (e.g. "12345", "12345-6789")
+US_ZIP_RE = re.compile(r"^\d{5}(-\d{4})?$")
@@ -15,7 +15,7 @@ from app.schemas.weather import WeatherCreate, WeatherUpdate
 
 
 def create_weather_record(db: Session, data: WeatherCreate) -> WeatherHistory:
-    weather = WeatherHistory(**data.dict())
+    weather = WeatherHistory(**data.model_dump())
     db.add(weather)
     db.commit()
     db.refresh(weather)
@@ -46,7 +46,7 @@ def update_weather_record(
     weather = get_weather_by_id(db, weather_id)
     if not weather:
         return None
-    for field, value in data.dict(exclude_unset=True).items():
+    for field, value in data.model_dump(exclude_unset=True).items():
         setattr(weather, field, value)
     db.commit()
     db.refresh(weather)
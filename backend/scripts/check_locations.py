@@ -1,19 +1,20 @@
-from app.core.database import SessionLocal
+import asyncio
+
+from sqlalchemy import select
+
+from app.core.database import get_db_session
 from app.models.models import SearchLocation
 
 
-def check_locations():
-    db = SessionLocal()
-    try:
-        locations = db.query(SearchLocation).all()
+async def check_locations():
+    async with get_db_session() as db:
+        locations = (await db.scalars(select(SearchLocation))).all()
         print("\nExisting Locations:")
         for loc in locations:
             print(
                 f"ID: {loc.id}, City: {loc.city}, Label: {loc.label}, Coords: ({loc.latitude}, {loc.longitude})"
             )
-    finally:
-        db.close()
 
 
 if __name__ == "__main__":
-    check_locations()
+    asyncio.run(check_locations())
@@ -1,7 +1,7 @@
 import os
 import sys
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import sessionmaker
 
@@ -45,18 +45,17 @@ def create_test_locations():
             },
         ]
 
-        # Add locations to the database
-        for location_data in locations:
-            location = SearchLocation(**location_data)
-            try:
-                db.add(location)
-                db.commit()
+        # Add all locations with one executemany INSERT and a single commit
+        try:
+            db.execute(insert(SearchLocation), locations)
+            db.commit()
+            for location_data in locations:
                 print(
                     f"Added location: {location_data['city']}, {location_data['country']}"
                 )
-            except SQLAlchemyError as e:
-                print(f"Error adding location: {str(e)}")
-                db.rollback()
+        except SQLAlchemyError as e:
+            print(f"Error adding locations: {str(e)}")
+            db.rollback()
 
         print("\nAll test locations have been created!")
 
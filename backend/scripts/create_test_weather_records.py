@@ -1,135 +1,107 @@
+import asyncio
 import os
 import sys
 from datetime import datetime, timedelta
 
-from sqlalchemy import create_engine
+from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import sessionmaker
 
 # Add the project root directory to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.core.config import get_database_url
+from app.core.database import SessionLocal
+from app.crud.weather import bulk_create_weather_records
 from app.models.models import WeatherHistory
+from app.schemas.weather import WeatherHistoryCreate
+
+# (condition, condition_desc, icon) cycled by day index per location
+SEOUL_TABLE = (
+    ("Clear", "Clear weather", "01d"),
+    ("Clouds", "Cloudy weather", "04d"),
+)
+BUSAN_TABLE = (
+    ("Clear", "Clear weather", "01d"),
+    ("Rain", "Rain", "10d"),
+    ("Clouds", "Cloudy weather", "04d"),
+)
+JEJU_TABLE = (
+    ("Clear", "Clear weather", "01d"),
+    ("Rain", "Rain", "10d"),
+    ("Clouds", "Cloudy weather", "04d"),
+    ("Fog", "Foggy weather", "50d"),
+)
+
+# location_id, conditions table, base temp_c, base humidity, base wind_speed
+TEST_LOCATIONS = (
+    (1, SEOUL_TABLE, 15.5, 60, 3.0),  # Seoul
+    (3, BUSAN_TABLE, 17.5, 65, 4.0),  # Busan
+    (4, JEJU_TABLE, 16.5, 70, 5.0),  # Jeju
+)
+
+START_DATE = datetime(2024, 3, 1)
+DAYS = 7
+
+
+def generate_test_weather_records():
+    """Yields one week of weather records (March 1 to 7) per test location"""
+    for location_id, table, temp_c, humidity, wind_speed in TEST_LOCATIONS:
+        for i in range(DAYS):
+            condition, condition_desc, icon = table[i % len(table)]
+            yield WeatherHistoryCreate(
+                location_id=location_id,
+                weather_date=START_DATE + timedelta(days=i),
+                temp_c=temp_c + i,
+                condition=condition,
+                humidity=humidity + i,
+                wind_speed=wind_speed + (i * 0.5),
+                condition_desc=condition_desc,
+                icon=icon,
+            )
 
 
-def create_test_weather_records():
-    # Set up database connection
-    SQLALCHEMY_DATABASE_URL = get_database_url()
-    engine = create_engine(SQLALCHEMY_DATABASE_URL)
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-    db = SessionLocal()
-    try:
-        # Weather records for Seoul (ID: 1) from March 1 to 7
-        seoul_records = [
-            {
-                "location_id": 1,
-                "weather_date": datetime(2024, 3, 1) + timedelta(days=i),
-                "temp_c": 15.5 + i,
-                "temp_f": (15.5 + i) * 9 / 5 + 32,
-                "condition": "Clear" if i % 2 == 0 else "Clouds",
-                "humidity": 60 + i,
-                "wind_speed": 3.0 + (i * 0.5),
-                "condition_desc": "Clear weather" if i % 2 == 0 else "Cloudy weather",
-                "icon": "01d" if i % 2 == 0 else "04d",
-            }
-            for i in range(7)
-        ]
-
-        # Weather records for Busan (ID: 3) from March 1 to 7
-        busan_records = [
-            {
-                "location_id": 3,
-                "weather_date": datetime(2024, 3, 1) + timedelta(days=i),
-                "temp_c": 17.5 + i,
-                "temp_f": (17.5 + i) * 9 / 5 + 32,
-                "condition": (
-                    "Clear" if i % 3 == 0 else "Rain" if i % 3 == 1 else "Clouds"
-                ),
-                "humidity": 65 + i,
-                "wind_speed": 4.0 + (i * 0.5),
-                "condition_desc": (
-                    "Clear weather"
-                    if i % 3 == 0
-                    else "Rain" if i % 3 == 1 else "Cloudy weather"
-                ),
-                "icon": "01d" if i % 3 == 0 else "10d" if i % 3 == 1 else "04d",
-            }
-            for i in range(7)
-        ]
-
-        # Weather records for Jeju (ID: 4) from March 1 to 7
-        jeju_records = [
-            {
-                "location_id": 4,
-                "weather_date": datetime(2024, 3, 1) + timedelta(days=i),
-                "temp_c": 16.5 + i,
-                "temp_f": (16.5 + i) * 9 / 5 + 32,
-                "condition": (
-                    "Clear"
-                    if i % 4 == 0
-                    else "Rain" if i % 4 == 1 else "Clouds" if i % 4 == 2 else "Fog"
-                ),
-                "humidity": 70 + i,
-                "wind_speed": 5.0 + (i * 0.5),
-                "condition_desc": (
-                    "Clear weather"
-                    if i % 4 == 0
-                    else (
-                        "Rain"
-                        if i % 4 == 1
-                        else "Cloudy weather" if i % 4 == 2 else "Foggy weather"
-                    )
-                ),
-                "icon": (
-                    "01d"
-                    if i % 4 == 0
-                    else "10d" if i % 4 == 1 else "04d" if i % 4 == 2 else "50d"
-                ),
-            }
-            for i in range(7)
-        ]
-
-        all_records = seoul_records + busan_records + jeju_records
-
-        # Add records to the database
-        for record_data in all_records:
-            record = WeatherHistory(**record_data)
-            try:
-                db.add(record)
-                db.commit()
-                print(
-                    f"Added weather record for {record_data['condition']} at {record_data['weather_date']}"
+async def create_test_weather_records():
+    async with SessionLocal() as db:
+        try:
+            # One batched upsert instead of a commit per row
+            written = await bulk_create_weather_records(
+                db, list(generate_test_weather_records()), overwrite=True
+            )
+            print(f"\nWrote {written} test weather records!")
+
+            # Check the created records: one streamed query, written out in a
+            # single print under a header per location
+            result = await db.stream(
+                select(
+                    WeatherHistory.location_id,
+                    WeatherHistory.weather_date,
+                    WeatherHistory.temp_c,
+                    WeatherHistory.condition,
                 )
-            except SQLAlchemyError as e:
-                print(f"Error adding record: {str(e)}")
-                db.rollback()
-
-        print("\nAll test weather records have been created!")
-
-        # Check the created records
-        for location_id in [1, 3, 4]:
-            records = (
-                db.query(WeatherHistory)
-                .filter(WeatherHistory.location_id == location_id)
-                .order_by(WeatherHistory.weather_date)
-                .all()
+                .where(WeatherHistory.location_id.in_([1, 3, 4]))
+                .order_by(WeatherHistory.location_id, WeatherHistory.weather_date)
+                .execution_options(yield_per=100)
             )
-
-            print(f"\nRecords for location_id {location_id}:")
-            for record in records:
-                print(
-                    f"Date: {record.weather_date.strftime('%Y-%m-%d')}, "
-                    f"Temp: {record.temp_c}°C, "
-                    f"Condition: {record.condition}"
+            lines = []
+            current_location = None
+            async for location_id, weather_date, temp_c, condition in result:
+                if location_id != current_location:
+                    current_location = location_id
+                    lines.append(f"\nRecords for location_id {location_id}:")
+                lines.append(
+                    f"Date: {weather_date.strftime('%Y-%m-%d')}, "
+                    f"Temp: {temp_c}°C, "
+                    f"Condition: {condition}"
                 )
-
-    except Exception as e:
-        print(f"Error: {str(e)}")
-    finally:
-        db.close()
+            print("\n".join(lines))
+        except SQLAlchemyError as e:
+            print(f"Error: {str(e)}")
+            await db.rollback()
 
 
 if __name__ == "__main__":
-    create_test_weather_records()
+    try:
+        import uvloop
+    except ImportError:  # uvloop is not available on Windows
+        asyncio.run(create_test_weather_records())
+    else:
+        uvloop.run(create_test_weather_records())
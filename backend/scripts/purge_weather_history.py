@@ -0,0 +1,19 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.crud.weather import purge_weather_records_before
+
+
+async def purge_weather_history():
+    cutoff = datetime.now(timezone.utc) - timedelta(
+        days=settings.weather_retention_days
+    )
+    async with SessionLocal() as db:
+        removed = await purge_weather_records_before(db, cutoff)
+    print(f"Removed {removed} weather records dated before {cutoff:%Y-%m-%d}")
+
+
+if __name__ == "__main__":
+    asyncio.run(purge_weather_history())
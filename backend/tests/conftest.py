@@ -0,0 +1,54 @@
+# backend/tests/conftest.py
+import os
+import tempfile
+
+# Point the app at a throwaway SQLite file before any app module builds the
+# engine; Redis caching and the background history writer stay off
+os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///" + os.path.join(
+    tempfile.mkdtemp(), "test.db"
+)
+os.environ["REDIS_URL"] = ""
+os.environ["SEARCH_HISTORY_ASYNC"] = "0"
+
+import pytest_asyncio  # noqa: E402
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from app.core.database import Base, SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.models import SearchLocation  # noqa: E402
+
+
+@pytest_asyncio.fixture
+async def db():
+    """Session on freshly created tables, dropped again after the test"""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with SessionLocal() as session:
+        yield session
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    # Pooled connections belong to this test's event loop
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def client(db):
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture
+async def location(db):
+    seoul = SearchLocation(
+        id=1,
+        label="Seoul",
+        city="Seoul",
+        country="KR",
+        latitude=37.5665,
+        longitude=126.978,
+    )
+    db.add(seoul)
+    await db.commit()
+    return seoul
@@ -0,0 +1,134 @@
+# backend/tests/test_cache.py
+import pytest
+from fastapi import FastAPI, Response
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel
+
+from app.core import cache
+from app.core.cache import cached
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio calls made by core.cache"""
+
+    def __init__(self):
+        self.store = {}  # key -> (value, remaining TTL)
+
+    async def get(self, key):
+        item = self.store.get(key)
+        return item[0] if item else None
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = (value, ex)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.keys = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    def get(self, key):
+        self.keys.append(key)
+        return self
+
+    def ttl(self, key):
+        return self
+
+    async def execute(self):
+        (key,) = self.keys
+        value, ttl = self.redis.store.get(key, (None, -2))
+        return [value, ttl]
+
+
+class Item(BaseModel):
+    name: str
+
+
+def item_app(calls, **options):
+    """App with one cached endpoint that records each time it really runs"""
+    app = FastAPI()
+
+    @app.get("/item", response_model=Item)
+    @cached("item", expire=60, response_model=Item, **options)
+    async def get_item(response: Response, name: str):
+        calls.append(name)
+        return {"name": name, "internal": "not in the response model"}
+
+    return app
+
+
+async def test_cached_endpoint_runs_once(monkeypatch):
+    """Test that a repeated request is answered from Redis"""
+    redis = FakeRedis()
+    monkeypatch.setattr(cache, "get_redis", lambda: redis)
+    calls = []
+
+    async with AsyncClient(
+        transport=ASGITransport(app=item_app(calls)), base_url="http://test"
+    ) as client:
+        first = await client.get("/item", params={"name": "seoul"})
+        second = await client.get("/item", params={"name": "seoul"})
+        other = await client.get("/item", params={"name": "busan"})
+
+    assert calls == ["seoul", "busan"]
+    # Hits return what the response model let through, not the raw result
+    assert first.json() == second.json() == {"name": "seoul"}
+    assert other.json() == {"name": "busan"}
+
+
+async def test_cached_endpoint_without_redis(monkeypatch):
+    """Test that the endpoint simply runs every time when Redis is off"""
+    monkeypatch.setattr(cache, "get_redis", lambda: None)
+    calls = []
+
+    async with AsyncClient(
+        transport=ASGITransport(app=item_app(calls)), base_url="http://test"
+    ) as client:
+        await client.get("/item", params={"name": "seoul"})
+        response = await client.get("/item", params={"name": "seoul"})
+
+    assert calls == ["seoul", "seoul"]
+    assert response.json() == {"name": "seoul"}
+
+
+async def test_cache_control_header(monkeypatch):
+    """Test that max-age is the full TTL when computed, the rest on a hit"""
+    redis = FakeRedis()
+    monkeypatch.setattr(cache, "get_redis", lambda: redis)
+    app = item_app([], cache_control=True)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        miss = await client.get("/item", params={"name": "seoul"})
+        # 18 of the 60 seconds have passed
+        ((key, (value, _)),) = redis.store.items()
+        redis.store[key] = (value, 42)
+        hit = await client.get("/item", params={"name": "seoul"})
+
+    assert miss.headers["Cache-Control"] == "public, max-age=60"
+    assert hit.headers["Cache-Control"] == "public, max-age=42"
+
+
+async def test_cache_control_header_without_redis(monkeypatch):
+    """Test that uncached responses still carry the full max-age"""
+    monkeypatch.setattr(cache, "get_redis", lambda: None)
+    app = item_app([], cache_control=True)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/item", params={"name": "seoul"})
+
+    assert response.headers["Cache-Control"] == "public, max-age=60"
@@ -0,0 +1,90 @@
+# backend/tests/test_errors.py
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.utils.errors import (
+    AuthorizationError,
+    ConflictError,
+    CustomValidationError,
+    DatabaseError,
+    DuplicateEntryError,
+    ExternalAPIError,
+    NotFoundError,
+    SerializationError,
+    TimeoutError,
+    register_exception_handlers,
+)
+
+
+@pytest.mark.parametrize(
+    "exc_class, status_code",
+    [
+        (CustomValidationError, 400),
+        (NotFoundError, 404),
+        (DuplicateEntryError, 409),
+        (ExternalAPIError, 500),
+        (DatabaseError, 500),
+        (AuthorizationError, 401),
+        (ConflictError, 409),
+        (SerializationError, 500),
+        (TimeoutError, 408),
+    ],
+)
+def test_custom_exception_handled(exc_class, status_code):
+    """Test that each custom exception maps to its status code and detail"""
+    app = FastAPI()
+    register_exception_handlers(app)
+
+    @app.get("/boom")
+    async def boom():
+        raise exc_class("boom")
+
+    response = TestClient(app).get("/boom")
+
+    assert response.status_code == status_code
+    assert response.json() == {"error": "boom"}
+
+
+def test_custom_exception_subclass_handled():
+    """Test that subclasses of a custom exception use their base's status code"""
+
+    class LocationNotFound(NotFoundError):
+        pass
+
+    app = FastAPI()
+    register_exception_handlers(app)
+
+    @app.get("/boom")
+    async def boom():
+        raise LocationNotFound("boom")
+
+    response = TestClient(app).get("/boom")
+
+    assert response.status_code == 404
+    assert response.json() == {"error": "boom"}
+
+
+@pytest.mark.parametrize("debug", [False, True])
+def test_request_validation_details(monkeypatch, debug):
+    """Test that 400 details carry only loc and msg unless debugging"""
+    monkeypatch.setattr(settings, "debug", debug)
+    app = FastAPI()
+    register_exception_handlers(app)
+
+    @app.get("/items")
+    async def items(limit: int):
+        return {"limit": limit}
+
+    response = TestClient(app).get("/items", params={"limit": "many"})
+
+    assert response.status_code == 400
+    body = response.json()
+    assert body["error"] == "Invalid request"
+    (detail,) = body["details"]
+    assert detail["loc"] == ["query", "limit"]
+    if debug:
+        assert {"type", "input"} <= detail.keys()
+    else:
+        assert detail.keys() == {"loc", "msg"}
@@ -0,0 +1,65 @@
+# backend/tests/test_export.py
+import pytest
+
+from app.api.export import mock_data
+from app.services import export_service
+from app.services.export_service import iter_csv
+
+
+def test_iter_csv_streams_in_chunks(monkeypatch):
+    """Test that rows are read and written one chunk at a time"""
+    monkeypatch.setattr(export_service, "CSV_CHUNK_ROWS", 2)
+    consumed = []
+
+    def rows():
+        for day in range(1, 6):
+            consumed.append(day)
+            yield {"date": f"2024-03-0{day}", "temperature": day}
+
+    chunks = iter_csv(rows())
+    first = next(chunks)
+
+    assert first == "date,temperature\r\n2024-03-01,1\r\n2024-03-02,2\r\n"
+    # Only the first chunk has been pulled from the source so far
+    assert consumed == [1, 2]
+    assert list(chunks) == [
+        "2024-03-03,3\r\n2024-03-04,4\r\n",
+        "2024-03-05,5\r\n",
+    ]
+
+
+def test_iter_csv_without_rows():
+    """Test that an empty export fails before any output is produced"""
+    with pytest.raises(ValueError):
+        iter_csv(iter([]))
+
+
+@pytest.mark.asyncio
+async def test_export_csv_endpoint(client):
+    """Test that the CSV export is streamed as an attachment"""
+    response = await client.get("/api/export/csv")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "attachment" in response.headers["content-disposition"]
+    assert response.text.splitlines()[0] == "date,location,temperature,condition"
+    assert len(response.text.splitlines()) == 1 + len(mock_data)
+
+
+def test_iter_csv_uses_first_row_column_order():
+    """Test that every row is written in the first row's column order"""
+    rows = [
+        {"date": "2024-03-01", "temperature": 1},
+        {"temperature": 2, "date": "2024-03-02", "ignored": "x"},
+    ]
+
+    assert "".join(iter_csv(rows)) == (
+        "date,temperature\r\n2024-03-01,1\r\n2024-03-02,2\r\n"
+    )
+
+
+def test_iter_csv_single_column():
+    """Test that one-column exports write plain values, not tuples"""
+    assert "".join(iter_csv([{"city": "Seoul"}, {"city": "Busan"}])) == (
+        "city\r\nSeoul\r\nBusan\r\n"
+    )
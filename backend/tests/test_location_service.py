@@ -0,0 +1,33 @@
+# backend/tests/test_location_service.py
+import httpx
+import pytest
+
+from app.services import location_service
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.mark.parametrize(
+    "query, endpoint",
+    [
+        ("30332", "/geo/1.0/zip"),
+        ("30332-0250", "/geo/1.0/zip"),
+        ("1234", "/geo/1.0/direct"),
+        ("12345-", "/geo/1.0/direct"),
+        ("Atlanta", "/geo/1.0/direct"),
+    ],
+)
+async def test_zip_queries_use_zip_endpoint(monkeypatch, query, endpoint):
+    """Test that only US zip codes are sent to the zip geocoding endpoint"""
+    paths = []
+
+    def handler(request):
+        paths.append(request.url.path)
+        return httpx.Response(200, json=[])
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(location_service, "get_http_client", lambda: client)
+
+    await location_service._fetch_locations(query)
+
+    assert paths == [endpoint]
@@ -0,0 +1,43 @@
+# backend/tests/test_search_history.py
+import pytest
+from sqlalchemy import select
+
+from app.models.search_history import SearchHistory
+from app.services import search_history_service
+from app.services.search_history_service import (
+    record_search,
+    start_search_history_writer,
+    stop_search_history_writer,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+async def stored_queries(db):
+    return (
+        await db.scalars(select(SearchHistory.query).order_by(SearchHistory.id))
+    ).all()
+
+
+async def test_record_search_without_writer(db):
+    """Test that searches are inserted right away when no writer is running"""
+    await record_search(db, user_id=1, query="seoul")
+
+    assert await stored_queries(db) == ["seoul"]
+
+
+async def test_writer_flushes_queued_searches(db, monkeypatch):
+    """Test that queued searches are written in order once the writer stops"""
+    monkeypatch.setattr(search_history_service, "FLUSH_BATCH_SIZE", 2)
+    queries = ["seoul", "busan", "jeju", "incheon", "daegu"]
+
+    start_search_history_writer()
+    try:
+        for query in queries:
+            await record_search(db, user_id=1, query=query)
+        # Nothing is written on the request path
+        assert await stored_queries(db) == []
+    finally:
+        await stop_search_history_writer()
+
+    assert await stored_queries(db) == queries
@@ -0,0 +1,57 @@
+# backend/tests/test_search_location.py
+import pytest
+
+from app.models.models import SearchLocation
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_nearby_locations(client, db, location):
+    """Test that nearby locations are limited to the radius, nearest first"""
+    db.add_all(
+        [
+            SearchLocation(
+                city="Incheon", country="KR", latitude=37.4563, longitude=126.7052
+            ),
+            SearchLocation(
+                city="Busan", country="KR", latitude=35.1796, longitude=129.0756
+            ),
+        ]
+    )
+    await db.commit()
+    params = {"lat": 37.55, "lon": 126.95}
+
+    response = await client.get(
+        "/api/location/locations/nearby", params={**params, "radius_km": 30}
+    )
+    assert response.status_code == 200
+    assert [loc["city"] for loc in response.json()] == ["Seoul", "Incheon"]
+
+    response = await client.get(
+        "/api/location/locations/nearby", params={**params, "radius_km": 500}
+    )
+    assert [loc["city"] for loc in response.json()] == ["Seoul", "Incheon", "Busan"]
+
+    response = await client.get(
+        "/api/location/locations/nearby",
+        params={**params, "radius_km": 500, "limit": 1},
+    )
+    assert [loc["city"] for loc in response.json()] == ["Seoul"]
+
+
+async def test_nearby_locations_across_antimeridian(client, db):
+    """Test that the search radius wraps around ±180° longitude"""
+    db.add_all(
+        [
+            SearchLocation(city="West", country="FJ", latitude=-17.0, longitude=179.9),
+            SearchLocation(city="East", country="FJ", latitude=-17.0, longitude=-179.9),
+        ]
+    )
+    await db.commit()
+
+    for lon, expected in ((179.95, ["West", "East"]), (-179.95, ["East", "West"])):
+        response = await client.get(
+            "/api/location/locations/nearby",
+            params={"lat": -17.0, "lon": lon, "radius_km": 30},
+        )
+        assert [loc["city"] for loc in response.json()] == expected
@@ -1,5 +1,7 @@
 # backend/tests/test_weather.py
-import re
+import pytest
+
+from app.utils.validators import US_ZIP_RE
 
 
 def test_basic_functionality():
@@ -19,18 +21,19 @@ def test_weather_module_exists():
         assert False, "Weather service module not found"
 
 
-def test_zip_code_validation():
+@pytest.mark.parametrize(
+    "zip_code, valid",
+    [
+        ("10001", True),
+        ("90210", True),
+        ("12345-6789", True),
+        ("1234", False),  # too short
+        ("123456", False),  # too long
+        ("abcde", False),  # not digits
+        ("12345-678", False),  # wrong extended format
+    ],
+)
+def test_zip_code_validation(zip_code, valid):
     """Test zip code validation using regex"""
-    # US zip code pattern (5 digits or 5+4 format)
-    us_zip_pattern = r"^\d{5}(-\d{4})?$"
-
-    # Valid zip codes
-    assert re.match(us_zip_pattern, "10001")
-    assert re.match(us_zip_pattern, "90210")
-    assert re.match(us_zip_pattern, "12345-6789")
-
-    # Invalid zip codes
-    assert not re.match(us_zip_pattern, "1234")  # too short
-    assert not re.match(us_zip_pattern, "123456")  # too long
-    assert not re.match(us_zip_pattern, "abcde")  # not digits
-    assert not re.match(us_zip_pattern, "12345-678")  # wrong extended format
+    # US zip code pattern (5 digits or 5+4 format), shared with the API
+    assert bool(US_ZIP_RE.match(zip_code)) is valid
@@ -0,0 +1,159 @@
+# backend/tests/test_weather_history.py
+from datetime import datetime
+
+import orjson
+import pytest
+from sqlalchemy import select
+
+from app.crud.weather import bulk_create_weather_records, purge_weather_records_before
+from app.models.models import SearchLocation, WeatherHistory
+from app.schemas.weather import WeatherHistoryCreate
+
+pytestmark = pytest.mark.asyncio
+
+RECORDS_URL = "/api/weather-history/records"
+
+
+def make_record(day, location_id=1, **fields):
+    record = {
+        "location_id": location_id,
+        "weather_date": f"2024-03-{day:02d}T00:00:00",
+        "temp_c": 10.0 + day,
+        "condition": "Clear",
+        "humidity": 50,
+        "wind_speed": 2.0,
+        "icon": "01d",
+    }
+    record.update(fields)
+    return record
+
+
+async def test_bulk_insert_and_overwrite_counts(client, location):
+    """Test that bulk writes report rows written and overwrite only sent fields"""
+    records = [make_record(day) for day in (1, 2, 3)]
+
+    response = await client.post(RECORDS_URL, json=records)
+    assert response.json() == {"inserted": 3}
+
+    # Existing dates are skipped without overwrite
+    response = await client.post(RECORDS_URL, json=records)
+    assert response.json() == {"inserted": 0}
+
+    # The same date twice in one batch is folded into a single update
+    partial = [
+        {
+            "location_id": 1,
+            "weather_date": "2024-03-01T00:00:00",
+            "temp_c": 30.0,
+            "condition": "Rain",
+        },
+        {
+            "location_id": 1,
+            "weather_date": "2024-03-01T00:00:00",
+            "temp_c": 31.0,
+            "condition": "Rain",
+        },
+    ]
+    response = await client.post(RECORDS_URL, params={"overwrite": True}, json=partial)
+    assert response.json() == {"upserted": 1}
+
+    response = await client.get("/api/weather-history/location/1")
+    first = next(
+        r for r in response.json() if r["weather_date"].startswith("2024-03-01")
+    )
+    assert first["temp_c"] == 31.0
+    assert first["condition"] == "Rain"
+    # Fields left out of the overwrite keep their stored values
+    assert first["humidity"] == 50
+    assert first["wind_speed"] == 2.0
+
+
+async def test_location_weather_keyset_pages(client, location):
+    """Test that X-Next-Cursor walks every record once, newest first"""
+    await client.post(RECORDS_URL, json=[make_record(day) for day in range(1, 6)])
+
+    pages, cursor = [], None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/api/weather-history/location/1", params=params)
+        pages.append([r["weather_date"][8:10] for r in response.json()])
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert pages == [["05", "04"], ["03", "02"], ["01"]]
+
+
+async def test_latest_weather(client, db, location):
+    """Test the per-location and all-locations latest weather endpoints"""
+    db.add(
+        SearchLocation(
+            id=2, city="Busan", country="KR", latitude=35.1796, longitude=129.0756
+        )
+    )
+    db.add(
+        SearchLocation(
+            id=3, city="Jeju", country="KR", latitude=33.4996, longitude=126.5312
+        )
+    )
+    await db.commit()
+    await client.post(
+        RECORDS_URL,
+        json=[
+            make_record(1),
+            make_record(2, condition="Rain", icon="10d"),
+            make_record(1, location_id=2, condition="Clouds", icon="04d"),
+        ],
+    )
+
+    response = await client.get("/api/weather-history/location/1/latest")
+    assert response.status_code == 200
+    latest = response.json()
+    assert latest["weather_date"].startswith("2024-03-02")
+    assert (latest["condition"], latest["icon"]) == ("Rain", "10d")
+
+    response = await client.get("/api/weather-history/location/3/latest")
+    assert response.status_code == 404
+
+    response = await client.get("/api/weather-history/latest")
+    by_location = {r["location_id"]: r["condition"] for r in response.json()}
+    assert by_location == {1: "Rain", 2: "Clouds"}
+
+
+async def test_stream_location_weather(client, location):
+    """Test that the stream endpoint sends one JSON record per line"""
+    await client.post(RECORDS_URL, json=[make_record(day) for day in (1, 2, 3)])
+
+    response = await client.get("/api/weather-history/location/1/stream")
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [orjson.loads(line) for line in response.text.splitlines()]
+    assert [r["weather_date"][8:10] for r in lines] == ["03", "02", "01"]
+    assert all(r["location_id"] == 1 for r in lines)
+
+
+async def test_purge_weather_records_before(db, location):
+    """Test that only records dated before the cutoff are purged"""
+    await bulk_create_weather_records(
+        db, [WeatherHistoryCreate(**make_record(day)) for day in range(1, 6)]
+    )
+
+    removed = await purge_weather_records_before(db, datetime(2024, 3, 3))
+
+    assert removed == 2
+    remaining = (await db.scalars(select(WeatherHistory.weather_date))).all()
+    assert sorted(d.day for d in remaining) == [3, 4, 5]
+
+
+async def test_out_of_range_readings_round_trip(client, location):
+    """Test that stored readings are returned as-is, without range checks"""
+    await client.post(
+        RECORDS_URL, json=[make_record(1, temp_c=150.0, icon="unknown01")]
+    )
+
+    response = await client.get("/api/weather-history/location/1/latest")
+
+    assert response.status_code == 200
+    assert (response.json()["temp_c"], response.json()["icon"]) == (150.0, "unknown01")
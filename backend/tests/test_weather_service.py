@@ -0,0 +1,182 @@
+# backend/tests/test_weather_service.py
+import asyncio
+from collections import Counter
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from app.services import weather_service
+from app.services.weather_service import fetch_current_weather
+
+pytestmark = pytest.mark.asyncio
+
+CURRENT_BODY = {
+    "main": {"temp": 20.0, "humidity": 50, "pressure": 1012},
+    "wind": {"speed": 3.0},
+    "weather": [
+        {"id": 800, "main": "Clear", "description": "clear sky", "icon": "01d"}
+    ],
+    "dt": 1700000000,
+}
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    """Empty weather caches and counters for each test"""
+    for name in ("_current_cache", "_forecast_cache", "_hourly_cache"):
+        cache = getattr(weather_service, name)
+        monkeypatch.setattr(
+            weather_service, name, weather_service._TTLCache(cache.maxsize, cache.ttl)
+        )
+    monkeypatch.setattr(weather_service, "cache_stats", Counter())
+    monkeypatch.setattr(weather_service, "api_stats", Counter())
+    # The throttle's lock must be created on this test's event loop
+    weather_service.get_throttler.cache_clear()
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Stands in for OpenWeather; records the params of every call"""
+    calls = []
+
+    async def fake_fetch(url, params):
+        calls.append(params)
+        # Stay in flight long enough for concurrent callers to pile up
+        await asyncio.sleep(0.01)
+        return CURRENT_BODY
+
+    monkeypatch.setattr(weather_service, "_fetch_url", fake_fetch)
+    return calls
+
+
+def mock_openweather(monkeypatch, handler):
+    """Routes the shared HTTP client through `handler` instead of the network"""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(weather_service, "get_http_client", lambda: client)
+
+
+async def test_weather_stats_endpoint(client, upstream):
+    """Test that cache hits, misses and upstream calls are reported"""
+    await fetch_current_weather(city="Seoul")
+    await fetch_current_weather(city="Seoul")
+
+    response = await client.get("/api/weather/stats")
+
+    stats = response.json()
+    assert stats["cache"] == {
+        "hit.local": 1,
+        "hit.redis": 0,
+        "miss": 1,
+        "hit_ratio": 0.5,
+    }
+    assert stats["api"]["calls"] == 1
+    assert len(upstream) == 1
+
+
+async def test_oversized_chunked_response_rejected(monkeypatch):
+    """Test that the size limit applies to bodies sent without Content-Length"""
+    monkeypatch.setattr(weather_service, "MAX_RESPONSE_BYTES", 1024)
+    received = []
+
+    async def body():
+        for _ in range(100):
+            received.append(1)
+            yield b" " * 512
+
+    mock_openweather(monkeypatch, lambda request: httpx.Response(200, content=body()))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await weather_service.fetch_url("https://example.test", {})
+
+    assert exc_info.value.status_code == 502
+    # Reading stops once the limit is passed instead of draining the body
+    assert len(received) < 100
+
+
+async def test_chunked_response_within_limit(monkeypatch):
+    """Test that a chunked body under the limit is parsed normally"""
+
+    async def body():
+        yield b'{"main": '
+        yield b'{"temp": 1.5}}'
+
+    mock_openweather(monkeypatch, lambda request: httpx.Response(200, content=body()))
+
+    assert await weather_service.fetch_url("https://example.test", {}) == {
+        "main": {"temp": 1.5}
+    }
+
+
+async def test_concurrent_misses_share_one_request(upstream):
+    """Test that concurrent cache misses for one city send a single request"""
+    results = await asyncio.gather(
+        *(fetch_current_weather(city="Seoul") for _ in range(5))
+    )
+
+    assert len(upstream) == 1
+    assert {r.temp_c for r in results} == {20.0}
+    assert weather_service._inflight == {}
+
+
+async def test_throttler_spreads_calls_over_period():
+    """Test that calls over the rate limit wait for the window to slide"""
+    throttler = weather_service._Throttler(rate_limit=2, period=0.2)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    for _ in range(3):
+        async with throttler:
+            pass
+
+    assert loop.time() - start >= 0.2
+
+
+async def test_rate_limited_calls_are_retried(monkeypatch):
+    """Test that 429 answers are retried with backoff until one succeeds"""
+    monkeypatch.setattr(weather_service, "RATE_LIMIT_BACKOFF", 0)
+    statuses = iter([429, 429, 200])
+    mock_openweather(
+        monkeypatch, lambda request: httpx.Response(next(statuses), json={"ok": True})
+    )
+
+    assert await weather_service.fetch_url("https://example.test", {}) == {"ok": True}
+
+
+async def test_rate_limit_retries_exhausted(monkeypatch):
+    """Test that a 429 is surfaced once every attempt was rate limited"""
+    monkeypatch.setattr(weather_service, "RATE_LIMIT_BACKOFF", 0)
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(429)
+
+    mock_openweather(monkeypatch, handler)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await weather_service.fetch_url("https://example.test", {})
+
+    assert exc_info.value.status_code == 429
+    assert len(requests) == weather_service.RATE_LIMIT_ATTEMPTS
+
+
+async def test_ttl_cache_expires_entries():
+    """Test that entries are dropped once their TTL has passed"""
+    cache = weather_service._TTLCache(maxsize=10, ttl=-1)
+    cache["seoul"] = "clear"
+
+    assert cache.get("seoul") is None
+    assert len(cache._data) == 0
+
+
+async def test_ttl_cache_evicts_least_recently_used():
+    """Test that the least recently read entry is evicted past maxsize"""
+    cache = weather_service._TTLCache(maxsize=2, ttl=60)
+    cache["seoul"] = "clear"
+    cache["busan"] = "rain"
+    cache.get("seoul")
+    cache["jeju"] = "clouds"
+
+    assert cache.get("busan") is None
+    assert (cache.get("seoul"), cache.get("jeju")) == ("clear", "clouds")